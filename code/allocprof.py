@@ -0,0 +1,254 @@
+"""Perfil de alocações do loop de jogo por fase, com tracemalloc e contagem de blocos.
+
+Uso (a partir da raiz do repositório):
+    python code/allocprof.py                          # todos os cenários do benchmark
+    python code/allocprof.py zombies_100 --frames 300 --top 15
+    python code/allocprof.py --check                  # falha se algum cenário passar do seu orçamento
+    python code/allocprof.py zombies_10 --budget 32   # orçamento explícito, em KiB alocados por frame
+
+O tracemalloc deixa o jogo bem mais lento: os tempos do bench.py não valem com ele ligado.
+"""
+import os
+
+# Precisa ser definido antes de importar o pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+import pygame
+
+from bench import SCENARIOS, PHASES, DEFAULT_FRAMES, run_scenario
+from game import SCREEN_WIDTH, SCREEN_HEIGHT
+
+SAMPLE_EVERY = 10  # Um frame a cada tantos tem snapshots por fase (os pontos de alocação)
+TRACE_DEPTH = 1
+DEFAULT_TOP = 10
+# Orçamento de KiB alocados por frame em regime (média), com folga sobre o medido
+BUDGETS_KIB = {
+    "zombies_10": 48,
+    "zombies_100": 80,
+    "zombies_1000": 448,
+    "bullet_spam": 448,
+    "explosions": 128,
+    "long_level": 48,
+    "survival": 48,
+}
+# O que o próprio perfil aloca não entra nos snapshots
+IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+class AllocationTracker:
+    """Substitui o FrameTimer do jogo: cada lap atribui à fase o que foi alocado desde a marca anterior.
+
+    Por fase soma os bytes alocados (pico acima do início da fase, então conta
+    também o que foi liberado dentro dela: Rects, listas e dicts temporários),
+    os bytes retidos e a variação de blocos do alocador. Nos frames de amostra
+    compara snapshots antes e depois de cada fase para achar as linhas que
+    alocam; objetos criados e liberados dentro da fase não aparecem ali.
+    """
+
+    def __init__(self, sample_every=SAMPLE_EVERY, depth=TRACE_DEPTH):
+        self.sample_every = sample_every
+        self.depth = depth
+        self.gc_started = 0.0
+        self.summary = None
+        self.reset()
+
+    def reset(self):
+        self.frame = 0
+        self.current = 0
+        self.sampling = False
+        self.snapshot = None
+        self.allocated = {}
+        self.retained = {}
+        self.blocks = {}
+        self.frame_allocated = []
+        self.sites = {}
+        self.sampled = 0
+        self.gc_pauses = {0: [], 1: [], 2: []}
+
+    def start(self):
+        tracemalloc.start(self.depth)
+        gc.callbacks.append(self._on_gc)
+        self._mark()
+
+    def stop(self):
+        gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self.gc_started = perf_counter()
+        else:
+            self.gc_pauses[info["generation"]].append(perf_counter() - self.gc_started)
+
+    def _mark(self):
+        # Snapshot antes de zerar o pico: o que ele aloca não conta para a próxima fase
+        if self.sampling:
+            self.snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED)
+        tracemalloc.reset_peak()
+        self.start_bytes = tracemalloc.get_traced_memory()[0]
+        self.start_blocks = sys.getallocatedblocks()
+
+    def begin(self):
+        """Começa um frame; a cada `sample_every` frames ele também registra os pontos de alocação."""
+        if self.frame:
+            self.frame_allocated.append(self.current)
+        self.frame += 1
+        self.current = 0
+        self.sampling = bool(self.sample_every) and self.frame % self.sample_every == 0
+        if self.sampling:
+            self.sampled += 1
+        self._mark()
+
+    def lap(self, phase):
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        allocated = peak - self.start_bytes
+        self.current += allocated
+        self.allocated[phase] = self.allocated.get(phase, 0) + allocated
+        self.retained[phase] = self.retained.get(phase, 0) + current - self.start_bytes
+        self.blocks[phase] = self.blocks.get(phase, 0) + blocks - self.start_blocks
+        if self.sampling:
+            after = tracemalloc.take_snapshot().filter_traces(IGNORED)
+            for stat in after.compare_to(self.snapshot, "lineno"):
+                if stat.size_diff > 0:
+                    key = (phase, stat.traceback[0].filename, stat.traceback[0].lineno)
+                    size, count = self.sites.get(key, (0, 0))
+                    self.sites[key] = (size + stat.size_diff, count + max(stat.count_diff, 0))
+            del after
+        self._mark()
+
+    def collect(self):
+        """Fecha o frame em andamento, guarda o resumo em `summary` e zera os contadores.
+
+        Como o FrameTimer, retorna {fase: total}; aqui, bytes alocados.
+        """
+        if self.frame:
+            self.frame_allocated.append(self.current)
+        frames = len(self.frame_allocated)
+        per_frame = np.array(self.frame_allocated or [0]) / 1024.0
+        sampled = max(self.sampled, 1)
+        self.summary = {
+            "frames": frames,
+            "allocated_kib": {
+                "mean": float(per_frame.mean()),
+                "p95": float(np.percentile(per_frame, 95)),
+                "max": float(per_frame.max()),
+            },
+            "phases": {
+                phase: {
+                    "allocated_kib": self.allocated[phase] / 1024.0 / max(frames, 1),
+                    "retained_kib": self.retained[phase] / 1024.0 / max(frames, 1),
+                    "blocks": self.blocks[phase] / max(frames, 1),
+                }
+                for phase in self.allocated
+            },
+            "gc": {
+                generation: {
+                    "collections": len(pauses),
+                    "mean_ms": float(np.mean(pauses) * 1000.0) if pauses else 0.0,
+                    "max_ms": float(np.max(pauses) * 1000.0) if pauses else 0.0,
+                }
+                for generation, pauses in self.gc_pauses.items()
+            },
+            # KiB e objetos por frame amostrado, do maior para o menor
+            "sites": sorted(
+                (
+                    (phase, f"{filename}:{lineno}", size / 1024.0 / sampled, count / sampled)
+                    for (phase, filename, lineno), (size, count) in self.sites.items()
+                ),
+                key=lambda site: -site[2],
+            ),
+        }
+        allocated = self.allocated
+        self.reset()
+        return allocated
+
+
+def run(name, screen, frames=DEFAULT_FRAMES, dirty=False, sample_every=SAMPLE_EVERY):
+    """Executa um cenário do benchmark com o tracker no lugar do timer e retorna o resumo."""
+    tracker = AllocationTracker(sample_every)
+    tracker.start()
+    try:
+        # O run_scenario coleta ao fim do aquecimento e dos frames medidos
+        run_scenario(name, screen, frames, dirty, timer=tracker)
+        return tracker.summary
+    finally:
+        tracker.stop()
+
+
+def _short(path):
+    return os.path.relpath(path) if path.startswith(os.getcwd()) else os.path.basename(path)
+
+
+def print_report(name, result, top):
+    allocated = result["allocated_kib"]
+    print(f"== {name}: {allocated['mean']:.1f} KiB alocados por frame "
+          f"(p95 {allocated['p95']:.1f}, máx {allocated['max']:.1f})")
+    print(f"   {'fase':<18}{'KiB/frame':>11}{'retidos':>10}{'blocos':>9}")
+    phases = result["phases"]
+    for phase in sorted(phases, key=lambda p: PHASES.index(p) if p in PHASES else len(PHASES)):
+        stats = phases[phase]
+        print(f"   {phase:<18}{stats['allocated_kib']:>11.2f}{stats['retained_kib']:>10.2f}"
+              f"{stats['blocks']:>9.1f}")
+    print("   GC: " + ", ".join(
+        f"gen{generation} {stats['collections']}x (média {stats['mean_ms']:.2f}ms, máx {stats['max_ms']:.2f}ms)"
+        for generation, stats in result["gc"].items()
+    ))
+    print(f"   {'fase':<18}{'KiB':>8}{'objetos':>9}   ponto de alocação")
+    for phase, where, kib, count in result["sites"][:top]:
+        filename, _, lineno = where.rpartition(":")
+        print(f"   {phase:<18}{kib:>8.2f}{count:>9.1f}   {_short(filename)}:{lineno}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perfil de alocações por fase do Zumbi Survival")
+    parser.add_argument("scenarios", nargs="*", metavar="cenário",
+                        help=f"cenários a executar (padrão: todos) — {', '.join(SCENARIOS)}")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames medidos por cenário")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="pontos de alocação listados por cenário")
+    parser.add_argument("--sample-every", type=int, default=SAMPLE_EVERY,
+                        help="intervalo em frames entre os snapshots por fase; 0 desliga os pontos de "
+                             "alocação (os snapshots também alocam e inflam a contagem de coletas do GC)")
+    parser.add_argument("--check", action="store_true",
+                        help="falha se algum cenário passar do seu orçamento de KiB alocados por frame")
+    parser.add_argument("--budget", type=float,
+                        help="orçamento único em KiB alocados por frame para todos os cenários (implica --check)")
+    parser.add_argument("--dirty", action="store_true", help="usa o DirtyRenderer em vez do desenho completo")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenário desconhecido: {', '.join(unknown)}")
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        results[name] = run(name, screen, args.frames, args.dirty, args.sample_every)
+        print_report(name, results[name], args.top)
+    pygame.quit()
+
+    if args.check or args.budget is not None:
+        over = []
+        for name, result in results.items():
+            budget = args.budget if args.budget is not None else BUDGETS_KIB[name]
+            if result["allocated_kib"]["mean"] > budget:
+                over.append((name, result["allocated_kib"]["mean"], budget))
+        for name, kib, budget in over:
+            print(f"REGRESSÃO: {name} aloca {kib:.1f} KiB por frame (orçamento {budget:g} KiB)")
+        return 1 if over else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import pygame
+
+
+class AnimationClip:
+    """Frames de uma animação nas duas direções, montados uma única vez.
+
+    Os frames podem vir recortados (sem a margem transparente): `offsets` guarda
+    onde cada um fica dentro do frame original, de tamanho `size`.
+    """
+
+    def __init__(self, frames, frame_duration, loop=True, offsets=None, size=None):
+        self.frames = tuple(frames)
+        self.flipped = tuple(pygame.transform.flip(frame, True, False) for frame in self.frames)
+        self.frame_count = len(self.frames)
+        self.frame_duration = frame_duration
+        self.loop = loop
+        if size is not None:
+            self.width, self.height = size
+        elif self.frames:
+            self.width = self.frames[0].get_width()
+            self.height = self.frames[0].get_height()
+        else:
+            self.width = self.height = 0
+        self.offsets = tuple(offsets) if offsets is not None else ((0, 0),) * self.frame_count
+        # Espelhar o frame espelha também a margem: a sobra da direita vira a da esquerda
+        self.flipped_offsets = tuple(
+            (self.width - dx - frame.get_width(), dy)
+            for frame, (dx, dy) in zip(self.frames, self.offsets)
+        )
+
+    def frame(self, index, flip=False):
+        # Índices fora do intervalo ficam presos no último frame
+        if index >= self.frame_count:
+            index = self.frame_count - 1
+        return self.flipped[index] if flip else self.frames[index]
+
+    def offset(self, index, flip=False):
+        """Posição do frame `index` dentro do frame original (mesma regra de índice de frame())."""
+        if index >= self.frame_count:
+            index = self.frame_count - 1
+        return self.flipped_offsets[index] if flip else self.offsets[index]
@@ -0,0 +1,255 @@
+import pygame
+import json
+import mmap
+import os
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from animation import AnimationClip
+
+LOADER_WORKERS = 4
+ARCHIVE_PATH = "assets/sprites.pak"  # Gerado por build_assets.py
+ARCHIVE_MAGIC = b"ZSPK"
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = struct.Struct("<4sII")  # magic, versão, tamanho do índice JSON
+ARCHIVE_ALIGN = 16
+
+
+def resource_path(path):
+    """Caminho de um arquivo do jogo; no executável do PyInstaller, dentro da pasta extraída."""
+    return os.path.join(getattr(sys, "_MEIPASS", ""), path)
+
+
+def decode_image(path, size=None):
+    """Decodifica (e escala) um arquivo de imagem; não toca no display, pode rodar em outra thread."""
+    image = pygame.image.load(resource_path(path))
+    if size is not None:
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+def archive_pixels_offset(index_size):
+    """Início dos pixels no arquivo de sprites: logo após cabeçalho e índice, alinhado."""
+    end = ARCHIVE_HEADER.size + index_size
+    return -(-end // ARCHIVE_ALIGN) * ARCHIVE_ALIGN
+
+
+def trim(frame):
+    """Recorta a margem transparente do frame; retorna (recorte, (dx, dy)) dentro do original."""
+    bounds = frame.get_bounding_rect()
+    if not bounds.width or not bounds.height:
+        bounds = pygame.Rect(0, 0, 1, 1)  # Frame vazio: um pixel transparente
+    return frame.subsurface(bounds), bounds.topleft
+
+
+class SpriteArchive:
+    """Frames recortados e já decodificados (RGBA cru), lidos de um arquivo mapeado em memória.
+
+    Formato: cabeçalho, índice JSON e os pixels de cada frame alinhados em
+    ARCHIVE_ALIGN bytes. O índice lista as sheets (tamanho original) e, para cada
+    fatiamento (path, frame_count, frame_width), o tamanho do frame original e
+    [offset a partir do início dos pixels, dx, dy, largura, altura] de cada frame.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            # Cópia privada sob demanda: as Surfaces apontam para páginas do arquivo sem lê-lo inteiro
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_size = ARCHIVE_HEADER.unpack_from(self.data)
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+            raise ValueError(f"{path} não é um arquivo de sprites compatível")
+        start = ARCHIVE_HEADER.size
+        index = json.loads(self.data[start:start + index_size])
+        self.pixels = archive_pixels_offset(index_size)
+        self.sheets = {path: tuple(size) for path, size in index["sheets"].items()}
+        self.entries = {
+            (entry["path"], entry["frame_count"], entry["frame_width"]): entry
+            for entry in index["entries"]
+        }
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def frames(self, key):
+        """(frames, offsets, tamanho do frame original) de um fatiamento do arquivo."""
+        entry = self.entries[key]
+        view = memoryview(self.data)
+        frames, offsets = [], []
+        for offset, dx, dy, width, height in entry["frames"]:
+            offset += self.pixels
+            size = width * height * 4
+            frames.append(pygame.image.frombuffer(view[offset:offset + size], (width, height), "RGBA"))
+            offsets.append((dx, dy))
+        return frames, offsets, tuple(entry["size"])
+
+
+class AssetRegistry:
+    """Cache central de imagens e frames, compartilhado por todo o processo."""
+
+    def __init__(self, archive_path=ARCHIVE_PATH):
+        # archive_path=None ignora o arquivo de sprites (ex.: ao gerá-lo)
+        self.images = {}
+        self.frames = {}
+        self.trimmed = {}
+        self.clips = {}
+        self.archive_path = archive_path
+        self._archive = None
+
+    @property
+    def archive(self):
+        """SpriteArchive aberto na primeira consulta, ou None se o arquivo não foi gerado."""
+        if self._archive is None:
+            path = self.archive_path and resource_path(self.archive_path)
+            self._archive = SpriteArchive(path) if path and os.path.exists(path) else False
+        return self._archive or None
+
+    def _convert(self, surface, alpha=True):
+        # convert()/convert_alpha() exigem um display ativo
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def load_image(self, path, size=None, alpha=True):
+        """Carrega (e opcionalmente escala) uma imagem uma única vez."""
+        key = (path, size, alpha)
+        if key not in self.images:
+            if not os.path.exists(resource_path(path)):
+                print(f"ERRO: Arquivo não encontrado - {os.path.abspath(path)}")
+                image = pygame.Surface(size or (50, 50), pygame.SRCALPHA)
+            else:
+                image = decode_image(path, size)
+            self.images[key] = self._convert(image, alpha)
+        return self.images[key]
+
+    def preload(self, keys, workers=LOADER_WORKERS):
+        """Começa a decodificar as imagens (path, size, alpha) em segundo plano; retorna o LoadJob.
+
+        Sheets que estão no arquivo de sprites não precisam ser decodificadas e ficam de fora.
+        """
+        archive = self.archive
+        if archive is not None:
+            keys = [key for key in keys if key[0] not in archive.sheets]
+        return LoadJob(self, keys, workers)
+
+    def sheet_size(self, path):
+        """Tamanho original de uma sprite sheet, sem decodificá-la se ela estiver no arquivo."""
+        archive = self.archive
+        if archive is not None and path in archive.sheets:
+            return archive.sheets[path]
+        return self.load_image(path).get_size()
+
+    def load_frames(self, path, frame_count, frame_width=None):
+        """Fatia uma sprite sheet em frames e devolve uma tupla compartilhada."""
+        key = (path, frame_count, frame_width)
+        if key not in self.frames:
+            sheet = self.load_image(path)
+            width = frame_width or sheet.get_width() // frame_count
+            height = sheet.get_height()
+            frames = []
+            for i in range(frame_count):
+                # Frames além da largura da sheet repetem o último disponível
+                x_pos = min(i * width, sheet.get_width() - width)
+                frames.append(sheet.subsurface((x_pos, 0, width, height)))
+            self.frames[key] = tuple(frames)
+        return self.frames[key]
+
+    def load_trimmed(self, path, frame_count, frame_width=None):
+        """Frames sem a margem transparente: (frames, offsets, tamanho do frame original).
+
+        Vêm do arquivo de sprites quando ele existe; senão a sheet é fatiada e recortada aqui.
+        """
+        key = (path, frame_count, frame_width)
+        if key not in self.trimmed:
+            archive = self.archive
+            if archive is not None and key in archive:
+                frames, offsets, size = archive.frames(key)
+                frames = [self._convert(frame) for frame in frames]
+            else:
+                full = self.load_frames(path, frame_count, frame_width)
+                size = full[0].get_size()
+                frames, offsets = zip(*(trim(frame) for frame in full))
+            self.trimmed[key] = (tuple(frames), tuple(offsets), size)
+        return self.trimmed[key]
+
+    def load_clip(self, path, frame_count, frame_duration, frame_width=None, loop=True):
+        """Retorna o clip (frames normais e espelhados) compartilhado para a sheet."""
+        key = (path, frame_count, frame_width, frame_duration, loop)
+        if key not in self.clips:
+            frames, offsets, size = self.load_trimmed(path, frame_count, frame_width)
+            self.clips[key] = AnimationClip(frames, frame_duration, loop, offsets, size)
+        return self.clips[key]
+
+    def memory_report(self):
+        """Retorna [(chave, bytes)] de cada imagem decodificada, do maior para o menor."""
+        report = [
+            (key, image.get_width() * image.get_height() * image.get_bytesize())
+            for key, image in self.images.items()
+        ]
+        # Frames do arquivo de sprites são superfícies próprias; os recortados aqui apontam para a sheet
+        for key, (frames, _, _) in self.trimmed.items():
+            own = [f for f in frames if f.get_parent() is None]
+            if own:
+                report.append((("trimmed",) + key, sum(f.get_width() * f.get_height() * f.get_bytesize() for f in own)))
+        # Frames espelhados são sempre superfícies próprias
+        for key, clip in self.clips.items():
+            size = sum(f.get_width() * f.get_height() * f.get_bytesize() for f in clip.flipped)
+            report.append((("flipped",) + key, size))
+        report.sort(key=lambda item: item[1], reverse=True)
+        return report
+
+    def total_bytes(self):
+        return sum(size for _, size in self.memory_report())
+
+    def clear(self):
+        self.images.clear()
+        self.frames.clear()
+        self.trimmed.clear()
+        self.clips.clear()
+
+
+class LoadJob:
+    """Imagens sendo decodificadas num pool de threads.
+
+    A conversão para o formato do display (convert/convert_alpha) e a entrada no
+    registry acontecem em poll(), que deve ser chamado pela thread principal.
+    """
+
+    def __init__(self, registry, keys, workers=LOADER_WORKERS):
+        self.registry = registry
+        keys = list(dict.fromkeys(keys))
+        self.total = len(keys)
+        pending = [key for key in keys if key not in registry.images]
+        self.loaded = self.total - len(pending)
+        self.executor = ThreadPoolExecutor(workers, "assets") if pending else None
+        self.futures = {
+            key: self.executor.submit(decode_image, key[0], key[1]) for key in pending
+        }
+
+    @property
+    def finished(self):
+        return not self.futures
+
+    def poll(self):
+        """Registra o que já foi decodificado e retorna a fração concluída (0 a 1)."""
+        for key, future in list(self.futures.items()):
+            if not future.done():
+                continue
+            del self.futures[key]
+            self.loaded += 1
+            if key in self.registry.images or future.exception() is not None:
+                # Arquivos com erro ficam para load_image, que avisa e usa um substituto
+                continue
+            self.registry.images[key] = self.registry._convert(future.result(), key[2])
+        if not self.futures and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        return self.loaded / self.total if self.total else 1.0
+
+    def wait(self):
+        """Bloqueia até o fim do carregamento (útil fora do loop de jogo)."""
+        while not self.finished:
+            next(iter(self.futures.values())).exception()
+            self.poll()
+
+
+registry = AssetRegistry()
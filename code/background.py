@@ -1,14 +1,127 @@
+import numpy as np
 import pygame
+from assets import registry
+
+COLORKEY = (255, 0, 255)
+
 
 class Background:
     def __init__(self, image_path, screen_size):
-        self.image = pygame.image.load(image_path).convert()
-        self.image = pygame.transform.scale(self.image, screen_size)
+        self.image = registry.load_image(image_path, tuple(screen_size), alpha=False)
         self.width = self.image.get_width()
-    
+        self.size = self.image.get_size()
+        self.darkened_layers = {}
+
     def draw(self, screen, camera_x=0):
         # Repete o fundo para simular movimento infinito
         offset_x = -(camera_x % self.width)
         screen.blit(self.image, (offset_x, 0))
         if offset_x < 0:
-            screen.blit(self.image, (offset_x + self.width, 0))
\ No newline at end of file
+            screen.blit(self.image, (offset_x + self.width, 0))
+
+    def darkened(self, alpha=150):
+        """Fundo parado já escurecido, composto uma única vez por nível de escurecimento."""
+        layer = self.darkened_layers.get(alpha)
+        if layer is None:
+            layer = pygame.Surface(self.size).convert()
+            self.draw(layer, 0)
+            overlay = pygame.Surface(self.size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            layer.blit(overlay, (0, 0))
+            self.darkened_layers[alpha] = layer
+        return layer
+
+
+def _runs(rows):
+    """Intervalos [início, fim) de valores True consecutivos."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], rows.astype(np.int8), [0]))))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+
+class ParallaxLayer:
+    """Camadas com o mesmo fator de rolagem, compostas e fatiadas em faixas horizontais.
+
+    Só entram as linhas visíveis que nenhuma camada da frente cobre por inteiro
+    (as camadas se repetem na horizontal, então isso vale para qualquer rolagem).
+    Linhas totalmente opacas viram faixas opacas; o resto usa colorkey quando a
+    transparência é só 0 ou 255 e alpha por pixel nos outros casos.
+    """
+
+    def __init__(self, composed, factor, hidden_rows):
+        self.factor = factor
+        self.width = composed.get_width()
+        alpha = pygame.surfarray.array_alpha(composed)
+        opaque = alpha.min(axis=0) == 255
+        visible = (alpha.max(axis=0) > 0) & ~hidden_rows
+        self.opaque_rows = opaque
+        self.strips = []  # [(imagem, y)]
+        for solid in (True, False):
+            for top, bottom in _runs(visible & (opaque == solid)):
+                strip = composed.subsurface((0, top, self.width, bottom - top))
+                self.strips.append((self._convert(strip, alpha[:, top:bottom], solid), top))
+        self.strips.sort(key=lambda item: item[1])
+
+    @staticmethod
+    def _convert(strip, alpha, solid):
+        if solid:
+            return strip.convert()
+        if np.isin(alpha, (0, 255)).all():
+            image = pygame.Surface(strip.get_size()).convert()
+            image.fill(COLORKEY)
+            image.blit(strip, (0, 0))
+            image.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            return image
+        return strip.convert_alpha()
+
+    def draw(self, screen, camera_x):
+        width = self.width
+        offset_x = -(int(camera_x * self.factor) % width)
+        for image, y in self.strips:
+            screen.blit(image, (offset_x, y))
+            if offset_x < 0:
+                screen.blit(image, (offset_x + width, y))
+
+
+class ParallaxBackground(Background):
+    """Fundo em várias camadas, cada uma rolando a uma fração da câmera.
+
+    `layers` é uma lista [(caminho, fator)] do fundo para a frente; camadas
+    consecutivas com o mesmo fator são fundidas numa só.
+    """
+
+    cache = {}  # (camadas, tamanho) -> [ParallaxLayer], reaproveitado entre partidas
+
+    def __init__(self, layers, screen_size):
+        self.size = tuple(screen_size)
+        self.width = self.size[0]
+        self.darkened_layers = {}
+        key = (tuple(layers), self.size)
+        if key not in self.cache:
+            groups = []
+            for path, factor in layers:
+                image = registry.load_image(path, self.size)
+                if groups and groups[-1][1] == factor:
+                    groups[-1][0].append(image)
+                else:
+                    groups.append(([image], factor))
+            # Monta da frente para o fundo, acumulando as linhas já cobertas
+            built = []
+            hidden = np.zeros(self.size[1], dtype=bool)
+            for images, factor in reversed(groups):
+                composed = pygame.Surface(self.size, pygame.SRCALPHA)
+                for image in images:
+                    composed.blit(image, (0, 0))
+                layer = ParallaxLayer(composed, factor, hidden)
+                hidden = hidden | layer.opaque_rows
+                built.append(layer)
+            self.cache[key] = built[::-1]
+        self.layers = self.cache[key]
+
+    @staticmethod
+    def asset_keys(layers, screen_size):
+        """Chaves de registry.load_image usadas pelas camadas (para pré-carregar)."""
+        return [(path, tuple(screen_size), True) for path, _ in layers]
+
+    def draw(self, screen, camera_x=0):
+        for layer in self.layers:
+            layer.draw(screen, camera_x)
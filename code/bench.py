@@ -0,0 +1,279 @@
+"""Benchmark headless do loop de jogo.
+
+Uso (a partir da raiz do repositório):
+    python code/bench.py                       # todos os cenários
+    python code/bench.py zombies_1000 --frames 300 --output results.json
+    python code/bench.py --compare results.json   # falha se algum cenário ficar mais lento
+"""
+import os
+
+# Precisa ser definido antes de importar o pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform as host
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+import numpy as np
+import pygame
+
+from game import Game, InputState, SCREEN_WIDTH, SCREEN_HEIGHT
+from render import DirtyRenderer
+from level import Level, save_level
+from timing import FrameTimer
+from waves import WaveDirector, RESERVE
+
+WARMUP_FRAMES = 30
+DEFAULT_FRAMES = 600
+PHASES = (
+    "input", "player", "zombie_ai", "zombie_animation", "zombie_physics",
+    "projectiles", "effects", "draw_background", "draw_entities", "draw_hud", "flip",
+)
+# Agrupamento por subsistema no relatório
+SUBSYSTEMS = {
+    "ai": ("zombie_ai", "zombie_animation"),
+    "physics": ("player", "zombie_physics"),
+    "projectiles": ("projectiles",),
+    "effects": ("effects",),
+    "rendering": ("draw_background", "draw_entities", "draw_hud", "flip"),
+}
+
+
+def walk_and_shoot(tick, game):
+    """Entrada roteirizada: anda para a direita atirando e pulando de vez em quando."""
+    return InputState(
+        shoot=tick % 30 < 2,
+        run=tick % 240 < 120,
+        left=False,
+        right=(tick // 90) % 4 != 3,
+        jump=tick % 75 == 0,
+    )
+
+
+def make_immortal(game):
+    # O benchmark mede custo, não jogabilidade: o jogador não pode morrer no meio
+    game.player.take_damage = lambda amount: False
+
+
+def spawn_zombies(game, count, seed=1):
+    """Distribui `count` zumbis sobre as plataformas do nível, de forma determinística."""
+    rng = random.Random(seed)
+    floors = [rect for rect in game.platforms if rect.width >= 200]
+    for _ in range(count):
+        rect = rng.choice(floors)
+        game.enemies.spawn(rng.uniform(rect.left, rect.right - 60), rect.top - 20)
+
+
+def load_whole_level(game):
+    """Carrega todos os chunks de uma vez: os spawns do nível acontecem já e nenhum zumbi é guardado depois."""
+    game.stream.margin = game.level.chunk_count
+    game.update_stream()
+
+
+def scenario_zombies(count):
+    def setup(game):
+        make_immortal(game)
+        # Com o nível inteiro carregado a horda fica com exatamente `count` zumbis vivos
+        load_whole_level(game)
+        spawn_zombies(game, count - len(game.enemies))
+    return setup, walk_and_shoot
+
+
+def setup_bullet_spam(game):
+    make_immortal(game)
+    spawn_zombies(game, 100)
+
+
+def bullet_spam_input(tick, game):
+    # Dezenas de projéteis por tick, ignorando o cooldown da arma
+    player = game.player
+    for i in range(16):
+        direction = 1 if i % 2 else -1
+        player.projectiles.spawn(player.x + 64, player.y + 40 + i * 4, direction)
+    return walk_and_shoot(tick, game)
+
+
+def explosions_input(tick, game):
+    # Uma explosão a cada 10 ticks perto do jogador, sobre 100 zumbis
+    if tick % 10 == 0:
+        x = game.player.x + 64 + (tick % 60 - 30) * 8
+        game.effects.explosion(x, game.player.y + 128, game.floor_below(x, game.player.y))
+    return walk_and_shoot(tick, game)
+
+
+def setup_long_level(game, length=100_000):
+    """Gera (uma vez) um nível em chunks de `length` pixels com 500 zumbis e o carrega."""
+    path = os.path.join(tempfile.gettempdir(), f"zumbi_bench_level_{length}")
+    if not os.path.exists(os.path.join(path, "level.json")):
+        platforms = []
+        x = 0
+        rng = random.Random(2)
+        while x < length:
+            width = rng.randrange(300, 700)
+            platforms.append((x, rng.choice((350, 400, 450, 500)), width, 300))
+            x += width + rng.randrange(40, 90)
+        spawns = []
+        for _ in range(500):
+            left, top, width, _height = rng.choice(platforms)
+            spawns.append((rng.uniform(left, left + width - 60), top - 20))
+        save_level(path, platforms, spawns, length, (100, 200), (length - 50, 0, 0))
+    make_immortal(game)
+    game.load_level(Level(path))
+
+
+def setup_survival(game, first_wave=12):
+    """Sobrevivência já numa onda tardia: levas frequentes entrando e saindo da horda."""
+    make_immortal(game)
+    game.director = WaveDirector(game.tick_rate, first_wave)
+    game.enemies.reserve(RESERVE)
+
+
+SCENARIOS = {
+    "zombies_10": scenario_zombies(10),
+    "zombies_100": scenario_zombies(100),
+    "zombies_1000": scenario_zombies(1000),
+    "bullet_spam": (setup_bullet_spam, bullet_spam_input),
+    "explosions": (setup_bullet_spam, explosions_input),
+    "long_level": (setup_long_level, walk_and_shoot),
+    "survival": (setup_survival, walk_and_shoot),
+}
+
+
+def run_scenario(name, screen, frames=DEFAULT_FRAMES, dirty=False, timer=None):
+    """Executa um cenário (1 tick + 1 desenho por frame) e retorna as métricas.
+
+    `timer` substitui o FrameTimer (o allocprof.py passa o seu rastreador de alocações).
+    """
+    setup, script = SCENARIOS[name]
+    game = Game()
+    setup(game)
+    renderer = DirtyRenderer() if dirty else None
+    timer = timer or FrameTimer()
+    frame_times = []
+    phase_totals = {}
+
+    for frame in range(WARMUP_FRAMES + frames):
+        if frame == WARMUP_FRAMES:
+            game.timer = timer
+            timer.collect()
+        start = perf_counter()
+        timer.begin()
+        pygame.event.pump()
+        game.step(script(game.tick, game))
+        if renderer is None:
+            game.draw(screen)
+            pygame.display.flip()
+        else:
+            updates = renderer.draw(game, screen)
+            if updates is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(updates)
+        timer.lap("flip")
+        if frame >= WARMUP_FRAMES:
+            frame_times.append(perf_counter() - start)
+        if game.outcome:
+            game.outcome = None
+
+    for phase, seconds in timer.collect().items():
+        phase_totals[phase] = seconds
+    times_ms = np.array(frame_times) * 1000.0
+    phases_ms = {phase: phase_totals.get(phase, 0.0) * 1000.0 / frames for phase in PHASES}
+    return {
+        "frames": frames,
+        "zombies": len(game.enemies),
+        "projectiles": len(game.player.projectiles),
+        "fps": frames / (times_ms.sum() / 1000.0),
+        "frame_ms": {
+            "mean": float(times_ms.mean()),
+            "p50": float(np.percentile(times_ms, 50)),
+            "p95": float(np.percentile(times_ms, 95)),
+            "p99": float(np.percentile(times_ms, 99)),
+            "max": float(times_ms.max()),
+        },
+        "phases_ms": phases_ms,
+        "subsystems_ms": {
+            group: sum(phases_ms[phase] for phase in phases)
+            for group, phases in SUBSYSTEMS.items()
+        },
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Lista os cenários cujo p95 piorou mais que `tolerance` em relação à base."""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if not old:
+            continue
+        before, after = old["frame_ms"]["p95"], result["frame_ms"]["p95"]
+        if after > before * (1.0 + tolerance):
+            regressions.append((name, before, after))
+    return regressions
+
+
+def print_report(results):
+    print(f"{'cenário':<14}{'fps':>9}{'p50':>8}{'p95':>8}{'p99':>8}   "
+          + "  ".join(f"{group:>11}" for group in SUBSYSTEMS))
+    for name, result in results["scenarios"].items():
+        frame_ms = result["frame_ms"]
+        print(f"{name:<14}{result['fps']:>9.1f}{frame_ms['p50']:>8.2f}{frame_ms['p95']:>8.2f}"
+              f"{frame_ms['p99']:>8.2f}   "
+              + "  ".join(f"{result['subsystems_ms'][group]:>9.2f}ms" for group in SUBSYSTEMS))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless do Zumbi Survival")
+    parser.add_argument("scenarios", nargs="*", metavar="cenário",
+                        help=f"cenários a executar (padrão: todos) — {', '.join(SCENARIOS)}")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames medidos por cenário")
+    parser.add_argument("--output", help="grava os resultados em JSON neste arquivo")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para detectar regressões")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="piora relativa de p95 tolerada no --compare (padrão: 0.15)")
+    parser.add_argument("--dirty", action="store_true", help="usa o DirtyRenderer em vez do desenho completo")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenário desconhecido: {', '.join(unknown)}")
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    results = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": host.machine(),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+            "renderer": "dirty" if args.dirty else "full",
+        },
+        "scenarios": {},
+    }
+    for name in args.scenarios or SCENARIOS:
+        results["scenarios"][name] = run_scenario(name, screen, args.frames, args.dirty)
+    pygame.quit()
+
+    print_report(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, before, after in regressions:
+            print(f"REGRESSÃO: {name} p95 {before:.2f}ms -> {after:.2f}ms")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Compila as sprite sheets num arquivo único, recortado e já decodificado.
+
+Cada frame das sheets do personagem, dos zumbis e da explosão é recortado na
+área opaca e gravado em RGBA cru; o jogo mapeia o arquivo em memória e cria as
+Surfaces direto dele, sem decodificar PNG. Rode antes de empacotar com o
+PyInstaller (o main.spec inclui o arquivo gerado).
+
+Uso (a partir da raiz do repositório):
+    python code/build_assets.py                 # gera assets/sprites.pak
+    python code/build_assets.py --output outro.pak
+"""
+import os
+
+# Precisa ser definido antes de importar o pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import sys
+
+import pygame
+
+from assets import (
+    ARCHIVE_ALIGN, ARCHIVE_HEADER, ARCHIVE_MAGIC, ARCHIVE_PATH, ARCHIVE_VERSION,
+    AssetRegistry, archive_pixels_offset, trim,
+)
+from character import DEAD_SPRITE, DEAD_FRAMES
+from effects import EXPLOSION_SHEET, EXPLOSION_FRAMES
+from enemy import ZOMBIE_SHEETS
+from game import PLAYER_SPRITES, PLAYER_FRAMES
+
+
+def sprite_sheets(loader):
+    """Fatiamentos (path, frame_count, frame_width) usados pelo jogo, como o registry os pede."""
+    # O personagem usa em todas as sheets a largura de frame da primeira animação
+    first_action, first_path = next(iter(PLAYER_SPRITES.items()))
+    player_width = loader.load_image(first_path).get_width() // PLAYER_FRAMES[first_action]
+    sheets = [(path, PLAYER_FRAMES[action], player_width) for action, path in PLAYER_SPRITES.items()]
+    sheets.append((DEAD_SPRITE, DEAD_FRAMES, player_width))
+    sheets += [(path, frame_count, None) for path, frame_count in ZOMBIE_SHEETS.values()]
+    sheets.append((EXPLOSION_SHEET, EXPLOSION_FRAMES, None))
+    return sheets
+
+
+def _align(size):
+    return -(-size // ARCHIVE_ALIGN) * ARCHIVE_ALIGN
+
+
+def build(output=ARCHIVE_PATH):
+    """Gera o arquivo de sprites e retorna (bytes dos pixels originais, bytes gravados)."""
+    loader = AssetRegistry(archive_path=None)  # Sempre a partir dos PNGs
+    sheets = sprite_sheets(loader)
+    pixels = []
+    entries = []
+    offset = 0
+    original = 0
+    for path, frame_count, frame_width in sheets:
+        full = loader.load_frames(path, frame_count, frame_width)
+        frames = []
+        for frame in full:
+            original += frame.get_width() * frame.get_height() * 4
+            image, (dx, dy) = trim(frame)
+            data = pygame.image.tobytes(image, "RGBA")
+            frames.append([offset, dx, dy, image.get_width(), image.get_height()])
+            pixels.append(data.ljust(_align(len(data)), b"\0"))
+            offset += _align(len(data))
+        entries.append({
+            "path": path, "frame_count": frame_count, "frame_width": frame_width,
+            "size": list(full[0].get_size()), "frames": frames,
+        })
+    index = {
+        "sheets": {path: list(loader.load_image(path).get_size()) for path, _, _ in sheets},
+        "entries": entries,
+    }
+    encoded = json.dumps(index).encode()
+    header = ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, len(encoded)) + encoded
+    with open(output, "wb") as f:
+        f.write(header.ljust(archive_pixels_offset(len(encoded)), b"\0"))
+        for data in pixels:
+            f.write(data)
+    return original, offset
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compila as sprite sheets do Zumbi Survival")
+    parser.add_argument("--output", default=ARCHIVE_PATH, help=f"arquivo gerado (padrão: {ARCHIVE_PATH})")
+    args = parser.parse_args(argv)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    original, packed = build(args.output)
+    pygame.quit()
+    print(f"{args.output}: {packed / 1024:.0f} KiB de pixels "
+          f"({original / 1024:.0f} KiB nos frames completos, {packed / original:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
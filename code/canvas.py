@@ -0,0 +1,95 @@
+"""Tela lógica de tamanho fixo apresentada em uma janela de qualquer tamanho.
+
+O jogo desenha sempre na tela lógica (coordenadas de SCREEN_WIDTH x
+SCREEN_HEIGHT); present() a copia para a janela mantendo a proporção, com
+faixas pretas nas sobras. Com a janela do mesmo tamanho da tela lógica (o
+padrão) não há cópia: o jogo desenha direto na janela e as atualizações
+parciais do DirtyRenderer continuam valendo.
+
+Com o filtro suave a escala tem custo proporcional à área gerada: a resolução
+interna da apresentação pode cair para uma fração da janela (`scale`),
+suavizada nesse tamanho menor e ampliada por vizinho mais próximo; abaixo da
+resolução lógica a tela é ampliada direto, como no filtro "nearest". Isso só
+barateia a escala para a janela: o jogo continua desenhando a tela lógica
+inteira, e no tamanho nativo `scale` não tem efeito.
+"""
+import pygame
+
+FILTERS = {
+    "nearest": pygame.transform.scale,
+    "smooth": pygame.transform.smoothscale,
+}
+BORDER_COLOR = (0, 0, 0)
+
+
+class LogicalCanvas:
+    """Superfície em que o jogo desenha (`surface`, pedida a cada frame) e sua apresentação na janela."""
+
+    def __init__(self, size, window_size=None, fullscreen=False, filter="nearest"):
+        self.size = size
+        if fullscreen:
+            # (0, 0) usa a resolução do monitor
+            pygame.display.set_mode(window_size or (0, 0), pygame.FULLSCREEN)
+        else:
+            pygame.display.set_mode(window_size or size, pygame.RESIZABLE)
+        self.offscreen = None  # Tela lógica fora da janela, criada quando a janela muda de tamanho
+        self.filter = FILTERS[filter]
+        self.smooth = filter == "smooth"
+        self.scale = 1.0
+        self.window_size = None
+        self.viewport = None
+        self.scaled = None  # Resolução interna reduzida, reaproveitada entre frames
+
+    @property
+    def surface(self):
+        """A janela no tamanho lógico; em outro tamanho, a tela lógica fora dela.
+
+        Muda quando a janela é redimensionada (que também pede um redesenho completo).
+        """
+        window = pygame.display.get_surface()
+        if window.get_size() == self.size:
+            return window
+        if self.offscreen is None:
+            self.offscreen = pygame.Surface(self.size).convert()
+        return self.offscreen
+
+    def _layout(self, window):
+        """Recalcula a área da janela ocupada pela tela lógica quando a janela muda de tamanho."""
+        size = window.get_size()
+        if size == self.window_size:
+            return
+        self.window_size = size
+        zoom = min(size[0] / self.size[0], size[1] / self.size[1])
+        viewport = pygame.Rect(0, 0, max(1, round(self.size[0] * zoom)), max(1, round(self.size[1] * zoom)))
+        viewport.center = (size[0] // 2, size[1] // 2)
+        self.viewport = viewport
+        window.fill(BORDER_COLOR)
+
+    def present(self, updates=None):
+        """Mostra a tela lógica; `updates` são as áreas alteradas (só aproveitadas sem escala)."""
+        window = pygame.display.get_surface()
+        if window.get_size() == self.size:
+            # O frame já foi desenhado na própria janela
+            self.window_size = None
+            if updates is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(updates)
+            return
+
+        self._layout(window)
+        viewport = self.viewport
+        target = window.subsurface(viewport)
+        size = (max(1, round(viewport.width * self.scale)), max(1, round(viewport.height * self.scale)))
+        source = self.surface
+        if not self.smooth or size == viewport.size:
+            self.filter(source, viewport.size, target)
+        elif size[0] <= self.size[0] and viewport.width >= self.size[0]:
+            # Resolução interna abaixo da lógica: ampliar direto é mais barato e mais nítido
+            pygame.transform.scale(source, viewport.size, target)
+        else:
+            if self.scaled is None or self.scaled.get_size() != size:
+                self.scaled = pygame.Surface(size, 0, source)
+            self.filter(source, size, self.scaled)
+            pygame.transform.scale(self.scaled, viewport.size, target)
+        pygame.display.flip()
@@ -1,10 +1,19 @@
 import pygame
-import os
+from assets import registry
+from projectiles import ProjectilePool
+
+EMPTY_FRAME = pygame.Surface((50, 50), pygame.SRCALPHA)
+# Velocidades e gravidade são expressas "por frame" de referência a 60 Hz
+FRAME_TIME = 1 / 60
+DEAD_SPRITE = "assets/character/Dead.png"
+DEAD_FRAMES = 4
 
 class Character:
     def __init__(self, x, y, sprites_path=None, animation_frames=None, speed=3, is_enemy=False):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.vel_x = speed
         self.vel_y = 0
         self.gravity = 0.5
@@ -17,7 +26,7 @@ class Character:
         self.health = 100
         self.max_health = 100
         self.attack_damage = 10 if not is_enemy else 15
-        self.projectiles = []
+        self.projectiles = ProjectilePool() if not is_enemy else None
         self.is_attacking = False
         self.attack_cooldown = 0
         self.is_animating = False
@@ -47,22 +56,26 @@ class Character:
             self.is_animating = True
         return self.health <= 0
 
+    def gun_position(self):
+        """Ponto de saída dos projéteis (cano da arma) em coordenadas do mundo."""
+        if self.facing_right:
+            gun_offset_x = 80
+            gun_offset_y = 90
+        else:
+            gun_offset_x = 48
+            gun_offset_y = 90
+        return self.x + gun_offset_x, self.y + gun_offset_y
+
     def shoot(self):
         if self.attack_cooldown <= 0:
-            if self.facing_right:
-                gun_offset_x = 80
-                gun_offset_y = 90
-            else:
-                gun_offset_x = 48
-                gun_offset_y = 90
-
-            self.projectiles.append({
-                'x': self.x + gun_offset_x,
-                'y': self.y + gun_offset_y,
-                'direction': 1 if self.facing_right else -1,
-                'speed': 10,
-                'lifetime': 30
-            })
+            gun_x, gun_y = self.gun_position()
+            self.projectiles.spawn(
+                gun_x,
+                gun_y,
+                1 if self.facing_right else -1,
+                speed=10,
+                lifetime=30
+            )
             self.current_action = "shoot"
             self.frame_index = 0
             self.is_shooting = True
@@ -74,56 +87,47 @@ class Character:
         self.attack_cooldown = max(0, self.attack_cooldown - dt)
 
     def load_sprites(self, sprites_path, animation_frames):
-        self.animations = {}
-        for action, filename in sprites_path.items():
-            if os.path.exists(filename):
-                self.animations[action] = pygame.image.load(filename)
-            else:
-                self.animations[action] = pygame.Surface((50, 50))
-        self.animations["dead"] = pygame.image.load("assets/character/Dead.png")
         self.animation_frames = animation_frames
-        self.animation_frames["dead"] = 4
-        self.update_frame_size()
-
-    def update_frame_size(self):
-        """Atualiza tamanho dos frames e mantém hitbox fixa."""
-        if self.animations:
-            first_anim = next(iter(self.animations.values()))
-            first_action = next(iter(self.animation_frames.keys()))
-            self.FRAME_WIDTH = first_anim.get_width() // self.animation_frames[first_action]
-            self.FRAME_HEIGHT = first_anim.get_height()
-        
+        self.animation_frames["dead"] = DEAD_FRAMES
+        # Todas as sheets do personagem usam a largura de frame da primeira animação
+        first_action, first_path = next(iter(sprites_path.items()))
+        sheet_width, sheet_height = registry.sheet_size(first_path)
+        self.FRAME_WIDTH = sheet_width // animation_frames[first_action]
+        self.FRAME_HEIGHT = sheet_height
+
+        paths = dict(sprites_path, dead=DEAD_SPRITE)
+        frame_duration = self.frame_delay / 60
+        self.animations = {
+            action: registry.load_clip(
+                filename, self.animation_frames[action], frame_duration,
+                frame_width=self.FRAME_WIDTH, loop=action not in ("shoot", "dead")
+            )
+            for action, filename in paths.items()
+        }
+
     def get_frame(self, flip=False):
         """Retorna o frame atual da animação, invertido se necessário."""
-        if self.current_action not in self.animations:
-            return pygame.Surface((50, 50))
-
-        sheet = self.animations[self.current_action]
-        max_frames = self.animation_frames[self.current_action]
-        actual_frame = min(self.frame_index, max_frames - 1)
-        
-        sheet_width = sheet.get_width()
-        x_pos = actual_frame * self.FRAME_WIDTH
-        
-        if x_pos + self.FRAME_WIDTH > sheet_width:
-            print(f"Error: Frame {actual_frame} exceeds {self.current_action} sprite sheet width ({sheet_width})")
-            actual_frame = max_frames - 1
-            x_pos = actual_frame * self.FRAME_WIDTH
-        
-        frame = sheet.subsurface((x_pos, 0, self.FRAME_WIDTH, self.FRAME_HEIGHT))
-        return pygame.transform.flip(frame, flip, False)
-
-    def update_animation(self):
-        self.frame_counter += 1
+        clip = self.animations.get(self.current_action)
+        if clip is None:
+            return EMPTY_FRAME
+        return clip.frame(self.frame_index, flip)
+
+    def get_sprite(self, flip=False):
+        """Frame atual recortado e sua posição (dx, dy) dentro do frame completo."""
+        clip = self.animations.get(self.current_action)
+        if clip is None:
+            return EMPTY_FRAME, (0, 0)
+        return clip.frame(self.frame_index, flip), clip.offset(self.frame_index, flip)
+
+    def update_animation(self, dt=FRAME_TIME, move_x=0):
+        self.frame_counter += dt / FRAME_TIME
         if self.frame_counter >= self.frame_delay:
-            self.frame_counter = 0
+            self.frame_counter -= self.frame_delay
             self.frame_index += 1
             max_frames = self.animation_frames[self.current_action]
             
             if self.current_action == "shoot":
                 if self.frame_index >= max_frames:
-                    keys = pygame.key.get_pressed()
-                    move_x = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
                     self.current_action = "run" if (move_x != 0 and self.is_running) else "walk" if move_x != 0 else "idle"
                     self.frame_index = 0
                     self.is_shooting = False
@@ -135,10 +139,18 @@ class Character:
             else:
                 self.frame_index %= max_frames
 
-    def update_position(self, platforms, move_x):
-        self.vel_y += self.gravity
-        self.y += self.vel_y
-        self.x += move_x * self.vel_x * (1.2 if self.is_running else 1)
+    def store_previous(self):
+        """Guarda a posição do tick anterior para a interpolação do desenho."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def update_position(self, platforms, move_x, dt=FRAME_TIME):
+        step = dt / FRAME_TIME
+        # Forma fechada do passo de 60 Hz (vel_y += g; y += vel_y) para um step qualquer:
+        # dois passos de meio frame andam o mesmo que um inteiro, e o pulo não muda com a taxa
+        self.y += (self.vel_y + 0.5 * self.gravity * (step + 1)) * step
+        self.vel_y += self.gravity * step
+        self.x += move_x * self.vel_x * (1.2 if self.is_running else 1) * step
 
         player_rect = pygame.Rect(
             self.x + self.hitbox_offset_x,
@@ -147,33 +159,43 @@ class Character:
             self.hitbox_height
         )
 
-        for platform in platforms:
-            platform_rect = pygame.Rect(*platform)
-            if player_rect.colliderect(platform_rect):
-                # Colisão por baixo (teto)
-                if self.vel_y < 0 and player_rect.top < platform_rect.bottom:
-                    self.y = platform_rect.bottom - self.hitbox_offset_y
-                    self.vel_y = 0
-                # Colisão por cima (chão)
-                elif self.vel_y > 0 and player_rect.bottom > platform_rect.top:
+        for platform_rect in platforms.colliding(player_rect):
+            # Colisão por baixo (teto)
+            if self.vel_y < 0 and player_rect.top < platform_rect.bottom:
+                self.y = platform_rect.bottom - self.hitbox_offset_y
+                self.vel_y = 0
+            # Colisão por cima (chão)
+            elif self.vel_y > 0 and player_rect.bottom > platform_rect.top:
+                self.y = platform_rect.top - self.hitbox_height - self.hitbox_offset_y
+                self.vel_y = 0
+                self.is_jumping = False
+            elif move_x != 0:
+                # Verifica se a plataforma é alta demais para pular
+                if platform_rect.top < self.y + self.hitbox_offset_y - self.jump_strength * 10:
+                    if move_x > 0 and player_rect.right > platform_rect.left and player_rect.left < platform_rect.left:
+                        self.x = platform_rect.left - self.hitbox_width - self.hitbox_offset_x
+                    elif move_x < 0 and player_rect.left < platform_rect.right and player_rect.right > platform_rect.right:
+                        self.x = platform_rect.right - self.hitbox_offset_x
+                else:
                     self.y = platform_rect.top - self.hitbox_height - self.hitbox_offset_y
                     self.vel_y = 0
                     self.is_jumping = False
-                elif move_x != 0:
-                    # Verifica se a plataforma é alta demais para pular
-                    if platform_rect.top < self.y + self.hitbox_offset_y - self.jump_strength * 10:
-                        if move_x > 0 and player_rect.right > platform_rect.left and player_rect.left < platform_rect.left:
-                            self.x = platform_rect.left - self.hitbox_width - self.hitbox_offset_x
-                        elif move_x < 0 and player_rect.left < platform_rect.right and player_rect.right > platform_rect.right:
-                            self.x = platform_rect.right - self.hitbox_offset_x
-                    else:
-                        self.y = platform_rect.top - self.hitbox_height - self.hitbox_offset_y
-                        self.vel_y = 0
-                        self.is_jumping = False
 
         self.vel_y = min(self.vel_y, 10)
 
-    def draw(self, screen, camera_x=0):
-        flip = not self.facing_right if not self.is_enemy else self.facing_right 
-        frame = self.get_frame(flip)
-        screen.blit(frame, (self.x - camera_x, self.y))
\ No newline at end of file
+    def sprites(self, camera_x=0, alpha=1.0, view=(800, 600)):
+        """Lista com o (imagem, posição) do personagem, vazia se ele estiver fora da tela."""
+        flip = not self.facing_right if not self.is_enemy else self.facing_right
+        frame, (dx, dy) = self.get_sprite(flip)
+        # Trunca como o blit faria com a posição do frame completo
+        x = int(self.prev_x + (self.x - self.prev_x) * alpha - camera_x) + dx
+        y = int(self.prev_y + (self.y - self.prev_y) * alpha) + dy
+        if x <= -frame.get_width() or x >= view[0] or y <= -frame.get_height() or y >= view[1]:
+            return []
+        return [(frame, (x, y))]
+
+    def draw(self, screen, camera_x=0, alpha=1.0):
+        sprites = self.sprites(camera_x, alpha, screen.get_size())
+        if not sprites:
+            return pygame.Rect(0, 0, 0, 0)
+        return screen.blit(*sprites[0])
\ No newline at end of file
@@ -0,0 +1,210 @@
+import pygame
+import numpy as np
+from assets import registry
+
+EFFECT_CAPACITY = 4096
+EXPLOSION_SHEET = "assets/character/Explosion.png"
+EXPLOSION_FRAMES = 9
+EXPLOSION_FRAME_DURATION = 0.05
+
+FLASH, SPARK, BLOOD, GORE, DEBRIS, EXPLOSION = range(6)
+
+
+def _squares(colors, sizes):
+    """Quadrados sólidos, um por combinação de cor e tamanho (variações de uma partícula)."""
+    images = []
+    for color in colors:
+        for size in sizes:
+            image = pygame.Surface((size, size)).convert()
+            image.fill(color)
+            images.append(image)
+    return images
+
+
+def _flash():
+    image = pygame.Surface((16, 10), pygame.SRCALPHA)
+    pygame.draw.ellipse(image, (255, 220, 80, 200), image.get_rect())
+    pygame.draw.ellipse(image, (255, 255, 220), image.get_rect().inflate(-8, -4))
+    return [image.convert_alpha()]
+
+
+class EffectPool:
+    """Partículas só visuais em arrays de capacidade fixa, desenhadas com um único blits.
+
+    Nada aqui entra no estado da partida (snapshots e replays): os efeitos são
+    reconstruídos pelo que acontece na simulação. Quando o pool enche, as
+    partículas excedentes são simplesmente descartadas.
+    """
+
+    def __init__(self, capacity=EFFECT_CAPACITY, seed=0):
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vel_x = np.zeros(capacity)
+        self.vel_y = np.zeros(capacity)
+        self.floor = np.zeros(capacity)
+        self.age = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.kind = np.zeros(capacity, dtype=np.intp)
+        self.variant = np.zeros(capacity, dtype=np.intp)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Pilha de slots livres em array: emitir e remover não cria objetos Python por partícula
+        self.free = np.arange(capacity - 1, -1, -1, dtype=np.intp)
+        self.free_count = capacity
+        self.rng = np.random.default_rng(seed)
+
+        explosion, offsets, (width, height) = registry.load_trimmed(EXPLOSION_SHEET, EXPLOSION_FRAMES)
+        # A explosão é ancorada no meio da base do frame completo
+        offsets = [(dx - width // 2, dy - height) for dx, dy in offsets]
+        # Tipo -> (imagens, duração de cada frame ou 0 para variações paradas, gravidade)
+        kinds = {
+            FLASH: (_flash(), 0.0, 0.0),
+            SPARK: (_squares([(255, 230, 120), (255, 180, 60)], (2, 3)), 0.0, 0.1),
+            BLOOD: (_squares([(150, 0, 0), (110, 0, 0)], (2, 3, 4)), 0.0, 0.35),
+            GORE: (_squares([(90, 10, 10), (60, 80, 40)], (5, 7)), 0.0, 0.4),
+            DEBRIS: (_squares([(90, 90, 90), (60, 50, 40)], (3, 5, 6)), 0.0, 0.45),
+            EXPLOSION: (explosion, EXPLOSION_FRAME_DURATION, 0.0),
+        }
+        # Todas as imagens numa tabela só; cada tipo é um intervalo dela
+        self.images = []
+        offset_x, offset_y = [], []
+        self.first = np.zeros(len(kinds), dtype=np.intp)
+        self.variants = np.zeros(len(kinds), dtype=np.intp)
+        self.frame_duration = np.zeros(len(kinds))
+        self.gravity = np.zeros(len(kinds))
+        for kind, (images, frame_duration, gravity) in sorted(kinds.items()):
+            self.first[kind] = len(self.images)
+            self.variants[kind] = len(images)
+            self.frame_duration[kind] = frame_duration
+            self.gravity[kind] = gravity
+            self.images += images
+            if frame_duration:
+                offset_x += [dx for dx, _ in offsets]
+                offset_y += [dy for _, dy in offsets]
+            else:
+                offset_x += [-(image.get_width() // 2) for image in images]
+                offset_y += [-(image.get_height() // 2) for image in images]
+        self.offset_x = np.array(offset_x)
+        self.offset_y = np.array(offset_y)
+
+    def __len__(self):
+        return self.capacity - self.free_count
+
+    def emit(self, kind, x, y, count=1, speed=(0.0, 0.0), angle=0.0, spread=np.pi,
+             lifetime=(0.3, 0.6), floor=np.inf):
+        """Emite até `count` partículas em (x, y), com velocidades sorteadas num leque.
+
+        `angle` é a direção central (radianos, 0 = direita, y para baixo) e
+        `floor` a altura em que param (topo da plataforma embaixo).
+        """
+        count = min(count, self.free_count)
+        if count <= 0:
+            return
+        start = self.free_count - count
+        slots = self.free[start:self.free_count]
+        self.free_count = start
+        rng = self.rng
+        theta = angle + rng.uniform(-spread, spread, count)
+        velocity = rng.uniform(speed[0], speed[1], count)
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vel_x[slots] = np.cos(theta) * velocity
+        self.vel_y[slots] = np.sin(theta) * velocity
+        self.floor[slots] = floor
+        self.age[slots] = 0.0
+        self.lifetime[slots] = rng.uniform(lifetime[0], lifetime[1], count)
+        self.kind[slots] = kind
+        self.variant[slots] = rng.integers(0, self.variants[kind], count)
+        self.alive[slots] = True
+
+    def kill(self, indices):
+        end = self.free_count + indices.size
+        self.free[self.free_count:end] = indices
+        self.free_count = end
+        self.alive[indices] = False
+
+    def clear(self):
+        self.kill(np.flatnonzero(self.alive))
+
+    def update(self, dt):
+        """Move, aplica gravidade e encerra as partículas expiradas num único passo."""
+        idx = np.flatnonzero(self.alive)
+        if not idx.size:
+            return
+        age = self.age[idx] + dt
+        self.age[idx] = age
+        expired = age >= self.lifetime[idx]
+        self.kill(idx[expired])
+        idx = idx[~expired]
+
+        # Velocidades e gravidade em pixels por frame de 60 Hz
+        step = dt * 60
+        gravity = self.gravity[self.kind[idx]]
+        # Forma fechada do passo de 60 Hz, como em Character.update_position
+        y = self.y[idx] + (self.vel_y[idx] + 0.5 * gravity * (step + 1)) * step
+        vel_y = self.vel_y[idx] + gravity * step
+        landed = y >= self.floor[idx]
+        # No chão, a partícula fica parada até expirar (respingo)
+        y[landed] = self.floor[idx[landed]]
+        vel_y[landed] = 0.0
+        self.vel_x[idx[landed]] = 0.0
+        self.x[idx] += self.vel_x[idx] * step
+        self.y[idx] = y
+        self.vel_y[idx] = vel_y
+
+    def sprites(self, camera_x=0, alpha=1.0, dt=1 / 60, view=(800, 600)):
+        """Lista (imagem, posição) das partículas visíveis numa tela de tamanho `view`."""
+        idx = np.flatnonzero(self.alive)
+        if not idx.size:
+            return []
+        kind = self.kind[idx]
+        duration = self.frame_duration[kind]
+        animated = duration > 0
+        frame = self.variant[idx]
+        frame[animated] = np.minimum(
+            (self.age[idx[animated]] / duration[animated]).astype(np.intp),
+            self.variants[kind[animated]] - 1,
+        )
+        frame += self.first[kind]
+        # Recua cada partícula a fração do tick que ainda não foi exibida
+        back = (1.0 - alpha) * dt * 60
+        xs = self.x[idx] - self.vel_x[idx] * back - camera_x + self.offset_x[frame]
+        ys = self.y[idx] - self.vel_y[idx] * back + self.offset_y[frame]
+        visible = (xs > -128) & (xs < view[0]) & (ys > -128) & (ys < view[1])
+        images = self.images
+        return [
+            (images[i], (x, y)) for i, x, y in zip(
+                frame[visible].tolist(), xs[visible].astype(int).tolist(), ys[visible].astype(int).tolist()
+            )
+        ]
+
+    def draw(self, screen, camera_x=0, alpha=1.0, dt=1 / 60):
+        """Desenha as partículas visíveis com uma chamada a blits e retorna os retângulos alterados."""
+        return screen.blits(self.sprites(camera_x, alpha, dt, screen.get_size()))
+
+    def muzzle_flash(self, x, y, direction):
+        angle = 0.0 if direction > 0 else np.pi
+        self.emit(FLASH, x + 6 * direction, y, 1, lifetime=(0.05, 0.05))
+        self.emit(SPARK, x, y, 4, speed=(2.0, 5.0), angle=angle, spread=0.5, lifetime=(0.08, 0.15))
+
+    def blood(self, x, y, direction, floor=np.inf, count=8):
+        """Respingo de um tiro, para o lado em que o projétil seguia."""
+        angle = 0.0 if direction > 0 else np.pi
+        self.emit(BLOOD, x, y, count, speed=(1.0, 4.0), angle=angle - 0.4 * direction, spread=0.8,
+                  lifetime=(0.4, 1.2), floor=floor)
+
+    def death(self, x, y, floor=np.inf):
+        """Morte de um zumbi: sangue e pedaços em todas as direções."""
+        self.emit(BLOOD, x, y, 24, speed=(1.5, 5.0), angle=-np.pi / 2, spread=1.4,
+                  lifetime=(0.8, 2.0), floor=floor)
+        self.emit(GORE, x, y, 6, speed=(2.0, 5.0), angle=-np.pi / 2, spread=1.0,
+                  lifetime=(1.0, 2.5), floor=floor)
+
+    def explosion(self, x, y, floor=np.inf):
+        """Explosão com estilhaços e faíscas; (x, y) é o ponto no chão."""
+        duration = EXPLOSION_FRAMES * EXPLOSION_FRAME_DURATION
+        self.emit(EXPLOSION, x, y, 1, lifetime=(duration, duration))
+        self.emit(DEBRIS, x, y - 4, 40, speed=(3.0, 9.0), angle=-np.pi / 2, spread=1.3,
+                  lifetime=(0.8, 1.8), floor=floor)
+        self.emit(SPARK, x, y - 20, 30, speed=(2.0, 7.0), angle=-np.pi / 2, spread=np.pi,
+                  lifetime=(0.2, 0.5))
@@ -1,106 +1,201 @@
 import pygame
-import os
-from character import Character
+import numpy as np
+from character import Character, FRAME_TIME
+from assets import registry
+from navigation import NavGraph
 
+ZOMBIE_FRAME_DURATION = 0.2
+ZOMBIE_SPEED = 2
+ZOMBIE_HEALTH = 30
+ZOMBIE_HITBOX_OFFSET_X = 20  # Fixado para simetria
+ZOMBIE_HITBOX_WIDTH = 40  # Reduzido para evitar alcance excessivo
+ZOMBIE_HITBOX_HEIGHT = 60
 
-class Zombie(Character):
-    def __init__(self, x, y):
-        self.zombie_frames = self.load_all_frames()
+ACTIONS = ("idle", "walk", "attack", "dead")
+IDLE, WALK, ATTACK, DEAD = range(len(ACTIONS))
+ACTION_CODES = {name: code for code, name in enumerate(ACTIONS)}
+
+
+# Ação -> (sprite sheet, número de frames)
+ZOMBIE_SHEETS = {
+    "idle": ("assets/zombie/Idle.png", 8),
+    "walk": ("assets/zombie/Walk.png", 8),
+    "attack": ("assets/zombie/Attack_1.png", 5),
+    "dead": ("assets/zombie/Dead.png", 5),
+}
 
-        super().__init__(
-            x=x, y=y, sprites_path=None, animation_frames=None, speed=2, is_enemy=True
+
+def load_zombie_clips():
+    """Clips compartilhados entre todos os zumbis (decodificados uma única vez)."""
+    return {
+        action: registry.load_clip(
+            path, frame_count, ZOMBIE_FRAME_DURATION, loop=action not in ("attack", "dead")
         )
+        for action, (path, frame_count) in ZOMBIE_SHEETS.items()
+    }
 
-        self.current_action = "idle"
-        self.frame_index = 0
-        self.animation_speed = 0.2
-        self.frame_time = 0
-        self.attack_cooldown = 0
-        self.attack_range = 50  # Reduzido para consistência
-        self.is_dead = False
-        self.health = 30
-
-        if self.zombie_frames["idle"]:
-            self.FRAME_WIDTH = self.zombie_frames["idle"][0].get_width()
-            self.FRAME_HEIGHT = self.zombie_frames["idle"][0].get_height()
-
-        self.hitbox_offset_x = 20  # Fixado para simetria
-        self.hitbox_offset_y = self.FRAME_HEIGHT - 60
-        self.hitbox_width = 40  # Reduzido para evitar alcance excessivo
-        self.hitbox_height = 60
-
-        self.render_x = x
-        self.render_y = y
-        self.smoothing_factor = 0.2
-
-    def load_all_frames(self):
-        frames = {
-            "idle": self.load_frames("assets/zombie/Idle.png", 8),
-            "walk": self.load_frames("assets/zombie/Walk.png", 8),
-            "attack": self.load_frames("assets/zombie/Attack_1.png", 5),
-            "dead": self.load_frames("assets/zombie/Dead.png", 5),
-        }
-        return frames
-
-    def load_frames(self, path, frame_count):
-        try:
-            if not os.path.exists(path):
-                print(f"ERRO: Arquivo não encontrado - {os.path.abspath(path)}")
-                return []
-            sheet = pygame.image.load(path)
-            width = sheet.get_width() // frame_count
-            height = sheet.get_height()
-            return [
-                sheet.subsurface((i * width, 0, width, height))
-                for i in range(frame_count)
-            ]
-        except Exception as e:
-            print(f"Erro ao carregar {path}: {e}")
-            return [
-                pygame.Surface((50, 50), pygame.SRCALPHA) for _ in range(frame_count)
-            ]
-
-    def get_frame(self, flip=False):
-        try:
-            frames = self.zombie_frames.get(self.current_action, [])
-            if not frames:
-                return pygame.Surface((50, 50), pygame.SRCALPHA)
-            frame = frames[min(self.frame_index, len(frames) - 1)]
-            return pygame.transform.flip(frame, flip, False)
-        except Exception as e:
-            print(f"Erro no get_frame: {e}")
-            return pygame.Surface((50, 50), pygame.SRCALPHA)
 
-    def update_animation(self, dt):
-        if not self.zombie_frames.get(self.current_action):
-            return
-        self.frame_time += dt
-        frames = self.zombie_frames[self.current_action]
-        if self.frame_time >= self.animation_speed:
-            self.frame_time -= self.animation_speed
-            self.frame_index += 1
-            if self.current_action == "dead":
-                if self.frame_index >= len(frames):
-                    self.is_dead = True
-                    self.frame_index = len(frames) - 1
-            elif self.current_action == "attack" and self.frame_index >= len(frames):
-                self.current_action = "idle"
-                self.frame_index = 0
-            else:
-                self.frame_index %= len(frames)
+class ZombieHorde:
+    """Estado de todos os zumbis em arrays contíguos, atualizado em lote.
+
+    Os slots [0, count) estão ocupados. Remover é swap-and-pop (os últimos
+    slots ocupam os buracos), então a ordem dos slots não é a de criação.
+    As visões (Zombie) dos removidos voltam para `spare` e são reaproveitadas
+    pelos próximos spawns, sem construir objetos novos.
+    """
+
+    FIELDS = {
+        "x": np.float64,
+        "y": np.float64,
+        "vel_x": np.float64,
+        "vel_y": np.float64,
+        "health": np.float64,
+        "frame_time": np.float64,
+        "attack_cooldown": np.float64,
+        "prev_x": np.float64,
+        "prev_y": np.float64,
+        "action": np.int8,
+        "frame_index": np.int32,
+        "facing_right": bool,
+        "is_dead": bool,
+        "pending_ticks": np.int32,  # Ticks ainda não simulados (ver scheduler.ActivityScheduler)
+        "nav_dir": np.int8,  # Direção seguida no ar ao trocar de plataforma (0 = nenhuma)
+    }
+
+    gravity = 0.5
+    max_fall_speed = 10
+    jump_strength = -12
+    attack_damage = 15
+
+    def __init__(self, capacity=64):
+        self.animations = load_zombie_clips()
+        clips = [self.animations[name] for name in ACTIONS]
+        self.frame_counts = np.array([clip.frame_count for clip in clips])
+        self.frame_durations = np.array([clip.frame_duration for clip in clips])
+        # Todos os frames (virados para a direita e espelhados) numa tabela, com a posição
+        # de cada recorte dentro do frame completo; `frame_base` é o início de cada ação
+        self.sprite_images = []
+        offsets = []
+        self.frame_base = np.zeros((2, len(clips)), dtype=np.intp)
+        for facing_right, table in ((True, "frames"), (False, "flipped")):
+            for action, clip in enumerate(clips):
+                self.frame_base[int(facing_right), action] = len(self.sprite_images)
+                self.sprite_images += getattr(clip, table)
+                offsets += clip.offsets if facing_right else clip.flipped_offsets
+        self.sprite_offsets = np.array(offsets, dtype=np.intp).reshape(-1, 2)
+        self.frame_width = self.animations["idle"].width
+        self.frame_height = self.animations["idle"].height
+        self.hitbox_offset_y = self.frame_height - ZOMBIE_HITBOX_HEIGHT
+
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.spawned = 0  # Total de spawns; numera cada um (Zombie.serial)
+        self.views = []
+        self.spare = []
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(list(self.views))
+
+    def _grow(self, capacity=None):
+        self.capacity = capacity or self.capacity * 2
+        for name, dtype in self.FIELDS.items():
+            grown = np.zeros(self.capacity, dtype=dtype)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+
+    def reserve(self, count):
+        """Prepara arrays e visões para `count` zumbis vivos, para que os spawns não aloquem nada."""
+        if count > self.capacity:
+            self._grow(count)
+        while self.count + len(self.spare) < count:
+            self.spare.append(Zombie.__new__(Zombie))
+
+    def add(self, zombie, x, y):
+        """Reserva um slot para o zumbi e retorna o índice."""
+        if self.count == self.capacity:
+            self._grow()
+        slot = self.count
+        zombie.horde = self
+        zombie.serial = self.spawned
+        self.spawned += 1
+        for name in self.FIELDS:
+            getattr(self, name)[slot] = 0
+        self.x[slot] = self.prev_x[slot] = x
+        self.y[slot] = self.prev_y[slot] = y
+        self.vel_x[slot] = ZOMBIE_SPEED
+        self.health[slot] = ZOMBIE_HEALTH
+        self.action[slot] = IDLE
+        self.facing_right[slot] = True
+        self.views.append(zombie)
+        self.count += 1
+        return slot
+
+    def spawn(self, x, y):
+        """Cria um zumbi em (x, y), reaproveitando a visão de um removido se houver."""
+        if self.spare:
+            zombie = self.spare.pop()
+            zombie.slot = self.add(zombie, x, y)
+            return zombie
+        return Zombie(x, y, horde=self)
+
+    def _slots(self, idx):
+        return np.arange(self.count) if idx is None else idx
+
+    def hitbox_arrays(self, idx):
+        """left/top/right/bottom das hitboxes, truncados como pygame.Rect."""
+        left = np.trunc(self.x[idx] + ZOMBIE_HITBOX_OFFSET_X)
+        top = np.trunc(self.y[idx] + self.hitbox_offset_y)
+        return left, top, left + ZOMBIE_HITBOX_WIDTH, top + ZOMBIE_HITBOX_HEIGHT
 
-    def update_ai(self, player, dt, platforms):
-        if self.current_action == "dead" or self.is_dead:
-                if self.current_action == "dead" and self.frame_index >= len(self.zombie_frames["dead"]) - 1:
-                    self.is_dead = True
-                return
+    def hitboxes(self, lo, hi):
+        """Slots e caixas (n, 4) dos zumbis atingíveis com x entre lo e hi."""
+        idx = np.flatnonzero(~self.is_dead[:self.count])
+        left, top, right, bottom = self.hitbox_arrays(idx)
+        near = (left < hi) & (right > lo)
+        return idx[near], np.stack((left, top, right, bottom), axis=1)[near]
 
-        if self.health <= 0:
-                print("Zumbi morreu, iniciando animação de morte")
-                self.current_action = "dead"
-                self.frame_index = 0
-                self.vel_x = 0
-                return
+    def store_previous(self):
+        """Guarda as posições do tick anterior para a interpolação do desenho."""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def nav_graph(self, platforms, depth, previous=None):
+        """Grafo de navegação das plataformas com a física e a hitbox dos zumbis.
+
+        `previous` é o grafo do conjunto anterior de plataformas, de onde saem as arestas reaproveitadas.
+        """
+        return NavGraph(
+            platforms, ZOMBIE_HITBOX_WIDTH, ZOMBIE_HITBOX_HEIGHT, ZOMBIE_SPEED,
+            self.jump_strength, self.gravity, self.max_fall_speed, depth, previous,
+        )
+
+    def update(self, player, dt, platforms, idx=None, flow=None):
+        self.update_ai(player, dt, platforms, idx, flow)
+        self.update_animation(dt, idx)
+        self.update_position(platforms, idx, dt)
+
+    def update_ai(self, player, dt, platforms, idx=None, flow=None):
+        idx = self._slots(idx)
+        action = self.action
+
+        dying = (action[idx] == DEAD) | self.is_dead[idx]
+        finished = dying & (action[idx] == DEAD) & (self.frame_index[idx] >= self.frame_counts[DEAD] - 1)
+        self.is_dead[idx[finished]] = True
+        idx = idx[~dying]
+
+        killed = idx[self.health[idx] <= 0]
+        action[killed] = DEAD
+        self.frame_index[killed] = 0
+        self.vel_x[killed] = 0
+        idx = idx[self.health[idx] > 0]
+        if not idx.size:
+            return
 
         player_rect = pygame.Rect(
             player.x + player.hitbox_offset_x,
@@ -108,102 +203,294 @@ class Zombie(Character):
             player.hitbox_width,
             player.hitbox_height,
         )
-        zombie_rect = pygame.Rect(
-            self.x + self.hitbox_offset_x,
-            self.y + self.hitbox_offset_y,
-            self.hitbox_width,
-            self.hitbox_height,
-        )
+        left, top, right, bottom = self.hitbox_arrays(idx)
 
-        player_on_platform = False
-        zombie_on_platform = False
-        for platform in platforms:
-            plat_rect = pygame.Rect(platform[0], platform[1], platform[2], platform[3])
-            if player_rect.colliderect(plat_rect) or (
-                player_rect.bottom == plat_rect.top
-                and plat_rect.collidepoint(player_rect.midbottom)
-            ):
-                player_on_platform = platform
-            if zombie_rect.colliderect(plat_rect) or (
-                zombie_rect.bottom == plat_rect.top
-                and plat_rect.collidepoint(zombie_rect.midbottom)
-            ):
-                zombie_on_platform = platform
-
-        if player_on_platform != zombie_on_platform:
-            self.current_action = "idle"
-            return
+        player_on_platform = platforms.support(player_rect)
+        if player_on_platform is None:
+            player_on_platform = -1
+        support = platforms.support_many(left, top, right, bottom)
+        # Quem está no ar seguindo o grafo continua o movimento até pousar
+        same = (support == player_on_platform) & ~((support < 0) & (self.nav_dir[idx] != 0))
+        if flow is None:
+            action[idx[~same]] = IDLE
+        else:
+            if player_on_platform < 0:
+                flow.update(platforms.below(player_rect.centerx, player_rect.bottom))
+            else:
+                flow.update(player_on_platform)
+            self._navigate(idx[~same], support[~same], left[~same], dt, flow)
+        idx, left, top, right, bottom = idx[same], left[same], top[same], right[same], bottom[same]
+        self.nav_dir[idx] = 0
 
-        dist_x = player.x - self.x
-        dist_y = player.y - self.y
-        self.facing_right = dist_x > 0
+        dist_x = player.x - self.x[idx]
+        dist_y = player.y - self.y[idx]
+        self.facing_right[idx] = dist_x > 0
 
         # Ataque baseado em colisão direta para consistência
-        if zombie_rect.colliderect(player_rect):
-            if self.attack_cooldown <= 0:
-                self.current_action = "attack"
-                self.frame_index = 0
-                player.take_damage(self.attack_damage)
-                self.attack_cooldown = 1.0
-            else:
-                self.attack_cooldown -= dt
-                if self.current_action != "attack":
-                    self.current_action = "idle"
-            return
+        touching = (
+            (left < player_rect.right) & (player_rect.left < right)
+            & (top < player_rect.bottom) & (player_rect.top < bottom)
+        )
+        ready = touching & (self.attack_cooldown[idx] <= 0)
+        attackers = idx[ready]
+        action[attackers] = ATTACK
+        self.frame_index[attackers] = 0
+        self.attack_cooldown[attackers] = 1.0
+        for _ in range(attackers.size):
+            player.take_damage(self.attack_damage)
 
-        if abs(dist_x) > 20:
-            self.current_action = "walk"
-            if abs(dist_y) < 50:
-                move_speed = self.vel_x * dt * 60
-                self.x += move_speed if dist_x > 0 else -move_speed
-            else:
-                self.current_action = "idle"
-        else:
-            self.current_action = "idle"
-
-    def update_position(self, platforms):
-        self.vel_y += self.gravity
-        self.y += self.vel_y
-        self.render_x += (self.x - self.render_x) * self.smoothing_factor
-        self.render_y += (self.y - self.render_y) * self.smoothing_factor
-
-        hitbox = pygame.Rect(
-            self.x + self.hitbox_offset_x,
-            self.y + self.hitbox_offset_y,
-            self.hitbox_width,
-            self.hitbox_height,
+        waiting = idx[touching & ~ready]
+        self.attack_cooldown[waiting] -= dt
+        action[waiting[action[waiting] != ATTACK]] = IDLE
+
+        free = ~touching
+        walking = free & (np.abs(dist_x) > 20) & (np.abs(dist_y) < 50)
+        action[idx[free]] = IDLE
+        movers = idx[walking]
+        action[movers] = WALK
+        move_speed = self.vel_x[movers] * dt * 60
+        self.x[movers] += np.where(dist_x[walking] > 0, move_speed, -move_speed)
+
+    def _navigate(self, idx, support, left, dt, flow):
+        """Move em direção à plataforma do jogador seguindo o campo de fluxo."""
+        grounded = support >= 0
+        node = np.maximum(support, 0)
+        direction = np.where(grounded, flow.direction[node], self.nav_dir[idx])
+        self.nav_dir[idx] = direction
+        moving = direction != 0
+        self.action[idx] = np.where(moving, WALK, IDLE)
+        movers = idx[moving]
+        self.facing_right[movers] = direction[moving] > 0
+        self.x[movers] += direction[moving] * self.vel_x[movers] * dt * 60
+
+        center = left + ZOMBIE_HITBOX_WIDTH // 2
+        jumping = (
+            grounded & flow.jump[node] & (self.vel_y[idx] == 0)
+            & (direction * (center - flow.takeoff[node]) >= 0)
         )
+        self.vel_y[idx[jumping]] = self.jump_strength
 
-        for platform in platforms:
-            plat_rect = pygame.Rect(*platform)
-            if hitbox.colliderect(plat_rect):
-                if self.vel_y > 0 and hitbox.bottom > plat_rect.top:
-                    self.y = plat_rect.top - self.hitbox_height - self.hitbox_offset_y
-                    self.vel_y = 0
-                    self.is_jumping = False
-                elif self.vel_y < 0 and hitbox.top < plat_rect.bottom:
-                    self.y = plat_rect.bottom - self.hitbox_offset_y
-                    self.vel_y = 0
-        self.vel_y = min(self.vel_y, 10)
-
-    def draw(self, screen, camera_x=0):
-        if not hasattr(self, "zombie_frames") or not self.zombie_frames.get(
-            self.current_action
-        ):
-            return
-        flip = not self.facing_right
-        frame = self.get_frame(flip)
-        screen.blit(frame, (round(self.render_x - camera_x), round(self.render_y)))
-        try:
-            if (
-                DEBUG_MODE and not self.is_dead
-            ):  # Só desenha hitbox se não estiver morto
-                hitbox_rect = pygame.Rect(
-                    self.x + self.hitbox_offset_x - camera_x,
-                    self.y + self.hitbox_offset_y,
-                    self.hitbox_width,
-                    self.hitbox_height,
-                )
-                pygame.draw.rect(screen, (0, 255, 0), hitbox_rect, 1)
-        except NameError:
-            pass
+    def update_animation(self, dt, idx=None):
+        idx = self._slots(idx)
+        self.frame_time[idx] += dt
+        duration = self.frame_durations[self.action[idx]]
+        advance = self.frame_time[idx] >= duration
+        idx = idx[advance]
+        self.frame_time[idx] -= duration[advance]
+        self.frame_index[idx] += 1
+
+        action = self.action[idx]
+        count = self.frame_counts[action]
+        frame = self.frame_index[idx]
+        over = frame >= count
+        dead = action == DEAD
+        finished = idx[dead & over]
+        self.is_dead[finished] = True
+        self.frame_index[finished] = count[dead & over] - 1
+        attack_done = (action == ATTACK) & over
+        self.action[idx[attack_done]] = IDLE
+        self.frame_index[idx[attack_done]] = 0
+        looping = ~dead & ~attack_done
+        self.frame_index[idx[looping]] = frame[looping] % count[looping]
+
+    def update_position(self, platforms, idx=None, dt=FRAME_TIME):
+        idx = self._slots(idx)
+        step = dt / FRAME_TIME
+        # Mesma forma fechada do passo de 60 Hz que Character.update_position usa
+        self.y[idx] += (self.vel_y[idx] + 0.5 * self.gravity * (step + 1)) * step
+        self.vel_y[idx] += self.gravity * step
+
+        # Só a primeira plataforma tocada importa: depois dela vel_y zera
+        first = platforms.first_colliding_many(*self.hitbox_arrays(idx))
+        vel_y = self.vel_y[idx]
+        landing = (first >= 0) & (vel_y > 0)
+        ceiling = (first >= 0) & (vel_y < 0)
+        edges = platforms.edges
+        self.y[idx[landing]] = edges[first[landing], 1] - ZOMBIE_HITBOX_HEIGHT - self.hitbox_offset_y
+        self.y[idx[ceiling]] = edges[first[ceiling], 3] - self.hitbox_offset_y
+        self.vel_y[idx[landing | ceiling]] = 0
+        self.vel_y[idx] = np.minimum(self.vel_y[idx], self.max_fall_speed)
+
+    def remove_finished(self):
+        """Remove os zumbis cuja animação de morte terminou e retorna quantos saíram."""
+        n = self.count
+        finished = (
+            self.is_dead[:n]
+            & (self.action[:n] == DEAD)
+            & (self.frame_index[:n] >= self.frame_counts[DEAD] - 1)
+        )
+        removed = np.flatnonzero(finished)
+        if removed.size:
+            self._remove(removed)
+        return int(removed.size)
+
+    def _remove(self, removed):
+        """Remove os slots `removed` (crescentes) por swap-and-pop: custo proporcional aos removidos."""
+        n = self.count
+        kept = n - removed.size
+        # Buracos antes do novo fim recebem os ocupados que estão depois dele
+        holes = removed[removed < kept]
+        tail = np.ones(n - kept, dtype=bool)
+        tail[removed[removed >= kept] - kept] = False
+        movers = kept + np.flatnonzero(tail)
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[holes] = array[movers]
+        views = self.views
+        for slot in removed.tolist():
+            self.spare.append(views[slot])
+        for hole, mover in zip(holes.tolist(), movers.tolist()):
+            views[hole] = views[mover]
+            views[hole].slot = hole
+        del views[kept:]
+        self.count = kept
+
+    def remove_outside(self, runs):
+        """Retira os zumbis com x fora de todos os trechos [left, right) e retorna seus campos ({nome: array})."""
+        n = self.count
+        x = self.x[:n]
+        outside = np.ones(n, dtype=bool)
+        for left, right in runs:
+            outside &= (x < left) | (x >= right)
+        if not outside.any():
+            return None
+        rows = {name: getattr(self, name)[:n][outside] for name in self.FIELDS}
+        self._remove(np.flatnonzero(outside))
+        return rows
+
+    def restore(self, rows):
+        """Recoloca na horda zumbis retirados por remove_outside, com o estado que tinham."""
+        start = self.count
+        for x, y in zip(rows["x"].tolist(), rows["y"].tolist()):
+            self.spawn(x, y)
+        for name in self.FIELDS:
+            getattr(self, name)[start:self.count] = rows[name]
+
+    def load(self, rows):
+        """Substitui todo o estado da horda por `rows` ({campo: array}), reaproveitando as visões."""
+        count = len(rows["x"])
+        self.spare += self.views[count:]
+        del self.views[count:]
+        for slot, view in enumerate(self.views):
+            view.slot = slot
+        self.count = len(self.views)
+        for x, y in zip(rows["x"][self.count:].tolist(), rows["y"][self.count:].tolist()):
+            self.spawn(x, y)
+        for name in self.FIELDS:
+            getattr(self, name)[:count] = rows[name]
+
+    def sprites(self, camera_x=0, alpha=1.0, view=(800, 600)):
+        """Lista (imagem, posição) dos zumbis visíveis numa tela de tamanho `view`."""
+        n = self.count
+        if not n:
+            return []
+        x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+        xs = np.rint(x - camera_x).astype(int)
+        ys = np.rint(y).astype(int)
+        visible = np.flatnonzero(
+            (xs > -self.frame_width) & (xs < view[0]) & (ys > -self.frame_height) & (ys < view[1])
+        )
+        action = self.action[visible]
+        frame = self.frame_base[self.facing_right[visible].astype(np.intp), action] + np.minimum(
+            self.frame_index[visible], self.frame_counts[action] - 1
+        )
+        offsets = self.sprite_offsets[frame]
+        images = self.sprite_images
+        return [
+            (images[i], (x, y)) for i, x, y in zip(
+                frame.tolist(), (xs[visible] + offsets[:, 0]).tolist(), (ys[visible] + offsets[:, 1]).tolist()
+            )
+        ]
+
+    def draw(self, screen, camera_x=0, alpha=1.0):
+        """Desenha a horda com uma única chamada a blits e retorna os retângulos alterados."""
+        return screen.blits(self.sprites(camera_x, alpha, screen.get_size()))
+
+
+def _field(name, convert):
+    def get(self):
+        return convert(getattr(self.horde, name)[self.slot])
+
+    def set(self, value):
+        getattr(self.horde, name)[self.slot] = value
+
+    return property(get, set)
+
+
+class Zombie(Character):
+    """Visão de um único zumbi sobre os arrays da ZombieHorde."""
+
+    is_enemy = True
+    max_health = 100
+    gravity = ZombieHorde.gravity
+    jump_strength = ZombieHorde.jump_strength
+    attack_damage = ZombieHorde.attack_damage
+    attack_range = 50  # Reduzido para consistência
+    hitbox_offset_x = ZOMBIE_HITBOX_OFFSET_X
+    hitbox_width = ZOMBIE_HITBOX_WIDTH
+    hitbox_height = ZOMBIE_HITBOX_HEIGHT
+    projectiles = None
+
+    x = _field("x", float)
+    y = _field("y", float)
+    vel_x = _field("vel_x", float)
+    vel_y = _field("vel_y", float)
+    health = _field("health", float)
+    frame_time = _field("frame_time", float)
+    attack_cooldown = _field("attack_cooldown", float)
+    prev_x = _field("prev_x", float)
+    prev_y = _field("prev_y", float)
+    frame_index = _field("frame_index", int)
+    facing_right = _field("facing_right", bool)
+    is_dead = _field("is_dead", bool)
+
+    def __init__(self, x, y, horde=None):
+        self.horde = horde if horde is not None else ZombieHorde(capacity=1)
+        self.slot = self.horde.add(self, x, y)
+
+    @property
+    def current_action(self):
+        return ACTIONS[self.horde.action[self.slot]]
+
+    @current_action.setter
+    def current_action(self, value):
+        self.horde.action[self.slot] = ACTION_CODES[value]
+
+    @property
+    def animations(self):
+        return self.horde.animations
+
+    @property
+    def hitbox_offset_y(self):
+        return self.horde.hitbox_offset_y
+
+    @property
+    def FRAME_WIDTH(self):
+        return self.horde.frame_width
+
+    @property
+    def FRAME_HEIGHT(self):
+        return self.horde.frame_height
+
+    def _slot_array(self):
+        return np.array([self.slot])
+
+    def update_animation(self, dt):
+        self.horde.update_animation(dt, self._slot_array())
+
+    def update_ai(self, player, dt, platforms, flow=None):
+        self.horde.update_ai(player, dt, platforms, self._slot_array(), flow)
+
+    def update_position(self, platforms, dt=FRAME_TIME):
+        self.horde.update_position(platforms, self._slot_array(), dt)
+
+    def store_previous(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def draw(self, screen, camera_x=0, alpha=1.0):
+        frame, (dx, dy) = self.get_sprite(not self.facing_right)
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return screen.blit(frame, (round(x - camera_x) + dx, round(y) + dy))
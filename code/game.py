@@ -0,0 +1,367 @@
+import pygame
+import numpy as np
+from collections import namedtuple
+from character import Character, FRAME_TIME, DEAD_SPRITE
+from background import ParallaxBackground
+from effects import EffectPool, EXPLOSION_SHEET
+from enemy import ZombieHorde, ZOMBIE_SHEETS
+from hud import HUD
+from textcache import text_cache
+from level import Level, LevelStream, DEFAULT_LEVEL
+from navigation import FlowField
+from scheduler import ActivityScheduler
+from renderqueue import RenderQueue, PROJECTILES, ENEMIES, PLAYER, EFFECTS
+from timing import NULL_TIMER
+from waves import WaveDirector, RESERVE
+
+# Constantes globais
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
+PLATFORM_COLOR = (33, 19, 19)
+CAMERA_FOLLOW_THRESHOLD = SCREEN_WIDTH // 2
+TICK_RATE = 60  # Ticks de simulação por segundo, independente da taxa de desenho
+DEATH_SCREEN_DELAY = 2.0
+# Camadas do fundo (do fundo para a frente) e a fração da câmera com que cada uma rola
+BACKGROUND_LAYERS = [
+    ("assets/background/city4/1.png", 0.0),
+    ("assets/background/city4/2.png", 0.1),
+    ("assets/background/city4/3.png", 0.25),
+    ("assets/background/city4/4.png", 0.5),
+    ("assets/background/city4/5.png", 0.5),
+    ("assets/background/city4/7.png", 1.0),
+]
+PLAYER_SPRITES = {
+    "idle": "assets/character/Idle.png",
+    "walk": "assets/character/Walk.png",
+    "run": "assets/character/Run.png",
+    "shoot": "assets/character/Shot_1.png"
+}
+PLAYER_FRAMES = {"idle": 7, "walk": 7, "run": 7, "shoot": 4}
+# Imagens de uma partida, como chaves (path, size, alpha) de registry.load_image
+GAME_ASSETS = [
+    *ParallaxBackground.asset_keys(BACKGROUND_LAYERS, (SCREEN_WIDTH, SCREEN_HEIGHT)),
+    *((path, None, True) for path in PLAYER_SPRITES.values()),
+    (DEAD_SPRITE, None, True),
+    (EXPLOSION_SHEET, None, True),
+    *((path, None, True) for path, _ in ZOMBIE_SHEETS.values()),
+]
+
+InputState = namedtuple("InputState", "shoot run left right jump")
+NO_INPUT = InputState(False, False, False, False, False)
+
+
+def read_input(keys):
+    """Converte o estado do teclado (pygame.key.get_pressed()) em InputState."""
+    return InputState(
+        shoot=bool(keys[pygame.K_f]),
+        run=bool(keys[pygame.K_LSHIFT]),
+        left=bool(keys[pygame.K_LEFT]),
+        right=bool(keys[pygame.K_RIGHT]),
+        jump=bool(keys[pygame.K_SPACE]),
+    )
+
+
+def init_game():
+    """Inicializa os elementos do jogo que não dependem do nível."""
+    background = ParallaxBackground(BACKGROUND_LAYERS, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    player = Character(
+        x=100, y=400,
+        sprites_path=dict(PLAYER_SPRITES),
+        animation_frames=dict(PLAYER_FRAMES)
+    )
+    hud = HUD(player)
+    return background, player, hud
+
+
+class Game:
+    """Uma partida: simulação em passo fixo e desenho interpolado entre dois ticks."""
+
+    def __init__(self, tick_rate=TICK_RATE, level_path=DEFAULT_LEVEL, survival=False):
+        self.background, self.player, self.hud = init_game()
+        self.zombie_deaths = 0
+        self.tick_rate = tick_rate
+        self.tick_dt = 1.0 / tick_rate
+        self.tick = 0
+        self.death_timer = 0
+        self.outcome = None  # "loser" ou "victory" quando a partida termina
+        self.timer = NULL_TIMER
+        self.show_hitboxes = False
+        self.small_font = pygame.font.SysFont(None, 30)  # Fonte menor para instruções
+        self.scheduler = ActivityScheduler()
+        self.effects = EffectPool()
+        self.render_queue = RenderQueue()
+        self.notice = None  # Aviso curto no canto da tela (ex.: "Jogo salvo")
+        self.notice_until = 0
+        self.partner = None  # Segundo jogador do co-op (ver netplay.py)
+        self.partner_camera_x = 0
+        # Sobrevivência: ondas sem fim em vez de chegar ao fim do nível
+        self.director = WaveDirector(tick_rate) if survival else None
+        self.load_level(Level(level_path))
+
+    def load_level(self, level):
+        """Troca o nível: reposiciona o jogador e recomeça o carregamento de chunks."""
+        self.level = level
+        self.world_limit_right = level.length
+        self.stream = LevelStream(level)
+        self.enemies = ZombieHorde()
+        if self.director is not None:
+            self.enemies.reserve(RESERVE)
+        for player in self.players:
+            player.x, player.y = level.player_start
+            player.store_previous()
+        self.camera_x = self.prev_camera_x = 0
+        self.partner_camera_x = 0
+        self.platforms = None
+        self.flow = None
+        self.effects.clear()
+        self.update_stream()
+
+    @property
+    def players(self):
+        return (self.player,) if self.partner is None else (self.player, self.partner)
+
+    def add_partner(self):
+        """Cria o segundo jogador no início do nível; ele tem câmera e campo de fluxo próprios."""
+        partner = init_game()[1]
+        partner.x, partner.y = self.level.player_start
+        partner.store_previous()
+        self.partner = partner
+        self.partner_camera_x = self.camera_x
+        self.partner_flow = FlowField(self.flow.graph)
+        return partner
+
+    def view_span(self):
+        """Trecho do mundo (left, right) visto pelas câmeras de todos os jogadores."""
+        if self.partner is None:
+            return self.camera_x, self.camera_x + SCREEN_WIDTH
+        left = min(self.camera_x, self.partner_camera_x)
+        return left, max(self.camera_x, self.partner_camera_x) + SCREEN_WIDTH
+
+    def view_spans(self):
+        """Faixa (left, right) vista por cada câmera; o nível é carregado em volta de cada uma."""
+        spans = [(self.camera_x, self.camera_x + SCREEN_WIDTH)]
+        if self.partner is not None:
+            spans.append((self.partner_camera_x, self.partner_camera_x + SCREEN_WIDTH))
+        return spans
+
+    def update_stream(self, spans=None, enemies=True):
+        """Carrega os chunks em volta de `spans` (padrão: todas as câmeras).
+
+        Sem `enemies` (cliente do co-op, que recebe os zumbis do host) o stream
+        não cria, guarda nem devolve zumbis, o grafo de navegação não é montado
+        e os campos de fluxo ficam vazios.
+        """
+        platforms = self.stream.update(spans or self.view_spans(), self.enemies if enemies else None)
+        if platforms is not None:
+            self.platforms = platforms
+            if not enemies:
+                self.flow = self.partner_flow = None
+                return
+            # Só as plataformas perto dos chunks que entraram ou saíram têm as arestas recalculadas
+            previous = self.flow.graph if self.flow is not None else None
+            self.flow = FlowField(self.enemies.nav_graph(platforms, SCREEN_HEIGHT, previous))
+            if self.partner is not None:
+                self.partner_flow = FlowField(self.flow.graph)
+
+    def show_notice(self, text, seconds=1.5):
+        self.notice = text
+        self.notice_until = self.tick + round(seconds * self.tick_rate)
+
+    def store_previous(self):
+        for player in self.players:
+            player.store_previous()
+        self.enemies.store_previous()
+        self.prev_camera_x = self.camera_x
+
+    def control(self, player, inputs, camera_x):
+        """Aplica a entrada de um tick (tiro, movimento, pulo) e retorna a câmera que segue o jogador."""
+        if inputs.shoot and player.attack_cooldown <= 0:
+            player.shoot()
+            self.effects.muzzle_flash(*player.gun_position(), 1 if player.facing_right else -1)
+
+        step = self.tick_dt / FRAME_TIME
+        player.is_running = inputs.run
+        move_x = inputs.right - inputs.left
+
+        if move_x != 0 and not player.is_dead:
+            new_x = player.x + move_x * player.vel_x * (1.2 if player.is_running else 1) * step
+            if 0 <= new_x <= self.world_limit_right:
+                player.x = new_x
+            player.facing_right = move_x > 0
+            if not player.is_animating:
+                player.current_action = "run" if player.is_running else "walk"
+            if player.x - camera_x > CAMERA_FOLLOW_THRESHOLD:
+                camera_x = player.x - CAMERA_FOLLOW_THRESHOLD
+            elif player.x - camera_x < CAMERA_FOLLOW_THRESHOLD // 2:
+                camera_x = max(0, player.x - CAMERA_FOLLOW_THRESHOLD // 2)
+        else:
+            if not player.is_animating and not player.is_dead:
+                player.current_action = "idle"
+
+        if inputs.jump and not player.is_jumping and not player.is_dead:
+            player.vel_y = player.jump_strength
+            player.is_jumping = True
+        return camera_x
+
+    def move(self, player, inputs, dt):
+        """Animação e física de um tick do jogador (também usado na predição do cliente do co-op)."""
+        move_x = inputs.right - inputs.left
+        player.update_animation(dt, move_x)
+        player.update_position(self.platforms, move_x if not player.is_dead else 0, dt)
+        if self.director is not None:
+            # Sem chegada, o nível é uma arena: ninguém sai pelas pontas
+            player.x = min(max(player.x, 0), self.world_limit_right)
+        if player.y > SCREEN_HEIGHT:
+            player.take_damage(player.max_health)
+        player.update_combat(dt, self.enemies, SCREEN_WIDTH)
+
+    def targets(self, idx):
+        """Divide os slots `idx` em [(jogador, campo de fluxo, slots)]: cada zumbi persegue o jogador vivo mais próximo."""
+        if self.partner is None:
+            return [(self.player, self.flow, idx)]
+        chasing = [
+            (player, flow) for player, flow in ((self.player, self.flow), (self.partner, self.partner_flow))
+            if player.health > 0
+        ] or [(self.player, self.flow)]
+        if len(chasing) == 1:
+            return [(*chasing[0], idx)]
+        x = self.enemies.x[idx]
+        near_partner = np.abs(x - self.partner.x) < np.abs(x - self.player.x)
+        return [(self.player, self.flow, idx[~near_partner]), (self.partner, self.partner_flow, idx[near_partner])]
+
+    def step(self, inputs, partner_inputs=NO_INPUT):
+        """Avança a simulação exatamente um tick com a entrada informada (e a do parceiro, no co-op)."""
+        dt = self.tick_dt
+        player = self.player
+        partner = self.partner
+        enemies = self.enemies
+        platforms = self.platforms
+        timer = self.timer
+        self.store_previous()
+
+        self.camera_x = self.control(player, inputs, self.camera_x)
+        if partner is not None:
+            self.partner_camera_x = self.control(partner, partner_inputs, self.partner_camera_x)
+        timer.lap("input")
+
+        self.move(player, inputs, dt)
+        if partner is not None:
+            self.move(partner, partner_inputs, dt)
+        timer.lap("player")
+
+        view_left, view_right = self.view_span()
+        groups = self.scheduler.plan(enemies, view_left, view_right, self.tick, dt)
+        for group_dt, idx in groups:
+            for target, flow, slots in self.targets(idx):
+                enemies.update_ai(target, group_dt, platforms, slots, flow)
+        timer.lap("zombie_ai")
+        for group_dt, idx in groups:
+            enemies.update_animation(group_dt, idx)
+        timer.lap("zombie_animation")
+        for group_dt, idx in groups:
+            enemies.update_position(platforms, idx, group_dt)
+        self.zombie_deaths += enemies.remove_finished()
+        timer.lap("zombie_physics")
+
+        if all(p.is_dead for p in self.players):
+            self.death_timer += dt
+            if self.death_timer >= DEATH_SCREEN_DELAY:
+                self.outcome = "loser"
+
+        effects = self.effects
+        shooters = [(player, self.camera_x)]
+        if partner is not None:
+            shooters.append((partner, self.partner_camera_x))
+        for shooter, camera_x in shooters:
+            shooter.projectiles.update(dt)
+            hit_enemies = shooter.projectiles.collide(camera_x, camera_x + SCREEN_WIDTH, platforms, enemies)
+            for enemy in hit_enemies:
+                was_alive = enemy.health > 0
+                x = enemy.x + enemy.hitbox_offset_x + enemy.hitbox_width // 2
+                y = enemy.y + enemy.hitbox_offset_y + 20
+                floor = self.floor_below(x, y)
+                if enemy.take_damage(shooter.attack_damage) and was_alive:
+                    effects.death(x, y, floor)
+                else:
+                    effects.blood(x, y, 1 if enemy.x > shooter.x else -1, floor)
+        timer.lap("projectiles")
+
+        effects.update(dt)
+        timer.lap("effects")
+
+        if self.director is not None:
+            self.director.update(self)
+        elif any(self.level.reached_goal(p.x, p.y) for p in self.players):
+            self.outcome = "victory"
+
+        self.update_stream()
+
+        self.tick += 1
+
+    def floor_below(self, x, y):
+        """Topo da plataforma sob o ponto (onde as partículas param), ou infinito."""
+        index = self.platforms.below(x, y)
+        return float("inf") if index is None else self.platforms.rects[index].top
+
+    def view_camera(self, alpha=1.0):
+        """Posição da câmera interpolada, em pixels inteiros (todas as camadas usam a mesma)."""
+        return int(self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha)
+
+    def draw_level(self, screen, camera_x):
+        self.background.draw(screen, camera_x)
+        for platform in self.platforms:
+            platform_rect = (platform[0] - camera_x, platform[1], platform[2], platform[3])
+            pygame.draw.rect(screen, PLATFORM_COLOR, platform_rect)
+
+    def draw(self, screen, alpha=1.0):
+        """Desenha o estado interpolado entre o tick anterior e o atual (alpha em [0, 1])."""
+        camera_x = self.view_camera(alpha)
+        screen.fill((0, 0, 0))
+        self.draw_level(screen, camera_x)
+        self.timer.lap("draw_background")
+        return self.draw_sprites(screen, camera_x, alpha)
+
+    def draw_sprites(self, screen, camera_x, alpha=1.0):
+        """Desenha entidades e HUD sobre o nível e retorna os retângulos de tela alterados."""
+        player = self.player
+        timer = self.timer
+        view = screen.get_size()
+        queue = self.render_queue
+        for shooter in self.players:
+            queue.submit(PROJECTILES, shooter.projectiles.sprites(camera_x, alpha, self.tick_dt, view))
+        queue.submit(ENEMIES, self.enemies.sprites(camera_x, alpha, view))
+        if self.partner is not None:
+            queue.submit(PLAYER, self.partner.sprites(camera_x, alpha, view))
+        queue.submit(PLAYER, player.sprites(camera_x, alpha, view))
+        queue.submit(EFFECTS, self.effects.sprites(camera_x, alpha, self.tick_dt, view))
+        rects = queue.flush(screen)
+        timer.lap("draw_entities")
+
+        rects += self.hud.draw(screen)
+
+        # Exibe instruções no canto direito
+        shoot_text = text_cache.render(self.small_font, "Atirar: F", (255, 255, 255))
+        run_text = text_cache.render(self.small_font, "Correr: Shift", (255, 255, 255))
+        rects.append(screen.blit(shoot_text, (SCREEN_WIDTH - shoot_text.get_width() - 10, 10)))
+        rects.append(screen.blit(run_text, (SCREEN_WIDTH - run_text.get_width() - 10, 40)))
+        if self.director is not None:
+            wave_text = text_cache.render(self.small_font, f"Onda {self.director.wave(self.tick)}", (255, 255, 255))
+            rects.append(screen.blit(wave_text, (SCREEN_WIDTH // 2 - wave_text.get_width() // 2, 10)))
+        if self.notice and self.tick < self.notice_until:
+            notice_text = text_cache.render(self.small_font, self.notice, (255, 255, 0))
+            rects.append(screen.blit(notice_text, (SCREEN_WIDTH - notice_text.get_width() - 10, 70)))
+
+        if self.show_hitboxes:
+            player_hitbox = pygame.Rect(
+                player.x + player.hitbox_offset_x - camera_x,
+                player.y + player.hitbox_offset_y,
+                player.hitbox_width,
+                player.hitbox_height
+            )
+            rects.append(pygame.draw.rect(screen, (255, 0, 0), player_hitbox, 1))
+            # Só as hitboxes dentro da tela
+            _, boxes = self.enemies.hitboxes(camera_x, camera_x + view[0])
+            for left, top, right, bottom in boxes.tolist():
+                zombie_hitbox = (left - camera_x, top, right - left, bottom - top)
+                rects.append(pygame.draw.rect(screen, (0, 255, 0), zombie_hitbox, 1))
+        timer.lap("draw_hud")
+        return rects
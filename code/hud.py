@@ -1,4 +1,5 @@
 import pygame
+from textcache import text_cache
 
 class HUD:
     def __init__(self, player):
@@ -8,15 +9,17 @@ class HUD:
         self.heart_img.fill((255, 0, 0))
     
     def draw(self, screen):
+        """Desenha o HUD e retorna os retângulos de tela alterados."""
         # Barra de vida
         health_width = 200 * (self.player.health / self.player.max_health)
         pygame.draw.rect(screen, (255, 0, 0), (10, 10, health_width, 20))
-        pygame.draw.rect(screen, (255, 255, 255), (10, 10, 200, 20), 2)
+        rects = [pygame.draw.rect(screen, (255, 255, 255), (10, 10, 200, 20), 2)]
         
         # Texto de vida
-        health_text = self.font.render(f"{self.player.health}/{self.player.max_health}", True, (255, 255, 255))
-        screen.blit(health_text, (220, 10))
+        health_text = text_cache.render(self.font, f"{self.player.health}/{self.player.max_health}", (255, 255, 255))
+        rects.append(screen.blit(health_text, (220, 10)))
         
         # Ícones de vida (opcional)
         for i in range(int(self.player.health / 20)):
-            screen.blit(self.heart_img, (10 + i*35, 40))
\ No newline at end of file
+            rects.append(screen.blit(self.heart_img, (10 + i*35, 40)))
+        return rects
@@ -0,0 +1,151 @@
+"""Formato de nível em chunks e o carregamento em volta da câmera.
+
+Um nível é um diretório com:
+    level.json        largura dos chunks, comprimento, início do jogador e área de vitória
+    chunk_0000.json   {"platforms": [[x, y, w, h], ...], "spawns": [[x, y], ...]}
+    chunk_0001.json   ...
+
+Coordenadas são do mundo. Uma plataforma aparece em todos os chunks que cruza;
+um spawn pertence ao chunk que contém seu x.
+"""
+import json
+import os
+import numpy as np
+from assets import resource_path
+from spatial import PlatformIndex
+
+DEFAULT_LEVEL = "levels/city"
+CHUNK_WIDTH = 1024
+STREAM_MARGIN = 1  # Chunks extras carregados de cada lado da tela
+
+
+class Level:
+    """Metadados de um nível em disco; os chunks são lidos sob demanda."""
+
+    def __init__(self, path=DEFAULT_LEVEL):
+        self.path = path
+        with open(os.path.join(resource_path(path), "level.json")) as f:
+            meta = json.load(f)
+        self.chunk_width = meta["chunk_width"]
+        self.length = meta["length"]
+        self.chunk_count = meta["chunk_count"]
+        self.player_start = tuple(meta["player_start"])
+        self.goal = tuple(meta["goal"])  # (left, top, bottom) da chegada
+
+    def load_chunk(self, index):
+        with open(os.path.join(resource_path(self.path), f"chunk_{index:04d}.json")) as f:
+            chunk = json.load(f)
+        return [tuple(p) for p in chunk["platforms"]], [tuple(s) for s in chunk["spawns"]]
+
+    def reached_goal(self, x, y):
+        left, top, bottom = self.goal
+        return x >= left and top <= y <= bottom
+
+
+def save_level(path, platforms, spawns, length, player_start, goal, chunk_width=CHUNK_WIDTH):
+    """Grava um nível no formato em chunks (usado para gerar os arquivos de levels/)."""
+    os.makedirs(path, exist_ok=True)
+    chunk_count = max(1, -(-length // chunk_width))
+    chunks = [{"platforms": [], "spawns": []} for _ in range(chunk_count)]
+    for x, y, w, h in platforms:
+        first = max(0, x // chunk_width)
+        last = min(chunk_count - 1, (x + w - 1) // chunk_width)
+        for index in range(first, last + 1):
+            chunks[index]["platforms"].append([x, y, w, h])
+    for x, y in spawns:
+        chunks[min(chunk_count - 1, max(0, int(x) // chunk_width))]["spawns"].append([x, y])
+    meta = {
+        "chunk_width": chunk_width,
+        "length": length,
+        "chunk_count": chunk_count,
+        "player_start": list(player_start),
+        "goal": list(goal),
+    }
+    with open(os.path.join(path, "level.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    for index, chunk in enumerate(chunks):
+        with open(os.path.join(path, f"chunk_{index:04d}.json"), "w") as f:
+            json.dump(chunk, f)
+
+
+class LevelStream:
+    """Mantém na memória (e na simulação) só os chunks próximos das câmeras.
+
+    Cada câmera carrega a própria faixa de chunks: dois jogadores distantes no
+    co-op não puxam tudo o que fica entre eles.
+
+    Zumbis que saem da área carregada são guardados com o chunk em que estão e
+    voltam com o mesmo estado quando ele é recarregado; os spawns de um chunk
+    acontecem só na primeira vez que ele entra. Sem horda (cliente do co-op,
+    que recebe os zumbis do host) só as plataformas acompanham as câmeras.
+    """
+
+    def __init__(self, level, margin=STREAM_MARGIN):
+        self.level = level
+        self.margin = margin
+        self.chunks = {}  # índice -> lista de plataformas
+        self.parked = {}  # índice -> [campos da horda]
+        self.spawned = set()
+        self.window = None
+
+    def window_for(self, spans):
+        """Índices (em ordem) dos chunks a manter carregados para as faixas (left, right) vistas."""
+        level = self.level
+        width = level.chunk_width
+        wanted = set()
+        for left, right in spans:
+            first = max(0, int(left) // width - self.margin)
+            last = min(level.chunk_count - 1, int(right) // width + self.margin)
+            wanted.update(range(first, last + 1))
+        return tuple(sorted(wanted))
+
+    def update(self, spans, enemies=None):
+        """Ajusta os chunks carregados às faixas vistas; retorna um PlatformIndex novo ou None se nada mudou.
+
+        Com `enemies` os zumbis de fora são guardados e os dos chunks que entram, devolvidos ou criados.
+        """
+        level = self.level
+        width = level.chunk_width
+        window = self.window_for(spans)
+        if window == self.window:
+            return None
+        self.window = window
+
+        # Trechos contínuos de chunks carregados, em coordenadas do mundo
+        runs = []
+        for index in window:
+            if runs and runs[-1][1] == index * width:
+                runs[-1][1] = (index + 1) * width
+            else:
+                runs.append([index * width, (index + 1) * width])
+        rows = enemies.remove_outside(runs) if enemies is not None else None
+        if rows is not None:
+            chunk_of = np.clip(rows["x"] // width, 0, level.chunk_count - 1).astype(int)
+            for index in np.unique(chunk_of).tolist():
+                mask = chunk_of == index
+                self.parked.setdefault(index, []).append(
+                    {name: values[mask] for name, values in rows.items()}
+                )
+        for index in list(self.chunks):
+            if index not in window:
+                del self.chunks[index]
+
+        for index in window:
+            if index in self.chunks:
+                continue
+            platforms, spawns = level.load_chunk(index)
+            self.chunks[index] = platforms
+            if enemies is None:
+                continue
+            for parked in self.parked.pop(index, ()):
+                enemies.restore(parked)
+            if index not in self.spawned:
+                self.spawned.add(index)
+                for x, y in spawns:
+                    enemies.spawn(x, y)
+
+        # Plataformas que cruzam chunks vêm repetidas; mantém a primeira ocorrência
+        platforms = dict.fromkeys(
+            platform for index in sorted(self.chunks) for platform in self.chunks[index]
+        )
+        return PlatformIndex(platforms)
@@ -1,126 +1,187 @@
 import pygame
-from character import Character
-from background import Background
-from enemy import Zombie
-from hud import HUD
+import argparse
+from assets import registry
+from canvas import LogicalCanvas, FILTERS
+from background import ParallaxBackground
+from game import (
+    Game, SCREEN_WIDTH, SCREEN_HEIGHT, TICK_RATE, BACKGROUND_LAYERS, GAME_ASSETS, NO_INPUT, read_input
+)
+from netplay import NetHost, NetClient, DEFAULT_PORT
+from profiler import FrameProfiler
+from render import DirtyRenderer
+from replay import ReplayRecorder
+from snapshot import Checkpoints
+from textcache import text_cache
+from time import perf_counter
+from timing import NULL_TIMER, AdaptiveFrameRate, DynamicResolution
 
-# Constantes globais
-SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
-PLATFORM_COLOR = (33, 19, 19)
-WORLD_LIMIT_RIGHT = 3000
-CAMERA_FOLLOW_THRESHOLD = SCREEN_WIDTH // 2
-DEBUG_MODE = False
-
-def init_game():
-    """Inicializa os elementos do jogo."""
-    background = Background("assets/background/city4/9.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
-    player = Character(
-        x=100, y=400,
-        sprites_path={
-            "idle": "assets/character/Idle.png",
-            "walk": "assets/character/Walk.png",
-            "run": "assets/character/Run.png",
-            "shoot": "assets/character/Shot_1.png"
-        },
-        animation_frames={"idle": 7, "walk": 7, "run": 7, "shoot": 4}
-    )
-    hud = HUD(player)
-    platforms = [
-        (0, 300, 50, 500),
-        (50, 500, 600, 300),
-        (700, 450, 500, 300),
-        (1250, 400, 450, 350),
-        (1850, 350, 600, 400),
-        (2600, 450, 400, 300),
-        (WORLD_LIMIT_RIGHT - 50, 0, 50, 450),
-        (WORLD_LIMIT_RIGHT - 50, 550, 50, 50)
-    ]
-    enemies = [
-        Zombie(x=700, y=430),
-        Zombie(x=850, y=430),
-        Zombie(x=1000, y=430), 
-        Zombie(x=1250, y=380),
-        Zombie(x=1400, y=380),
-        Zombie(x=1850, y=330),
-        Zombie(x=2000, y=330),
-        Zombie(x=2150, y=330),
-        Zombie(x=2600, y=430),
-        Zombie(x=2750, y=430)
-    ]
-    return background, player, hud, platforms, enemies, 0
+MAX_FPS = 60  # Limite da taxa de desenho (0 = sem limite)
+MAX_FRAME_TIME = 0.25  # Evita a "espiral da morte" quando um frame demora demais
+AUTOSAVE_INTERVAL = 5.0  # Segundos de jogo entre checkpoints automáticos
+STATIC_STATES = ("menu", "loser", "victory")  # Telas que só mudam com entrada do jogador
+IDLE_WAKE_MS = 250  # Enquanto as imagens carregam, as telas paradas acordam para acompanhar
+LOADING_FPS = 30
+ADAPTIVE_RATES = (60, 45, 30)  # Taxas de desenho possíveis com --adaptive-fps
+RENDER_SCALES = (1.0, 0.5, 0.25)  # Resoluções internas da escala para a janela com --dynamic-resolution
 
 def draw_darkened_background(screen, background):
-    """Desenha o background escurecido."""
-    background.draw(screen, 0)
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 150))
-    screen.blit(overlay, (0, 0))
+    """Desenha o background escurecido (tela preta enquanto ele ainda carrega)."""
+    if background is None:
+        screen.fill((0, 0, 0))
+        return
+    screen.blit(background.darkened(150), (0, 0))
 
 def draw_menu(screen, font, selected_option, background):
     """Desenha o menu principal."""
     draw_darkened_background(screen, background)
-    title = font.render("Zumbi Survival", True, (255, 255, 255))
-    start = font.render("Iniciar", True, (0, 255, 0) if selected_option == 0 else (255, 255, 255))
-    quit = font.render("Sair", True, (0, 255, 0) if selected_option == 1 else (255, 255, 255))
+    title = text_cache.render(font, "Zumbi Survival", (255, 255, 255))
+    start = text_cache.render(font, "Iniciar", (0, 255, 0) if selected_option == 0 else (255, 255, 255))
+    survival = text_cache.render(font, "Sobrevivência", (0, 255, 0) if selected_option == 1 else (255, 255, 255))
+    quit = text_cache.render(font, "Sair", (0, 255, 0) if selected_option == 2 else (255, 255, 255))
     screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 200))
     screen.blit(start, (SCREEN_WIDTH // 2 - start.get_width() // 2, 300))
-    screen.blit(quit, (SCREEN_WIDTH // 2 - quit.get_width() // 2, 350))
+    screen.blit(survival, (SCREEN_WIDTH // 2 - survival.get_width() // 2, 350))
+    screen.blit(quit, (SCREEN_WIDTH // 2 - quit.get_width() // 2, 400))
 
-def draw_loser(screen, font, selected_option, background):
+def draw_loser(screen, font, selected_option, background, can_load=False):
     """Desenha a tela de derrota."""
     draw_darkened_background(screen, background)
-    message = font.render("Você Perdeu!", True, (255, 0, 0))
-    menu = font.render("Voltar ao Menu", True, (0, 255, 0) if selected_option == 0 else (255, 255, 255))
+    message = text_cache.render(font, "Você Perdeu!", (255, 0, 0))
+    menu = text_cache.render(font, "Voltar ao Menu", (0, 255, 0) if selected_option == 0 else (255, 255, 255))
     screen.blit(message, (SCREEN_WIDTH // 2 - message.get_width() // 2, 200))
     screen.blit(menu, (SCREEN_WIDTH // 2 - menu.get_width() // 2, 300))
+    if can_load:
+        hint = text_cache.render(font, "F9: último checkpoint", (255, 255, 255))
+        screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, 350))
 
 def draw_victory(screen, font, selected_option, background, zombie_deaths):
     """Desenha a tela de vitória com contador de zumbis mortos."""
     draw_darkened_background(screen, background)
-    message = font.render("Você conseguiu chegar ao ponto final", True, (255, 255, 255))
-    zombie_count = font.render(f"Zumbis Mortos: {zombie_deaths}", True, (255, 255, 255))
-    menu = font.render("Voltar ao Menu", True, (0, 255, 0) if selected_option == 0 else (255, 255, 255))
+    message = text_cache.render(font, "Você conseguiu chegar ao ponto final", (255, 255, 255))
+    zombie_count = text_cache.render(font, f"Zumbis Mortos: {zombie_deaths}", (255, 255, 255))
+    menu = text_cache.render(font, "Voltar ao Menu", (0, 255, 0) if selected_option == 0 else (255, 255, 255))
     screen.blit(message, (SCREEN_WIDTH // 2 - message.get_width() // 2, 200))
     screen.blit(zombie_count, (SCREEN_WIDTH // 2 - zombie_count.get_width() // 2, 250))
     screen.blit(menu, (SCREEN_WIDTH // 2 - menu.get_width() // 2, 300))
 
-def main():
+def draw_loading(screen, font, progress, background):
+    """Desenha a tela de carregamento com a barra de progresso."""
+    draw_darkened_background(screen, background)
+    label = text_cache.render(font, "Carregando...", (255, 255, 255))
+    screen.blit(label, (SCREEN_WIDTH // 2 - label.get_width() // 2, 250))
+    bar = pygame.Rect(SCREEN_WIDTH // 2 - 150, 320, 300, 20)
+    pygame.draw.rect(screen, (0, 255, 0), (bar.x, bar.y, bar.width * progress, bar.height))
+    pygame.draw.rect(screen, (255, 255, 255), bar, 2)
+
+def main(tick_rate=TICK_RATE, max_fps=MAX_FPS, dirty=False, record=None, adaptive_fps=False,
+         host_port=None, connect=None, window_size=None, fullscreen=False, scale_filter="nearest",
+         dynamic_resolution=False):
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # O jogo desenha sempre em SCREEN_WIDTH x SCREEN_HEIGHT; a janela pode ter qualquer tamanho
+    canvas = LogicalCanvas((SCREEN_WIDTH, SCREEN_HEIGHT), window_size, fullscreen, scale_filter)
     pygame.display.set_caption("Zumbi Survival")
     clock = pygame.time.Clock()
     font = pygame.font.SysFont(None, 50)
-    small_font = pygame.font.SysFont(None, 30)  # Fonte menor para instruções
 
     state = "menu"
     selected_option = 0
-    camera_x = 0
-    death_timer = 0
-    zombie_deaths = 0
+    survival = False
+    accumulator = 0.0
 
-    background = Background("assets/background/city4/9.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
-    player, hud, platforms, enemies = None, None, None, None
+    # Decodifica as imagens da partida em segundo plano enquanto o menu já aparece;
+    # como ficam no registry, reiniciar a partida não carrega nada de novo
+    loading = registry.preload(GAME_ASSETS)
+    background_keys = ParallaxBackground.asset_keys(BACKGROUND_LAYERS, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    background = None
+    game = None
+    recorder = None
+    checkpoints = None
+    profiler = FrameProfiler()
+    renderer = DirtyRenderer() if dirty else None
+    pacing = None
+    if adaptive_fps and max_fps:
+        pacing = AdaptiveFrameRate([rate for rate in ADAPTIVE_RATES if rate <= max_fps] or [max_fps])
+    target_fps = max_fps
+    # Só a escala suave para a janela fica mais barata numa resolução interna menor;
+    # o mundo é sempre desenhado na resolução lógica
+    resolution = None
+    if dynamic_resolution:
+        resolution = DynamicResolution(RENDER_SCALES, 1.0 / (max_fps or MAX_FPS))
+    drawn = None  # (estado, opção, fundo) da última tela parada desenhada
+    # Co-op: o host aceita um parceiro pela rede; o cliente só manda entrada e desenha o que recebe
+    host = NetHost(host_port) if host_port is not None else None
+    client = None
 
     running = True
     while running:
-        dt = clock.tick(60) / 1000.0
+        if state in STATIC_STATES and drawn == (state, selected_option, background):
+            # Nada mudou desde o último desenho: dorme até chegar um evento
+            # (sem prazo depois do carregamento, quando mais nada muda sozinho)
+            event = pygame.event.wait(0 if loading.finished else IDLE_WAKE_MS)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events += pygame.event.get()
+            clock.tick()
+        else:
+            # A barra de carregamento não precisa da taxa do jogo
+            fps = min(max_fps or LOADING_FPS, LOADING_FPS) if state == "loading" else target_fps
+            frame_time = clock.tick(fps) / 1000.0
+            events = pygame.event.get()
+        work_start = perf_counter()
+        progress = loading.poll()
+        if background is None and all(key in registry.images for key in background_keys):
+            background = ParallaxBackground(BACKGROUND_LAYERS, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        profiling = profiler.enabled and state == "game"
+        if profiling:
+            profiler.begin_frame()
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in events:
+            if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE,
+                              pygame.WINDOWSIZECHANGED):
+                drawn = None  # A janela precisa ser redesenhada
+                if renderer is not None:
+                    renderer.reset()
+            elif event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
-                if state == "menu":
+                if event.key == pygame.K_F3 and game is not None:
+                    # Overlay de perfil (também mostra as hitboxes)
+                    enabled = profiler.toggle()
+                    game.timer = profiler.timer if enabled else NULL_TIMER
+                    game.show_hitboxes = enabled
+                elif event.key == pygame.K_F4 and profiler.enabled:
+                    print(f"Perfil salvo em {profiler.dump_csv()}")
+                elif event.key == pygame.K_F6 and profiler.enabled:
+                    # Contagem de alocações: deixa o jogo mais lento, então fica separada dos tempos
+                    profiler.toggle_allocations()
+                elif (event.key == pygame.K_F5 and state == "game" and checkpoints is not None
+                      and not game.player.is_dead):
+                    checkpoints.save(game)
+                    game.show_notice("Jogo salvo")
+                elif event.key == pygame.K_F9 and state in ("game", "loser") and checkpoints:
+                    # Quick-load: volta ao checkpoint mais recente (manual ou automático)
+                    checkpoints.load(game)
+                    game.show_notice("Checkpoint carregado")
+                    state = "game"
+                    # O tempo parado na tela de derrota (e o de carregar) não vira ticks de simulação
+                    accumulator = 0.0
+                    frame_time = 0.0
+                    clock.tick()
+                    last_autosave = game.tick
+                    if recorder is not None:
+                        # Mesmo replay: a gravação volta ao tick do checkpoint e segue dali
+                        recorder.rewind(game)
+                    if renderer is not None:
+                        renderer.reset()
+                elif state == "menu":
                     if event.key == pygame.K_UP:
                         selected_option = max(0, selected_option - 1)
                     elif event.key == pygame.K_DOWN:
-                        selected_option = min(1, selected_option + 1)
+                        selected_option = min(2, selected_option + 1)
                     elif event.key == pygame.K_RETURN:
-                        if selected_option == 0:
-                            state = "game"
-                            background, player, hud, platforms, enemies, zombie_deaths = init_game()
-                            camera_x = 0
-                            death_timer = 0
-                        elif selected_option == 1:
+                        if selected_option in (0, 1):
+                            state = "loading"
+                            survival = selected_option == 1
+                        elif selected_option == 2:
                             running = False
                 elif state == "loser" or state == "victory":
                     if event.key == pygame.K_UP or event.key == pygame.K_DOWN:
@@ -129,137 +190,175 @@ def main():
                         state = "menu"
                         selected_option = 0
 
+        if state not in STATIC_STATES:
+            # Jogo e carregamento desenham por cima: a próxima tela parada (mesmo igual à anterior,
+            # como a derrota depois de um quick-load) precisa ser desenhada de novo
+            drawn = None
+        elif drawn == (state, selected_option, background):
+            continue
+
+        # A janela, ou a tela lógica fora dela se a janela tiver outro tamanho
+        screen = canvas.surface
         if state == "menu":
             draw_menu(screen, font, selected_option, background)
-            pygame.display.flip()
-
-        elif state == "game":
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_f] and player.attack_cooldown <= 0:
-                player.shoot()
-
-            player.is_running = keys[pygame.K_LSHIFT]
-            move_x = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+            canvas.present()
+            drawn = (state, selected_option, background)
 
-            if move_x != 0 and not player.is_dead:
-                new_x = player.x + move_x * player.vel_x * (1.2 if player.is_running else 1)
-                if 0 <= new_x <= WORLD_LIMIT_RIGHT:
-                    player.x = new_x
-                player.facing_right = move_x > 0
-                if not player.is_animating:
-                    player.current_action = "run" if player.is_running else "walk"
-                if player.x - camera_x > CAMERA_FOLLOW_THRESHOLD:
-                    camera_x = player.x - CAMERA_FOLLOW_THRESHOLD
-                elif player.x - camera_x < CAMERA_FOLLOW_THRESHOLD // 2:
-                    camera_x = max(0, player.x - CAMERA_FOLLOW_THRESHOLD // 2)
+        elif state == "loading":
+            if loading.finished:
+                state = "game"
+                # No co-op o modo é o do host: o cliente não simula os zumbis
+                game = Game(tick_rate, survival=survival and connect is None)
+                if client is not None:
+                    client.close()
+                    client = None
+                if connect is not None:
+                    client = NetClient(game, *connect)
+                    game.show_notice("Conectando...", 3.0)
+                game.timer = profiler.timer if profiler.enabled else NULL_TIMER
+                game.show_hitboxes = profiler.enabled
+                background = game.background
+                accumulator = 0.0
+                clock.tick()  # O tempo de montar a partida não vira ticks de simulação
+                if record:
+                    recorder = ReplayRecorder(game)
+                # Checkpoints e replays não guardam o parceiro: ficam desligados no co-op
+                checkpoints = None
+                if host is None and client is None:
+                    checkpoints = Checkpoints()
+                    checkpoints.save(game)
+                last_autosave = game.tick
+                if renderer is not None:
+                    renderer.reset()
             else:
-                if not player.is_animating and not player.is_dead:
-                    player.current_action = "idle"
-
-            if keys[pygame.K_SPACE] and not player.is_jumping and not player.is_dead:
-                player.vel_y = player.jump_strength
-                player.is_jumping = True
-
-            player.update_animation()
-            player.update_position(platforms, move_x if not player.is_dead else 0)
-            if player.y > SCREEN_HEIGHT:
-                player.take_damage(player.max_health)
-
-            player.update_combat(dt, enemies, SCREEN_WIDTH)
+                draw_loading(screen, font, progress, background)
+                canvas.present()
 
-            for zombie in enemies[:]:
-                zombie.update_ai(player, dt, platforms)
-                zombie.update_animation(dt)
-                zombie.update_position(platforms)
-                if zombie.is_dead and zombie.current_action == "dead" and zombie.frame_index >= len(zombie.zombie_frames["dead"]) - 1:
-                    enemies.remove(zombie)
-                    zombie_deaths += 1
-
-            if player.is_dead:
-                death_timer += dt
-                if death_timer >= 2.0:
-                    state = "loser"
-                    selected_option = 0
-                    death_timer = 0
-
-            screen.fill((0, 0, 0))
-            background.draw(screen, camera_x)
-            for platform in platforms:
-                platform_rect = (platform[0] - camera_x, platform[1], platform[2], platform[3])
-                pygame.draw.rect(screen, PLATFORM_COLOR, platform_rect)
-
-            for proj in player.projectiles[:]:
-                proj['x'] += proj['speed'] * proj['direction']
-                proj['lifetime'] -= dt
-                proj_x = proj['x'] - camera_x
-                pygame.draw.rect(screen, (255, 0, 0), (proj_x, proj['y'], 10, 5))
-                if proj_x < -10 or proj_x > SCREEN_WIDTH + 10 or proj['lifetime'] <= 0:
-                    player.projectiles.remove(proj)
-                    continue
-                proj_rect = pygame.Rect(proj['x'], proj['y'], 10, 5)
-                for platform in platforms:
-                    platform_rect = pygame.Rect(platform[0], platform[1], platform[2], platform[3])
-                    if proj_rect.colliderect(platform_rect):
-                        player.projectiles.remove(proj)
-                        break
-                else:
-                    for enemy in enemies:
-                        if not enemy.is_dead:
-                            enemy_rect = pygame.Rect(
-                                enemy.x + enemy.hitbox_offset_x,
-                                enemy.y + enemy.hitbox_offset_y,
-                                enemy.hitbox_width,
-                                enemy.hitbox_height
-                            )
-                            if proj_rect.colliderect(enemy_rect):
-                                enemy.take_damage(player.attack_damage)
-                                player.projectiles.remove(proj)
-                                break
-
-            for zombie in enemies:
-                zombie.draw(screen, camera_x)
-            player.draw(screen, camera_x)
-            hud.draw(screen)
-
-            # Exibe instruções no canto direito
-            shoot_text = small_font.render("Atirar: F", True, (255, 255, 255))
-            run_text = small_font.render("Correr: Shift", True, (255, 255, 255))
-            screen.blit(shoot_text, (SCREEN_WIDTH - shoot_text.get_width() - 10, 10))
-            screen.blit(run_text, (SCREEN_WIDTH - run_text.get_width() - 10, 40))
-
-            if DEBUG_MODE:
-                player_hitbox = pygame.Rect(
-                    player.x + player.hitbox_offset_x - camera_x,
-                    player.y + player.hitbox_offset_y,
-                    player.hitbox_width,
-                    player.hitbox_height
-                )
-                pygame.draw.rect(screen, (255, 0, 0), player_hitbox, 1)
-                for zombie in enemies:
-                    if not zombie.is_dead:
-                        zombie_hitbox = pygame.Rect(
-                            zombie.x + zombie.hitbox_offset_x - camera_x,
-                            zombie.y + zombie.hitbox_offset_y,
-                            zombie.hitbox_width,
-                            zombie.hitbox_height
-                        )
-                        pygame.draw.rect(screen, (0, 255, 0), zombie_hitbox, 1)
+        elif state == "game":
+            if profiling:
+                profiler.timer.lap("events")
+            # Simulação em passo fixo: o desenho só interpola entre os dois últimos ticks
+            accumulator += min(frame_time, MAX_FRAME_TIME)
+            inputs = read_input(pygame.key.get_pressed())
+            if client is not None:
+                # O host decide o resultado; aqui só o próprio jogador avança entre os snapshots
+                while accumulator >= game.tick_dt:
+                    client.step(inputs)
+                    accumulator -= game.tick_dt
+                was_connected = client.connected
+                if client.poll():
+                    game.zombie_deaths = client.zombie_deaths
+                    game.outcome = client.outcome
+                    if not was_connected:
+                        game.show_notice("Conectado")
+            else:
+                if host is not None:
+                    host.poll(perf_counter())
+                    if host.connected and game.partner is None:
+                        game.add_partner()
+                        game.show_notice("Parceiro conectado")
+                start_tick = game.tick
+                while accumulator >= game.tick_dt and not game.outcome:
+                    if recorder is not None:
+                        recorder.record(game, inputs)
+                    game.step(inputs, host.next_input() if game.partner is not None else NO_INPUT)
+                    accumulator -= game.tick_dt
+                if host is not None and game.tick != start_tick:
+                    host.send(game)
+            # Só com o jogador vivo e apoiado numa plataforma, para não salvar no meio de uma queda
+            player = game.player
+            if (checkpoints is not None and game.tick - last_autosave >= AUTOSAVE_INTERVAL * game.tick_rate
+                    and player.health > 0 and player.vel_y == 0):
+                checkpoints.save(game)
+                last_autosave = game.tick
 
-            if player.x >= WORLD_LIMIT_RIGHT - 50 and player.y >= 450 and player.y <= 550:
-                state = "victory"
+            alpha = min(accumulator / game.tick_dt, 1.0)
+            if renderer is None:
+                game.draw(screen, alpha)
+                updates = None
+            else:
+                updates = renderer.draw(game, screen, alpha)
+            if game.outcome:
+                state = game.outcome
                 selected_option = 0
+                if recorder is not None:
+                    # A gravação continua aberta: um quick-load depois disso a continua no mesmo replay
+                    recorder.save(record)
 
-            pygame.display.flip()
+            if profiling:
+                panel = profiler.draw(screen)
+                if renderer is not None and panel is not None:
+                    renderer.add_dirty(panel, updates)
+                profiler.timer.begin()  # O próprio overlay não entra na medição
+            canvas.present(updates)
+            if profiling:
+                profiler.timer.lap("flip")
+                profiler.end_frame(len(game.enemies), len(game.player.projectiles))
+            work = perf_counter() - work_start
+            if resolution is not None:
+                canvas.scale = resolution.update(work)
+            if pacing is not None:
+                target_fps = pacing.update(work)
 
         elif state == "loser":
-            draw_loser(screen, font, selected_option, background)
-            pygame.display.flip()
+            draw_loser(screen, font, selected_option, background, bool(checkpoints))
+            canvas.present()
+            drawn = (state, selected_option, background)
 
         elif state == "victory":
-            draw_victory(screen, font, selected_option, background, zombie_deaths)
-            pygame.display.flip()
+            draw_victory(screen, font, selected_option, background, game.zombie_deaths)
+            canvas.present()
+            drawn = (state, selected_option, background)
 
+    if recorder is not None:
+        recorder.save(record)
+    for connection in (host, client):
+        if connection is not None:
+            connection.close()
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Zumbi Survival")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE, help="ticks de simulação por segundo")
+    parser.add_argument("--fps", type=int, default=MAX_FPS, help="limite de quadros desenhados por segundo (0 = sem limite)")
+    parser.add_argument("--dirty", action="store_true",
+                        help="atualiza só as áreas alteradas da tela (útil em renderização por software)")
+    parser.add_argument("--record", metavar="ARQUIVO",
+                        help="grava a entrada de cada tick da partida para reproduzir com replay.py")
+    parser.add_argument("--adaptive-fps", action="store_true",
+                        help="baixa a taxa de desenho (60/45/30) quando os frames não cabem no orçamento")
+    network = parser.add_mutually_exclusive_group()
+    network.add_argument("--host", nargs="?", type=int, const=DEFAULT_PORT, metavar="PORTA",
+                         help=f"co-op: aceita um segundo jogador por UDP (porta padrão {DEFAULT_PORT})")
+    network.add_argument("--connect", metavar="ENDEREÇO[:PORTA]",
+                         help="co-op: joga como segundo jogador na partida do host informado")
+    parser.add_argument("--window", metavar="LxA",
+                        help=f"tamanho inicial da janela (padrão: {SCREEN_WIDTH}x{SCREEN_HEIGHT}); a imagem é escalada")
+    parser.add_argument("--fullscreen", action="store_true", help="tela cheia na resolução do monitor")
+    parser.add_argument("--scale-filter", choices=FILTERS, default="nearest",
+                        help="filtro da escala da tela lógica para a janela (padrão: nearest)")
+    parser.add_argument("--dynamic-resolution", action="store_true",
+                        help="com --scale-filter smooth e janela maior que a tela lógica, reduz a "
+                             "resolução interna da escala para a janela quando os frames não cabem no "
+                             "orçamento; o desenho do mundo não fica mais barato")
+    args = parser.parse_args()
+    window_size = None
+    if args.window:
+        try:
+            window_size = tuple(int(value) for value in args.window.lower().split("x"))
+        except ValueError:
+            window_size = ()
+        if len(window_size) != 2 or min(window_size) <= 0:
+            parser.error(f"tamanho de janela inválido: {args.window}")
+    if args.record and (args.host is not None or args.connect):
+        parser.error("--record não funciona no co-op (o replay não guarda o parceiro)")
+    if args.dynamic_resolution and args.scale_filter != "smooth":
+        parser.error("--dynamic-resolution só funciona com --scale-filter smooth "
+                     "(a escala nearest não fica mais barata numa resolução menor)")
+    connect = None
+    if args.connect:
+        address, _, port = args.connect.partition(":")
+        connect = (address, int(port) if port else DEFAULT_PORT)
+    main(tick_rate=args.tick_rate, max_fps=args.fps, dirty=args.dirty, record=args.record,
+         adaptive_fps=args.adaptive_fps, host_port=args.host, connect=connect, window_size=window_size,
+         fullscreen=args.fullscreen, scale_filter=args.scale_filter, dynamic_resolution=args.dynamic_resolution)
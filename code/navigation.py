@@ -0,0 +1,183 @@
+"""Grafo de navegação entre plataformas e campo de fluxo compartilhado pelos zumbis.
+
+O grafo é montado para cada conjunto de plataformas carregadas, simulando a
+mesma física da horda (gravidade, pulo, queda máxima) a partir de alguns pontos
+de saída de cada plataforma. As arestas que saem de uma plataforma só dependem
+das plataformas em volta dela: ao carregar um chunk, as que já existiam no grafo
+anterior com a mesma vizinhança são reaproveitadas e só as da borda nova são
+simuladas. O campo de fluxo guarda, para cada plataforma, o
+próximo movimento em direção à plataforma do jogador; só é recalculado quando
+ela muda, e cada zumbi consulta o seu em O(1).
+"""
+import heapq
+import numpy as np
+from spatial import overlaps
+
+WALK, DROP, JUMP = range(3)
+TAKEOFF_STEP = 16  # Espaçamento dos pontos de pulo testados antes da borda de uma plataforma alta
+# Os pulos saem um pouco antes da borda: zumbis simulados a cada poucos ticks andam
+# vários pixels de uma vez e poderiam passar da borda sem ter pulado
+EDGE_INSET = 8
+
+
+def trajectory(vel_y, speed, gravity, max_fall, depth):
+    """Deslocamentos (dx, dy) e vel_y de cada frame no ar, até descer `depth` pixels."""
+    dx, dy, vy = [], [], []
+    x = y = 0.0
+    while y <= depth:
+        x += speed
+        vel_y += gravity
+        y += vel_y
+        dx.append(x)
+        dy.append(y)
+        vy.append(vel_y)
+        vel_y = min(vel_y, max_fall)
+    return np.array(dx), np.array(dy), np.array(vy)
+
+
+class NavGraph:
+    """Arestas andar/cair/pular entre as plataformas de um PlatformIndex.
+
+    `edges[(a, b)]` é (tipo, direção, centro da hitbox na saída, custo em frames),
+    mantendo só a aresta mais barata de cada par. Os arcos descem até `depth`
+    pixels abaixo da saída (a altura do mundo), fixa para que a vizinhança
+    baste para decidir se as arestas de `previous` ainda valem.
+    """
+
+    def __init__(self, platforms, width, height, speed, jump_strength, gravity, max_fall, depth, previous=None):
+        self.size = len(platforms)
+        self.width = width
+        self.height = height
+        self.speed = speed
+        self.platforms = platforms
+        self.params = (width, height, speed, jump_strength, gravity, max_fall, depth)
+        self.edges = {}
+        self.outgoing = {}  # (plataforma, vizinhas) -> {plataforma de destino: aresta}
+        self.incoming = [[] for _ in range(self.size)]
+        self.arcs = {
+            DROP: trajectory(0.0, speed, gravity, max_fall, depth),
+            JUMP: trajectory(float(jump_strength), speed, gravity, max_fall, depth),
+        }
+        # Altura máxima do pulo: acima disso nenhuma plataforma serve de alvo
+        self.max_rise = -self.arcs[JUMP][1].min()
+        self.reach = self.arcs[JUMP][0][-1]
+        self.offsets = np.arange(0, self.reach + TAKEOFF_STEP, TAKEOFF_STEP)
+        # Nenhum arco nem ponto de pulo passa desta distância das pontas da plataforma
+        self.radius = self.reach + width + 1
+        reusable = previous.outgoing if previous is not None and previous.params == self.params else {}
+        boxes = platforms.edges
+        keys = platforms.platforms
+        index_of = {platform: i for i, platform in enumerate(keys)}
+        for a in range(self.size):
+            left, _, right, _ = boxes[a]
+            near = self.platforms.indices(left - self.radius, right + self.radius)
+            key = (keys[a], tuple(keys[i] for i in near.tolist()))
+            found = reusable.get(key)
+            if found is None:
+                self.found = {}
+                self._add_walks(boxes, a)
+                for direction in (1, -1):
+                    self._add_jumps(boxes, a, direction)
+                found = {keys[b]: edge for b, edge in self.found.items()}
+            self.outgoing[key] = found
+            for platform, edge in found.items():
+                self.edges[a, index_of[platform]] = edge
+        for (a, b), (_, _, _, cost) in self.edges.items():
+            self.incoming[b].append((a, cost))
+
+    def _add(self, a, b, kind, direction, takeoff, cost):
+        best = self.found.get(b)
+        if best is None or cost < best[3]:
+            self.found[b] = (kind, direction, float(takeoff), float(cost))
+
+    def _add_walks(self, boxes, a):
+        left, top, right, _ = boxes[a]
+        center = (left + right) / 2
+        near = self.platforms.indices(left - 1, right + 1)
+        others = boxes[near]
+        touching = (others[:, 1] == top) & (others[:, 0] <= right) & (others[:, 2] >= left)
+        for b in near[touching].tolist():
+            if b != a:
+                target = (boxes[b, 0] + boxes[b, 2]) / 2
+                direction = 1 if target > center else -1
+                self._add(a, b, WALK, direction, center, abs(target - center) / self.speed)
+
+    def _add_jumps(self, boxes, a, direction):
+        left, top, right, _ = boxes[a]
+        half = self.width / 2
+        center = (left + right) / 2
+        first, last = min(left + EDGE_INSET, center), max(right - 1 - EDGE_INSET, center)
+        edge = last if direction > 0 else first
+        # Pula da borda e também de alguns pontos antes de plataformas mais altas à frente,
+        # para subir sem bater nelas por baixo
+        takeoffs = {edge}
+        # Além de reach + width à frente todos os pontos cairiam na própria borda
+        limit = self.reach + self.width
+        others = boxes[self.platforms.indices(edge - limit, edge + limit)]
+        near = others[:, 0] if direction > 0 else others[:, 2]
+        higher = (others[:, 1] < top) & (others[:, 1] >= top - self.max_rise)
+        distance = direction * (near - edge)
+        ahead = (distance > -self.reach) & (distance < limit)
+        points = near[higher & ahead, None] - direction * (half + self.offsets)
+        takeoffs.update(np.clip(points, first, last).ravel().tolist())
+
+        # Cair: anda para fora da borda; a queda começa com a hitbox inteira fora da plataforma
+        start = right if direction > 0 else left - self.width
+        self._simulate(boxes, a, DROP, direction, edge, start, top, abs(edge - center) / self.speed)
+        for takeoff in sorted(takeoffs):
+            walk = abs(takeoff - center) / self.speed
+            self._simulate(boxes, a, JUMP, direction, takeoff, takeoff - half, top, walk)
+
+    def _simulate(self, boxes, a, kind, direction, takeoff, start_left, feet, walk_cost):
+        """Segue o arco a partir da saída e liga `a` à primeira plataforma em que ele pousa."""
+        dx, dy, vy = self.arcs[kind]
+        hitbox_left = start_left + direction * dx
+        bottom = feet + dy
+        # Só as plataformas nas colunas que o arco atravessa
+        near = self.platforms.indices(hitbox_left.min(), hitbox_left.max() + self.width)
+        hits = overlaps(hitbox_left, bottom - self.height, hitbox_left + self.width, bottom, boxes[near])
+        touched = hits.any(axis=1)
+        if not touched.any():
+            return
+        frame = touched.argmax()
+        b = int(near[hits[frame].argmax()])
+        # Bater subindo é teto (a física desce de volta); só conta pousar descendo
+        if b != a and vy[frame] > 0:
+            self._add(a, b, kind, direction, takeoff, walk_cost + frame + 1)
+
+
+class FlowField:
+    """Próximo movimento de cada plataforma até a plataforma alvo (a do jogador)."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.target = None
+        self.direction = np.zeros(graph.size, dtype=np.int8)  # 0 = sem caminho
+        self.takeoff = np.zeros(graph.size)
+        self.jump = np.zeros(graph.size, dtype=bool)
+
+    def update(self, target):
+        """Recalcula o campo para `target` (índice de plataforma ou None); nada muda se for o mesmo."""
+        if target == self.target:
+            return
+        self.target = target
+        self.direction[:] = 0
+        self.jump[:] = False
+        if target is None:
+            return
+        graph = self.graph
+        cost = {target: 0.0}
+        queue = [(0.0, target)]
+        while queue:
+            reached, b = heapq.heappop(queue)
+            if reached > cost[b]:
+                continue
+            for a, edge_cost in graph.incoming[b]:
+                total = reached + edge_cost
+                if total < cost.get(a, float("inf")):
+                    cost[a] = total
+                    heapq.heappush(queue, (total, a))
+                    kind, direction, takeoff, _ = graph.edges[a, b]
+                    self.direction[a] = direction
+                    self.takeoff[a] = takeoff
+                    self.jump[a] = kind == JUMP
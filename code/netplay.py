@@ -0,0 +1,453 @@
+"""Co-op em dois processos por UDP: o host simula a partida, o cliente manda entrada e desenha.
+
+O host roda o Game de sempre com um segundo jogador (game.partner) controlado
+pela entrada que chega do cliente. A cada quadro ele manda ao cliente o estado
+dos jogadores, zumbis e projéteis perto da câmera do cliente, quantizado em
+inteiros e codificado como diferença contra o último snapshot que o cliente
+confirmou (só linhas novas ou alteradas e os ids que sumiram, comprimidos).
+Um snapshot que não cabe num datagrama perde os zumbis e projéteis mais
+longe da câmera do cliente, com um aviso no console.
+
+O cliente tem o próprio Game (mesmo nível) só para desenhar e prever: move o
+seu jogador na hora com a mesma física (Game.control e Game.move) e, quando
+chega um snapshot, volta ao estado confirmado pelo host e reaplica a entrada
+que o host ainda não processou.
+
+    python code/main.py --host                    # porta padrão em todas as interfaces
+    python code/main.py --connect 127.0.0.1       # em outro terminal
+"""
+import socket
+import struct
+import zlib
+from collections import deque
+
+import numpy as np
+
+from game import SCREEN_WIDTH, NO_INPUT
+from replay import encode_input, decode_input
+from snapshot import PLAYER_ACTIONS, PLAYER_FLAGS, OUTCOMES
+
+DEFAULT_PORT = 47777
+MAGIC = b"ZSN1"
+HELLO, INPUT, SNAPSHOT = range(3)
+POSITION_QUANT = 16  # Posições em 1/16 de pixel
+VELOCITY_QUANT = 256
+COOLDOWN_QUANT = 256
+COUNTER_QUANT = 16
+HISTORY = 64  # Snapshots guardados dos dois lados para servir de base aos deltas
+INPUT_REDUNDANCY = 8  # Cada pacote do cliente repete as últimas entradas (perda de pacotes)
+INPUT_BUFFER = 4  # Entradas acumuladas no host além disso são puladas (limita a latência)
+RELEVANCE_MARGIN = 200  # Pixels além da tela do cliente cujos zumbis e projéteis ele recebe
+CLIENT_TIMEOUT = 5.0  # Segundos sem pacotes até o host aceitar outro cliente
+MAX_DATAGRAM = 65507
+CAP_LOG_INTERVAL = 5.0  # Segundos entre avisos de snapshots cortados
+
+PACKET = struct.Struct("<4sB")  # magic, tipo
+INPUT_HEADER = struct.Struct("<IIB")  # último snapshot recebido, tick da entrada mais nova, quantidade
+# id do snapshot, id da base (0 = completo), última entrada do cliente processada, resultado, mortes
+SNAPSHOT_HEADER = struct.Struct("<IIIBI")
+COUNT = struct.Struct("<I")
+
+HOST, GUEST = range(2)  # uid dos jogadores
+PLAYER_ROW = np.dtype([
+    ("uid", "<u4"), ("x", "<i4"), ("y", "<i4"), ("vel_y", "<i2"), ("cooldown", "u1"),
+    ("counter", "u1"), ("health", "u1"), ("frame", "u1"), ("action", "u1"), ("flags", "u1"),
+])
+ZOMBIE_ROW = np.dtype([
+    ("uid", "<u4"), ("x", "<i4"), ("y", "<i4"), ("action", "u1"), ("frame", "u1"), ("flags", "u1"),
+])
+# uid = dono << 16 | slot no pool
+PROJECTILE_ROW = np.dtype([
+    ("uid", "<u4"), ("x", "<i4"), ("y", "<i4"), ("direction", "i1"), ("speed", "u1"),
+])
+TABLES = (("players", PLAYER_ROW), ("zombies", ZOMBIE_ROW), ("projectiles", PROJECTILE_ROW))
+ZOMBIE_FACING, ZOMBIE_DEAD = 1, 2
+
+
+def quantize(values, quant):
+    return np.rint(np.asarray(values, dtype=np.float64) * quant)
+
+
+def capture_players(game):
+    rows = np.zeros(len(game.players), PLAYER_ROW)
+    for uid, player in enumerate(game.players):
+        flags = sum(1 << bit for bit, name in enumerate(PLAYER_FLAGS) if getattr(player, name))
+        rows[uid] = (
+            uid, quantize(player.x, POSITION_QUANT), quantize(player.y, POSITION_QUANT),
+            quantize(player.vel_y, VELOCITY_QUANT), quantize(player.attack_cooldown, COOLDOWN_QUANT),
+            quantize(player.frame_counter, COUNTER_QUANT), round(player.health), player.frame_index,
+            PLAYER_ACTIONS.index(player.current_action), flags,
+        )
+    return rows
+
+
+def apply_player(player, row):
+    player.x = float(row["x"]) / POSITION_QUANT
+    player.y = float(row["y"]) / POSITION_QUANT
+    player.vel_y = float(row["vel_y"]) / VELOCITY_QUANT
+    player.attack_cooldown = float(row["cooldown"]) / COOLDOWN_QUANT
+    player.frame_counter = float(row["counter"]) / COUNTER_QUANT
+    player.health = int(row["health"])
+    player.frame_index = int(row["frame"])
+    player.current_action = PLAYER_ACTIONS[row["action"]]
+    for bit, name in enumerate(PLAYER_FLAGS):
+        setattr(player, name, bool(row["flags"] >> bit & 1))
+
+
+def capture_zombies(horde, slots, uids):
+    rows = np.zeros(slots.size, ZOMBIE_ROW)
+    rows["uid"] = uids
+    rows["x"] = quantize(horde.x[slots], POSITION_QUANT)
+    rows["y"] = quantize(horde.y[slots], POSITION_QUANT)
+    rows["action"] = horde.action[slots]
+    rows["frame"] = np.minimum(horde.frame_index[slots], 255)
+    rows["flags"] = horde.facing_right[slots] * ZOMBIE_FACING + horde.is_dead[slots] * ZOMBIE_DEAD
+    return np.sort(rows, order="uid")
+
+
+def capture_projectiles(players, left, right):
+    tables = []
+    for owner, player in enumerate(players):
+        pool = player.projectiles
+        idx = np.flatnonzero(pool.alive)
+        idx = idx[(pool.x[idx] >= left) & (pool.x[idx] < right)]
+        rows = np.zeros(idx.size, PROJECTILE_ROW)
+        rows["uid"] = owner << 16 | idx
+        rows["x"] = quantize(pool.x[idx], POSITION_QUANT)
+        rows["y"] = quantize(pool.y[idx], POSITION_QUANT)
+        rows["direction"] = pool.direction[idx]
+        rows["speed"] = pool.speed[idx]
+        tables.append(rows)
+    return np.concatenate(tables)
+
+
+def diff(rows, base):
+    """Linhas de `rows` novas ou diferentes em `base` e uids de `base` que sumiram (ordenados por uid)."""
+    if base is None or not len(base):
+        return rows, np.zeros(0, "<u4")
+    pos = np.minimum(np.searchsorted(base["uid"], rows["uid"]), len(base) - 1)
+    same = (base["uid"][pos] == rows["uid"]) & (base[pos] == rows)
+    removed = np.setdiff1d(base["uid"], rows["uid"], assume_unique=True)
+    return rows[~same], removed.astype("<u4")
+
+
+def patch(base, changed, removed):
+    """Inverso de diff(): aplica as linhas alteradas e as remoções a `base`."""
+    keep = ~np.isin(base["uid"], removed) & ~np.isin(base["uid"], changed["uid"])
+    return np.sort(np.concatenate((base[keep], changed)), order="uid")
+
+
+def encode(state, base):
+    parts = []
+    for name, _ in TABLES:
+        changed, removed = diff(state[name], None if base is None else base[name])
+        parts += [COUNT.pack(len(changed)), changed.tobytes(), COUNT.pack(len(removed)), removed.tobytes()]
+    return zlib.compress(b"".join(parts), 1)
+
+
+def decode(data, base):
+    data = memoryview(zlib.decompress(data))
+    offset = 0
+    state = {}
+    for name, dtype in TABLES:
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        changed = np.frombuffer(data, dtype, count, offset).copy()
+        offset += count * dtype.itemsize
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        removed = np.frombuffer(data, "<u4", count, offset)
+        offset += count * 4
+        state[name] = changed if base is None else patch(base[name], changed, removed)
+    return state
+
+
+def _socket(address):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    if address is not None:
+        sock.bind(address)
+    return sock
+
+
+def _receive(sock):
+    """Datagramas pendentes [(tipo, corpo, endereço)] com o magic certo."""
+    packets = []
+    while True:
+        try:
+            data, address = sock.recvfrom(MAX_DATAGRAM)
+        except BlockingIOError:
+            return packets
+        except ConnectionResetError:
+            # No Windows um datagrama recusado pelo outro lado aparece aqui
+            continue
+        if len(data) >= PACKET.size:
+            magic, kind = PACKET.unpack_from(data)
+            if magic == MAGIC:
+                packets.append((kind, memoryview(data)[PACKET.size:], address))
+
+
+class NetHost:
+    """Lado autoritativo: recebe a entrada do cliente e envia snapshots para ele."""
+
+    def __init__(self, port=DEFAULT_PORT, bind="0.0.0.0"):
+        self.sock = _socket((bind, port))
+        self.client = None
+        self.last_heard = 0.0
+        self.inputs = {}  # tick do cliente -> byte de entrada ainda não processado
+        self.sent = {}  # id -> estado enviado, base dos próximos deltas
+        self.sequence = 0
+        self._reset()
+        self.bytes_sent = 0
+        self.capped = 0  # Snapshots cortados para caber num datagrama desde o último aviso
+        self.capped_at = None  # Tick do último aviso
+
+    @property
+    def connected(self):
+        return self.client is not None
+
+    def _reset(self):
+        """Começa uma sessão nova (cliente novo ou que reiniciou a partida)."""
+        self.inputs.clear()
+        self.input_tick = 0  # Última entrada do cliente aplicada
+        self.last_input = NO_INPUT
+        self.acked = 0
+        self.sent.clear()
+
+    def poll(self, now):
+        """Lê os pacotes pendentes; o primeiro cliente (ou um novo, após o timeout) vira o parceiro."""
+        for kind, body, address in _receive(self.sock):
+            if address != self.client:
+                if self.client is not None and now - self.last_heard < CLIENT_TIMEOUT:
+                    continue
+                self.client = address
+                self._reset()
+            elif kind == HELLO:
+                self._reset()
+            self.last_heard = now
+            if kind == INPUT and len(body) >= INPUT_HEADER.size:
+                ack, newest, count = INPUT_HEADER.unpack_from(body)
+                self.acked = max(self.acked, ack)
+                bits = body[INPUT_HEADER.size:INPUT_HEADER.size + count]
+                for tick, value in zip(range(newest - len(bits) + 1, newest + 1), bits):
+                    if tick > self.input_tick:
+                        self.inputs[tick] = value
+                if self.input_tick == 0 and self.inputs:
+                    # Primeiro pacote: começa pela entrada mais antiga que chegou
+                    self.input_tick = min(self.inputs) - 1
+
+    def next_input(self):
+        """Entrada do parceiro para o próximo tick; repete a última se a próxima ainda não chegou."""
+        if len(self.inputs) > INPUT_BUFFER:
+            # O cliente está adiantado: descarta as mais antigas para não acumular atraso
+            for tick in sorted(self.inputs)[:-INPUT_BUFFER]:
+                del self.inputs[tick]
+                self.input_tick = tick
+        value = self.inputs.pop(self.input_tick + 1, None)
+        if value is not None:
+            self.input_tick += 1
+            self.last_input = decode_input(value)
+        return self.last_input
+
+    def capture(self, game):
+        """Estado quantizado do que o cliente precisa: os jogadores e o que está perto da câmera dele."""
+        left = game.partner_camera_x - RELEVANCE_MARGIN
+        right = game.partner_camera_x + SCREEN_WIDTH + RELEVANCE_MARGIN
+        horde = game.enemies
+        x = horde.x[:horde.count]
+        slots = np.flatnonzero((x >= left - horde.frame_width) & (x < right))
+        # O número do spawn identifica o zumbi na rede (o slot muda, e a visão é reaproveitada)
+        views = horde.views
+        uids = np.array([views[slot].serial for slot in slots.tolist()], dtype="<u4")
+        return {
+            "players": capture_players(game),
+            "zombies": capture_zombies(horde, slots, uids),
+            "projectiles": capture_projectiles(game.players, left, right),
+        }
+
+    def send(self, game):
+        """Envia um snapshot, em delta contra o último que o cliente confirmou se ele ainda estiver guardado."""
+        if self.client is None or game.partner is None:
+            return
+        state = self.capture(game)
+        self.sequence += 1
+        base_id = self.acked if self.acked in self.sent else 0
+        base = self.sent.get(base_id)
+        header = b"".join((
+            PACKET.pack(MAGIC, SNAPSHOT),
+            SNAPSHOT_HEADER.pack(self.sequence, base_id, self.input_tick,
+                                 OUTCOMES.index(game.outcome), game.zombie_deaths),
+        ))
+        body = encode(state, base)
+        if len(header) + len(body) > MAX_DATAGRAM:
+            state, body = self._cap(state, base, MAX_DATAGRAM - len(header), game, len(body))
+        # A base dos próximos deltas é o que foi enviado de fato
+        self.sent[self.sequence] = state
+        for old in [key for key in self.sent if key <= self.sequence - HISTORY]:
+            del self.sent[old]
+        try:
+            self.bytes_sent += self.sock.sendto(header + body, self.client)
+        except OSError:
+            pass  # UDP: o próximo snapshot tenta de novo
+
+    def _cap(self, state, base, limit, game, size):
+        """Deixa de fora os zumbis e projéteis mais longe da câmera do cliente até o snapshot caber em `limit`."""
+        center = (game.partner_camera_x + SCREEN_WIDTH / 2) * POSITION_QUANT
+        order = {
+            name: np.argsort(np.abs(state[name]["x"] - center), kind="stable")
+            for name in ("zombies", "projectiles")
+        }
+        fraction = 1.0
+        body = None
+        while body is None or len(body) > limit:
+            fraction /= 2
+            capped = dict(state)
+            for name, nearest in order.items():
+                # As linhas continuam em ordem de uid
+                capped[name] = state[name][np.sort(nearest[:int(len(nearest) * fraction)])]
+            body = encode(capped, base)
+        self.capped += 1
+        if self.capped_at is None or game.tick - self.capped_at >= CAP_LOG_INTERVAL * game.tick_rate:
+            print(f"Rede: snapshot de {size} bytes não cabe num datagrama; enviando "
+                  f"{len(capped['zombies'])} de {len(state['zombies'])} zumbis e "
+                  f"{len(capped['projectiles'])} de {len(state['projectiles'])} projéteis "
+                  f"({self.capped} snapshot(s) cortados desde o último aviso)")
+            self.capped = 0
+            self.capped_at = game.tick
+        return capped, body
+
+    def close(self):
+        self.sock.close()
+
+
+class NetClient:
+    """Lado que só manda entrada: prevê o próprio jogador e desenha o estado recebido do host.
+
+    No Game do cliente, `player` é o jogador local e `partner` o do host.
+    """
+
+    def __init__(self, game, host, port=DEFAULT_PORT):
+        self.game = game
+        if game.partner is None:
+            game.add_partner()
+        # Os zumbis criados ao carregar o nível daqui não existem no host
+        game.enemies.load({name: np.zeros(0, dtype) for name, dtype in game.enemies.FIELDS.items()})
+        self.address = (socket.gethostbyname(host), port)
+        self.sock = _socket(None)
+        self.tick = 0
+        self.history = deque()  # (tick, InputState) ainda não confirmados pelo host
+        self.received = {}  # id -> estado decodificado, base para os deltas seguintes
+        self.latest = 0
+        self.state = None
+        self.zombie_deaths = 0
+        self.outcome = None
+        self._send(HELLO, b"")
+
+    @property
+    def connected(self):
+        return self.state is not None
+
+    def _send(self, kind, body):
+        try:
+            self.sock.sendto(PACKET.pack(MAGIC, kind) + body, self.address)
+        except OSError:
+            pass
+
+    def step(self, inputs):
+        """Um tick local: aplica a entrada ao próprio jogador na hora e a envia ao host."""
+        game = self.game
+        player = game.player
+        self.tick += 1
+        self.history.append((self.tick, inputs))
+        player.store_previous()
+        game.prev_camera_x = game.camera_x
+        game.camera_x = game.control(player, inputs, game.camera_x)
+        game.move(player, inputs, game.tick_dt)
+        game.effects.update(game.tick_dt)
+        # Só a própria câmera, e sem mexer nos zumbis: eles vêm do host
+        game.update_stream([(game.camera_x, game.camera_x + SCREEN_WIDTH)], enemies=False)
+        game.tick += 1
+        recent = [encode_input(state) for _, state in list(self.history)[-INPUT_REDUNDANCY:]]
+        self._send(INPUT, INPUT_HEADER.pack(self.latest, self.tick, len(recent)) + bytes(recent))
+
+    def poll(self):
+        """Aplica o snapshot mais novo que chegou; retorna True se algum foi aplicado."""
+        newest = None
+        for kind, body, address in _receive(self.sock):
+            if kind != SNAPSHOT or address != self.address or len(body) < SNAPSHOT_HEADER.size:
+                continue
+            snapshot_id, base_id, input_ack, outcome, deaths = SNAPSHOT_HEADER.unpack_from(body)
+            if snapshot_id <= self.latest or (base_id and base_id not in self.received):
+                continue
+            state = decode(body[SNAPSHOT_HEADER.size:], self.received.get(base_id))
+            self.received[snapshot_id] = state
+            self.latest = snapshot_id
+            newest = state, input_ack, outcome, deaths
+        if newest is None:
+            return False
+        for old in [key for key in self.received if key <= self.latest - HISTORY]:
+            del self.received[old]
+        self.apply(*newest)
+        return True
+
+    def apply(self, state, input_ack, outcome, deaths):
+        game = self.game
+        players = state["players"]
+        partner = game.partner
+        partner.store_previous()
+        apply_player(partner, players[HOST])
+        self._reconcile(players[GUEST], input_ack)
+        self._apply_zombies(state["zombies"])
+        self._apply_projectiles(state["projectiles"])
+        self.state = state
+        self.outcome = OUTCOMES[outcome]
+        self.zombie_deaths = deaths
+
+    def _reconcile(self, row, input_ack):
+        """Volta ao estado confirmado pelo host e reaplica as entradas que ele ainda não viu."""
+        game = self.game
+        player = game.player
+        while self.history and self.history[0][0] <= input_ack:
+            self.history.popleft()
+        prev_x, prev_y = player.prev_x, player.prev_y
+        apply_player(player, row)
+        camera_x = game.camera_x
+        for _, inputs in self.history:
+            # Os tiros já saíram (com efeito) na primeira vez; aqui só o movimento é refeito
+            camera_x = game.control(player, inputs._replace(shoot=False), camera_x)
+            game.move(player, inputs, game.tick_dt)
+        game.camera_x = camera_x
+        player.prev_x, player.prev_y = prev_x, prev_y
+
+    def _apply_zombies(self, rows):
+        horde = self.game.enemies
+        previous = {}
+        if self.state is not None:
+            old = self.state["zombies"]
+            previous = dict(zip(old["uid"].tolist(), zip(old["x"].tolist(), old["y"].tolist())))
+        fields = {name: np.zeros(len(rows), dtype) for name, dtype in horde.FIELDS.items()}
+        fields["x"] = rows["x"] / POSITION_QUANT
+        fields["y"] = rows["y"] / POSITION_QUANT
+        # Posição anterior do mesmo zumbi para a interpolação (a atual se ele acabou de aparecer)
+        prev = [previous.get(uid) for uid in rows["uid"].tolist()]
+        fields["prev_x"] = np.array([p[0] if p else x for p, x in zip(prev, rows["x"].tolist())]) / POSITION_QUANT
+        fields["prev_y"] = np.array([p[1] if p else y for p, y in zip(prev, rows["y"].tolist())]) / POSITION_QUANT
+        fields["action"] = rows["action"]
+        fields["frame_index"] = rows["frame"]
+        fields["facing_right"] = (rows["flags"] & ZOMBIE_FACING) != 0
+        fields["is_dead"] = (rows["flags"] & ZOMBIE_DEAD) != 0
+        horde.load(fields)
+
+    def _apply_projectiles(self, rows):
+        game = self.game
+        # No host o dono 0 é ele mesmo; aqui o jogador do host é o parceiro
+        pools = {HOST: game.partner.projectiles, GUEST: game.player.projectiles}
+        for pool in pools.values():
+            pool.clear()
+        for uid, x, y, direction, speed in zip(
+                rows["uid"].tolist(), (rows["x"] / POSITION_QUANT).tolist(),
+                (rows["y"] / POSITION_QUANT).tolist(), rows["direction"].tolist(), rows["speed"].tolist()):
+            pools[uid >> 16].spawn(x, y, direction, speed)
+
+    def close(self):
+        self.sock.close()
@@ -0,0 +1,188 @@
+import csv
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pygame
+from timing import FrameTimer
+
+PHASES = (
+    "events", "input", "player", "zombie_ai", "zombie_animation", "zombie_physics",
+    "projectiles", "effects", "draw_background", "draw_entities", "draw_hud", "flip",
+)
+COUNTERS = ("zombies", "projectiles", "allocated_bytes", "blocks")  # allocated_bytes é -1 sem a contagem (F6)
+BUDGET_MS = 1000 / 60
+PANEL_WIDTH, PANEL_HEIGHT = 330, 346
+GRAPH_HEIGHT = 80
+GRAPH_SCALE_MS = 2 * BUDGET_MS  # Topo do gráfico
+TEXT_COLOR = (255, 255, 255)
+GRAPH_COLOR = (0, 255, 0)
+SLOW_COLOR = (255, 80, 80)
+BUDGET_COLOR = (255, 255, 0)
+
+
+class AllocationCounter:
+    """Bytes alocados por frame, medidos com tracemalloc enquanto instalado.
+
+    Como no AllocationTracker do allocprof.py, conta o pico acima do início do frame
+    (entra também o que foi liberado dentro dele). Nada da pygame é substituído; os
+    pixels das Surfaces vêm do alocador do SDL e ficam de fora, só os objetos Python
+    delas entram. O tracemalloc deixa o jogo umas duas vezes mais lento, por isso a
+    contagem é ligada à parte e os tempos por fase só valem com ela desligada.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.started = False  # O tracemalloc foi ligado aqui (e não por -X tracemalloc)
+        self.total = 0
+        self.start_bytes = 0
+
+    def install(self):
+        if self.active:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+        self.active = True
+        self.total = 0
+        self.resume()
+
+    def uninstall(self):
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+        self.active = False
+
+    def pause(self):
+        """Guarda o que o frame alocou até aqui; o que vier antes de resume() não conta."""
+        if self.active:
+            self.total += tracemalloc.get_traced_memory()[1] - self.start_bytes
+
+    def resume(self):
+        if self.active:
+            tracemalloc.reset_peak()
+            self.start_bytes = tracemalloc.get_traced_memory()[0]
+
+    def collect(self):
+        """Bytes alocados desde a última coleta, ou -1 se a contagem está desligada."""
+        if not self.active:
+            return -1
+        self.pause()
+        allocated, self.total = self.total, 0
+        self.resume()
+        return allocated
+
+
+class FrameProfiler:
+    """Tempos por fase dos últimos frames em um buffer circular, com overlay e CSV."""
+
+    def __init__(self, capacity=300):
+        self.capacity = capacity
+        self.timer = FrameTimer()
+        self.phase_ms = np.zeros((capacity, len(PHASES)))
+        self.counters = np.zeros((capacity, len(COUNTERS)), dtype=np.int64)
+        self.index = 0
+        self.filled = 0
+        self.enabled = False
+        self.allocations = AllocationCounter()
+        self.blocks = sys.getallocatedblocks()
+        self.font = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.index = self.filled = 0
+        else:
+            self.allocations.uninstall()
+        return self.enabled
+
+    def toggle_allocations(self):
+        """Liga ou desliga a contagem de bytes alocados (tracemalloc) com o overlay aberto."""
+        if self.allocations.active:
+            self.allocations.uninstall()
+        else:
+            self.allocations.install()
+        return self.allocations.active
+
+    def begin_frame(self):
+        self.timer.collect()  # Descarta medições feitas fora de um frame perfilado
+        self.timer.begin()
+        self.blocks = sys.getallocatedblocks()
+        self.allocations.collect()  # O que ficou entre os frames não conta
+
+    def end_frame(self, zombies=0, projectiles=0):
+        """Fecha o frame atual e grava seus tempos na próxima posição do buffer."""
+        totals = self.timer.collect()
+        row = self.index
+        for column, phase in enumerate(PHASES):
+            self.phase_ms[row, column] = totals.get(phase, 0.0) * 1000.0
+        self.counters[row] = (
+            zombies, projectiles, self.allocations.collect(),
+            sys.getallocatedblocks() - self.blocks,
+        )
+        self.index = (row + 1) % self.capacity
+        self.filled = min(self.filled + 1, self.capacity)
+
+    def _ordered(self, array):
+        """Linhas do buffer em ordem cronológica."""
+        if self.filled < self.capacity:
+            return array[:self.filled]
+        return np.roll(array, -self.index, axis=0)
+
+    def frame_totals(self):
+        return self._ordered(self.phase_ms).sum(axis=1)
+
+    def draw(self, screen):
+        """Desenha o painel e retorna o retângulo ocupado (None se ainda não há dados)."""
+        if not self.filled:
+            return None
+        self.allocations.pause()  # O próprio overlay não entra na contagem
+        if self.font is None:
+            self.font = pygame.font.SysFont(None, 18)
+        phase_ms = self._ordered(self.phase_ms)
+        counters = self._ordered(self.counters)
+        totals = phase_ms.sum(axis=1)
+        x0 = screen.get_width() - PANEL_WIDTH - 10
+        y0 = 80
+
+        panel = screen.fill((0, 0, 0), (x0, y0, PANEL_WIDTH, PANEL_HEIGHT))
+        graph_bottom = y0 + 10 + GRAPH_HEIGHT
+        budget_y = graph_bottom - GRAPH_HEIGHT * BUDGET_MS / GRAPH_SCALE_MS
+        pygame.draw.line(screen, BUDGET_COLOR, (x0 + 5, budget_y), (x0 + PANEL_WIDTH - 5, budget_y))
+        recent = totals[-(PANEL_WIDTH - 10):]
+        heights = np.minimum(recent / GRAPH_SCALE_MS, 1.0) * GRAPH_HEIGHT
+        for i, (height, total) in enumerate(zip(heights.tolist(), recent.tolist())):
+            color = SLOW_COLOR if total > BUDGET_MS else GRAPH_COLOR
+            x = x0 + 5 + i
+            pygame.draw.line(screen, color, (x, graph_bottom), (x, graph_bottom - height))
+
+        lines = [
+            f"frame: {totals[-1]:.2f} ms  média {totals.mean():.2f}  máx {totals.max():.2f}",
+        ]
+        averages = phase_ms.mean(axis=0)
+        lines += [f"{phase:<18}{ms:6.2f} ms" for phase, ms in zip(PHASES, averages.tolist())]
+        last = counters[-1].tolist()
+        allocated = f"{last[2] / 1024.0:.1f} KiB" if last[2] >= 0 else "KiB -"
+        lines.append(f"zumbis {last[0]}  projéteis {last[1]}  {allocated}  blocos {last[3]:+d}")
+        lines.append("F3 fecha   F4 salva CSV   F6 alocações")
+        y = graph_bottom + 8
+        for line in lines:
+            screen.blit(self.font.render(line, True, TEXT_COLOR), (x0 + 8, y))
+            y += 16
+        self.allocations.resume()
+        return panel
+
+    def dump_csv(self, path=None):
+        """Grava o buffer (um frame por linha) em CSV e retorna o caminho."""
+        if path is None:
+            path = time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        phase_ms = self._ordered(self.phase_ms)
+        counters = self._ordered(self.counters)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame", "total_ms") + PHASES + COUNTERS)
+            for i, (phases, counts) in enumerate(zip(phase_ms.tolist(), counters.tolist())):
+                writer.writerow(
+                    [i, f"{sum(phases):.4f}"] + [f"{ms:.4f}" for ms in phases] + counts
+                )
+        return path
@@ -0,0 +1,115 @@
+import pygame
+import numpy as np
+from spatial import overlaps
+
+PROJECTILE_WIDTH = 10
+PROJECTILE_HEIGHT = 5
+PROJECTILE_COLOR = (255, 0, 0)
+
+
+class ProjectilePool:
+    """Projéteis em arrays NumPy de capacidade fixa, com reaproveitamento de slots."""
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.direction = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Pilha de slots livres: o próximo disparo reutiliza o último slot liberado
+        self.free = list(range(capacity - 1, -1, -1))
+        self.image = pygame.Surface((PROJECTILE_WIDTH, PROJECTILE_HEIGHT))
+        self.image.fill(PROJECTILE_COLOR)
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+    def spawn(self, x, y, direction, speed=10, lifetime=30):
+        """Cria um projétil e retorna seu slot (ou -1 se o pool estiver cheio)."""
+        if not self.free:
+            return -1
+        i = self.free.pop()
+        self.x[i] = x
+        self.y[i] = y
+        self.direction[i] = direction
+        self.speed[i] = speed
+        self.lifetime[i] = lifetime
+        self.alive[i] = True
+        return i
+
+    def kill(self, indices):
+        indices = np.asarray(indices, dtype=np.intp)
+        if indices.size:
+            self.alive[indices] = False
+            self.free.extend(indices.tolist())
+
+    def clear(self):
+        self.kill(np.flatnonzero(self.alive))
+
+    def update(self, dt):
+        """Move todos os projéteis vivos e consome seu tempo de vida num único passo."""
+        alive = self.alive
+        # speed é em pixels por frame de 60 Hz
+        self.x[alive] += self.speed[alive] * self.direction[alive] * (dt * 60)
+        self.lifetime[alive] -= dt
+
+    def sprites(self, camera_x=0, alpha=1.0, dt=1 / 60, view=(800, 600)):
+        """Lista (imagem, posição) dos projéteis visíveis numa tela de tamanho `view`."""
+        idx = np.flatnonzero(self.alive)
+        if not idx.size:
+            return []
+        image = self.image
+        # Recua cada projétil a fração do tick que ainda não foi exibida
+        back = self.speed[idx] * self.direction[idx] * (dt * 60) * (1.0 - alpha)
+        xs = self.x[idx] - back - camera_x
+        ys = self.y[idx]
+        visible = (xs > -PROJECTILE_WIDTH) & (xs < view[0]) & (ys > -PROJECTILE_HEIGHT) & (ys < view[1])
+        return [(image, (x, y)) for x, y in zip(xs[visible].tolist(), ys[visible].tolist())]
+
+    def draw(self, screen, camera_x=0, alpha=1.0, dt=1 / 60):
+        """Desenha todos os projéteis vivos e retorna os retângulos de tela alterados."""
+        return screen.blits(self.sprites(camera_x, alpha, dt, screen.get_size()))
+
+    def collide(self, view_left, view_right, platforms, enemies):
+        """Remove projéteis fora da tela, expirados ou que acertaram algo.
+
+        Retorna a lista de zumbis atingidos (um item por projétil que acertou).
+        """
+        idx = np.flatnonzero(self.alive)
+        if not idx.size:
+            return []
+        x = self.x[idx]
+        expired = (x < view_left - PROJECTILE_WIDTH) | (x > view_right + PROJECTILE_WIDTH)
+        expired |= self.lifetime[idx] <= 0
+        self.kill(idx[expired])
+        idx = idx[~expired]
+        if not idx.size:
+            return []
+
+        # Mesmo arredondamento de pygame.Rect (trunca em direção a zero)
+        left = np.trunc(self.x[idx])
+        top = np.trunc(self.y[idx])
+        right = left + PROJECTILE_WIDTH
+        bottom = top + PROJECTILE_HEIGHT
+
+        bounds = platforms.bounds(left.min(), right.max())
+        if len(bounds):
+            hit_platform = overlaps(left, top, right, bottom, bounds).any(axis=1)
+            self.kill(idx[hit_platform])
+            keep = ~hit_platform
+            idx, left, top, right, bottom = idx[keep], left[keep], top[keep], right[keep], bottom[keep]
+        if not idx.size:
+            return []
+
+        slots, boxes = enemies.hitboxes(left.min(), right.max())
+        if not slots.size:
+            return []
+
+        hits = overlaps(left, top, right, bottom, boxes)
+        hit_any = hits.any(axis=1)
+        # Cada projétil acerta apenas o primeiro zumbi da horda
+        first = slots[hits.argmax(axis=1)[hit_any]]
+        self.kill(idx[hit_any])
+        return [enemies.views[slot] for slot in first.tolist()]
@@ -0,0 +1,110 @@
+from collections import OrderedDict
+import pygame
+from background import COLORKEY
+from game import PLATFORM_COLOR
+
+TILE_WIDTH = 512
+MAX_TILES = 8
+MAX_DIRTY_RECTS = 128  # Acima disso redesenhar a tela inteira sai mais barato
+
+
+class LevelLayer:
+    """Fundo e plataformas do nível, com as plataformas pré-renderizadas em faixas do mundo.
+
+    As plataformas rolam junto com a câmera e ficam em faixas verticais com
+    colorkey, geradas sob demanda; o fundo rola em camadas com velocidades
+    diferentes e é desenhado a cada posição. Com a câmera rolando o nível vai
+    direto para a tela; a cópia composta (`surface`) só é montada quando a câmera
+    para e há áreas a restaurar.
+    """
+
+    def __init__(self, background, platforms, size, tile_width=TILE_WIDTH, max_tiles=MAX_TILES):
+        self.background = background
+        self.platforms = platforms
+        self.size = size
+        self.tile_width = tile_width
+        self.max_tiles = max_tiles
+        self.tiles = OrderedDict()
+        self.surface = None
+        self.camera_x = None
+
+    def tile(self, index):
+        tile = self.tiles.get(index)
+        if tile is not None:
+            self.tiles.move_to_end(index)
+            return tile
+        left = index * self.tile_width
+        tile = pygame.Surface((self.tile_width, self.size[1])).convert()
+        tile.fill(COLORKEY)
+        for platform_left, top, right, bottom in self.platforms.bounds(left, left + self.tile_width).tolist():
+            pygame.draw.rect(tile, PLATFORM_COLOR, (platform_left - left, top, right - platform_left, bottom - top))
+        tile.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        self.tiles[index] = tile
+        if len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+        return tile
+
+    def draw(self, screen, camera_x):
+        """Desenha o nível inteiro visto de camera_x."""
+        screen.fill((0, 0, 0))
+        self.background.draw(screen, camera_x)
+        width = self.tile_width
+        right = camera_x + screen.get_width()
+        for index in range(camera_x // width, (right - 1) // width + 1):
+            screen.blit(self.tile(index), (index * width - camera_x, 0))
+
+    def blit(self, screen, camera_x, rect):
+        """Copia para a tela a área `rect` (coordenadas de tela) do nível visto de camera_x."""
+        if camera_x != self.camera_x:
+            if self.surface is None:
+                self.surface = pygame.Surface(self.size).convert()
+            self.draw(self.surface, camera_x)
+            self.camera_x = camera_x
+        rect = rect.clip(screen.get_rect())
+        screen.blit(self.surface, rect.topleft, rect)
+
+
+class DirtyRenderer:
+    """Renderizador alternativo: com a câmera parada só restaura e redesenha o que mudou.
+
+    Quando a câmera rola (ou há sprites demais), o quadro é redesenhado inteiro a partir
+    das faixas pré-renderizadas do nível e deve ser enviado com pygame.display.flip().
+    """
+
+    def __init__(self):
+        self.level = None
+        self.camera_x = None
+        self.dirty = []  # Áreas a apagar no próximo quadro
+
+    def reset(self):
+        """Força um redesenho completo no próximo quadro (ex.: depois de trocar de tela)."""
+        self.camera_x = None
+        self.dirty = []
+
+    def draw(self, game, screen, alpha=1.0):
+        """Desenha o quadro e retorna os retângulos para display.update, ou None para flip."""
+        level = self.level
+        if level is None or level.platforms is not game.platforms or level.background is not game.background:
+            level = self.level = LevelLayer(game.background, game.platforms, screen.get_size())
+            self.camera_x = None
+
+        camera_x = game.view_camera(alpha)
+        if camera_x != self.camera_x or len(self.dirty) > MAX_DIRTY_RECTS:
+            level.draw(screen, camera_x)
+            game.timer.lap("draw_background")
+            self.dirty = game.draw_sprites(screen, camera_x, alpha)
+            self.camera_x = camera_x
+            return None
+
+        previous = self.dirty
+        for rect in previous:
+            level.blit(screen, camera_x, rect)
+        game.timer.lap("draw_background")
+        self.dirty = game.draw_sprites(screen, camera_x, alpha)
+        return previous + self.dirty
+
+    def add_dirty(self, rect, updates=None):
+        """Registra uma área desenhada por fora (ex.: overlay do perfil) para ser apagada depois."""
+        self.dirty.append(rect)
+        if updates is not None:
+            updates.append(rect)
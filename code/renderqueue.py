@@ -0,0 +1,28 @@
+# Camadas dos sprites do mundo, na ordem em que são desenhadas
+PROJECTILES, ENEMIES, PLAYER, EFFECTS = range(4)
+
+
+class RenderQueue:
+    """Sprites do mundo de um quadro, separados por camada e desenhados num único blits.
+
+    Cada sistema envia só o que está dentro da tela (o recorte é feito por ele,
+    que conhece o tamanho das próprias imagens); a fila garante a ordem entre as
+    camadas, independente da ordem em que os sistemas enviam.
+    """
+
+    def __init__(self, layers=EFFECTS + 1):
+        self.layers = [[] for _ in range(layers)]
+
+    def submit(self, layer, blits):
+        """Acrescenta uma lista de (imagem, posição) à camada."""
+        self.layers[layer] += blits
+
+    def flush(self, screen):
+        """Desenha tudo, esvazia a fila e retorna os retângulos alterados."""
+        batch = []
+        for layer in self.layers:
+            batch += layer
+            layer.clear()
+        if not batch:
+            return []
+        return screen.blits(batch)
@@ -0,0 +1,188 @@
+"""Gravação da entrada por tick e reprodução headless, com snapshots para saltar no tempo.
+
+Uso (a partir da raiz do repositório):
+    python code/main.py --record partida.rpl            # grava enquanto joga
+    python code/replay.py partida.rpl                   # reproduz o mais rápido possível
+    python code/replay.py partida.rpl --seek 600 --ticks 300 --profile
+"""
+import os
+
+# Precisa ser definido antes de importar o pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import hashlib
+import struct
+import sys
+import zlib
+from time import perf_counter
+
+import pygame
+
+import snapshot
+from game import Game, InputState, SCREEN_WIDTH, SCREEN_HEIGHT
+from timing import FrameTimer
+
+MAGIC = b"ZSRP"
+# 2: horda com nav_dir nos snapshots; 3: modo sobrevivência no cabeçalho; 4: gravidade em forma
+# fechada (a 60 Hz nada muda, então replays 3 nessa taxa continuam valendo)
+VERSION = 4
+SNAPSHOT_INTERVAL = 10.0  # Segundos de jogo entre snapshots
+# versão, ticks por segundo, ticks por snapshot, tamanho do caminho do nível, sobrevivência
+HEADER = struct.Struct("<HHII?")
+SNAPSHOT_HEADER = struct.Struct("<qI")  # tick, bytes comprimidos
+COUNT = struct.Struct("<I")
+
+
+def encode_input(inputs):
+    """InputState -> um byte (um bit por tecla, na ordem dos campos)."""
+    return sum(1 << bit for bit, pressed in enumerate(inputs) if pressed)
+
+
+def decode_input(bits):
+    return InputState(*(bool(bits >> bit & 1) for bit in range(len(InputState._fields))))
+
+
+class ReplayRecorder:
+    """Acumula a entrada de cada tick e snapshots periódicos de uma partida."""
+
+    def __init__(self, game, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.level_path = game.level.path
+        self.tick_rate = game.tick_rate
+        self.survival = game.director is not None
+        self.snapshot_ticks = max(1, round(snapshot_interval * game.tick_rate))
+        self.first_tick = game.tick
+        self.inputs = bytearray()
+        self.snapshots = []  # [(tick, bytes comprimidos)]
+
+    def record(self, game, inputs):
+        """Chamado antes de cada game.step(inputs)."""
+        if (game.tick - self.first_tick) % self.snapshot_ticks == 0:
+            self.snapshots.append((game.tick, zlib.compress(snapshot.capture(game), 1)))
+        self.inputs.append(encode_input(inputs))
+
+    def rewind(self, game):
+        """Descarta o que foi gravado depois de game.tick (ex.: após carregar um checkpoint)."""
+        del self.inputs[game.tick - self.first_tick:]
+        self.snapshots = [(tick, data) for tick, data in self.snapshots if tick < game.tick]
+        # O estado carregado não veio da entrada gravada: vira um snapshot de partida
+        self.snapshots.append((game.tick, zlib.compress(snapshot.capture(game), 1)))
+
+    def save(self, path):
+        level = self.level_path.encode()
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(HEADER.pack(VERSION, self.tick_rate, self.snapshot_ticks, len(level), self.survival))
+            f.write(level)
+            f.write(struct.pack("<q", self.first_tick))
+            f.write(COUNT.pack(len(self.inputs)))
+            f.write(self.inputs)
+            f.write(COUNT.pack(len(self.snapshots)))
+            for tick, data in self.snapshots:
+                f.write(SNAPSHOT_HEADER.pack(tick, len(data)))
+                f.write(data)
+
+
+class Replay:
+    """Replay lido do disco: entrada de cada tick e snapshots para seek."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} não é um replay")
+        offset = len(MAGIC)
+        version, = struct.unpack_from("<H", data, offset)
+        if version not in (3, VERSION):
+            raise ValueError(f"versão de replay não suportada: {version}")
+        _, self.tick_rate, self.snapshot_ticks, level_size, self.survival = HEADER.unpack_from(data, offset)
+        if version == 3 and self.tick_rate != 60:
+            raise ValueError(f"replay da versão 3 a {self.tick_rate} Hz: a física mudou fora dos 60 Hz")
+        offset += HEADER.size
+        self.level_path = data[offset:offset + level_size].decode()
+        offset += level_size
+        (self.first_tick,) = struct.unpack_from("<q", data, offset)
+        offset += 8
+        (size,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        self.inputs = data[offset:offset + size]
+        offset += size
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        self.snapshots = []
+        for _ in range(count):
+            tick, size = SNAPSHOT_HEADER.unpack_from(data, offset)
+            offset += SNAPSHOT_HEADER.size
+            self.snapshots.append((tick, data[offset:offset + size]))
+            offset += size
+
+    @property
+    def last_tick(self):
+        return self.first_tick + len(self.inputs)
+
+    def new_game(self):
+        return Game(self.tick_rate, self.level_path, self.survival)
+
+    def seek(self, game, tick):
+        """Restaura o snapshot mais próximo antes de `tick` e simula o restante."""
+        tick = min(max(tick, self.first_tick), self.last_tick)
+        base, data = max((s for s in self.snapshots if s[0] <= tick), key=lambda s: s[0])
+        snapshot.restore(game, zlib.decompress(data))
+        self.run(game, tick - base)
+
+    def run(self, game, ticks=None, screen=None):
+        """Avança `ticks` ticks (todos os restantes por padrão), desenhando se houver tela."""
+        end = self.last_tick if ticks is None else min(self.last_tick, game.tick + ticks)
+        inputs = self.inputs
+        first = self.first_tick
+        while game.tick < end and not game.outcome:
+            game.step(decode_input(inputs[game.tick - first]))
+            if screen is not None:
+                game.draw(screen)
+
+
+def state_hash(game):
+    """Resumo do estado, para comparar duas execuções do mesmo replay."""
+    return hashlib.md5(snapshot.capture(game)).hexdigest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reprodução headless de replays do Zumbi Survival")
+    parser.add_argument("replay", help="arquivo gravado com main.py --record")
+    parser.add_argument("--seek", type=float, default=0.0, help="segundo de jogo em que começar")
+    parser.add_argument("--ticks", type=int, help="quantos ticks reproduzir depois do seek")
+    parser.add_argument("--draw", action="store_true", help="desenha cada tick (mede também a renderização)")
+    parser.add_argument("--profile", action="store_true", help="mostra o tempo por fase")
+    args = parser.parse_args(argv)
+
+    replay = Replay(args.replay)
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = replay.new_game()
+
+    start = perf_counter()
+    replay.seek(game, replay.first_tick + round(args.seek * replay.tick_rate))
+    seek_time = perf_counter() - start
+    timer = FrameTimer()
+    if args.profile:
+        game.timer = timer
+    start_tick = game.tick
+    start = perf_counter()
+    replay.run(game, args.ticks, screen if args.draw else None)
+    elapsed = perf_counter() - start
+    ticks = game.tick - start_tick
+    pygame.quit()
+
+    print(f"seek até o tick {start_tick} em {seek_time * 1000:.1f} ms")
+    print(f"{ticks} ticks em {elapsed:.2f} s "
+          f"({ticks / replay.tick_rate / max(elapsed, 1e-9):.1f}x tempo real)")
+    print(f"estado final: tick {game.tick}, {game.outcome or 'em jogo'}, hash {state_hash(game)}")
+    if args.profile and ticks:
+        for phase, seconds in sorted(timer.collect().items(), key=lambda item: -item[1]):
+            print(f"  {phase:<18}{seconds * 1000 / ticks:8.3f} ms/tick")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+import numpy as np
+
+ACTIVE, NEARBY, ASLEEP = range(3)
+ACTIVE_MARGIN = 200  # Pixels além da borda da tela com simulação a cada tick
+NEARBY_MARGIN = 1200  # Até aqui, simulação a cada REDUCED_INTERVAL ticks; depois disso dorme
+REDUCED_INTERVAL = 4
+
+
+class ActivityScheduler:
+    """Nível de detalhe da simulação dos zumbis conforme a distância até a câmera.
+
+    Zumbis ativos rodam todo tick. Os próximos rodam um tick a cada `interval`,
+    com o dt acumulado desde a última vez (escalonados pelo slot para dividir o
+    custo). Os distantes ficam congelados até a câmera se aproximar. O tempo
+    pendente fica na própria horda (pending_ticks) e é aplicado quando o zumbi
+    volta a rodar, então mudar de faixa não perde nem duplica tempo.
+    """
+
+    def __init__(self, active_margin=ACTIVE_MARGIN, nearby_margin=NEARBY_MARGIN,
+                 interval=REDUCED_INTERVAL):
+        self.active_margin = active_margin
+        self.nearby_margin = nearby_margin
+        self.interval = interval
+
+    def tiers(self, horde, view_left, view_right):
+        """Faixa (ACTIVE, NEARBY ou ASLEEP) de cada slot ocupado da horda."""
+        x = horde.x[:horde.count]
+        distance = np.maximum(np.maximum(view_left - x, x - view_right), 0)
+        return np.where(
+            distance <= self.active_margin, ACTIVE,
+            np.where(distance <= self.nearby_margin, NEARBY, ASLEEP),
+        )
+
+    def plan(self, horde, view_left, view_right, tick, dt):
+        """Retorna [(dt, slots)] a simular neste tick, agrupados pelo tempo acumulado."""
+        tiers = self.tiers(horde, view_left, view_right)
+        pending = horde.pending_ticks[:horde.count]
+        awake = tiers != ASLEEP
+        pending[awake] += 1
+        slots = np.arange(horde.count)
+        due = (tiers == ACTIVE) | ((tiers == NEARBY) & (slots % self.interval == tick % self.interval))
+        due_slots = slots[due]
+        ticks = pending[due_slots]
+        pending[due_slots] = 0
+        if not due_slots.size:
+            return []
+        if ticks.min() == ticks.max():
+            return [(int(ticks[0]) * dt, due_slots)]
+        return [(k * dt, due_slots[ticks == k]) for k in np.unique(ticks).tolist()]
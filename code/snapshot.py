@@ -0,0 +1,190 @@
+"""Estado completo de uma partida em bytes, para replays e saves.
+
+Só o que muda durante a partida é gravado (imagens, fontes e o nível em disco
+vêm do Game em que o estado é restaurado, que precisa usar o mesmo nível).
+"""
+import struct
+import zlib
+import numpy as np
+
+MAGIC = b"ZSS1"
+PLAYER_ACTIONS = ("idle", "walk", "run", "shoot", "dead")
+OUTCOMES = (None, "loser", "victory")
+PLAYER_FLAGS = (
+    "is_jumping", "is_running", "is_shooting", "facing_right",
+    "is_animating", "is_dead", "is_attacking",
+)
+PROJECTILE_FIELDS = ("x", "y", "direction", "speed", "lifetime")
+
+# tick, camera_x, prev_camera_x, death_timer, zombie_deaths, outcome
+GAME_RECORD = struct.Struct("<qdddiB")
+# x, y, prev_x, prev_y, vel_y, attack_cooldown, frame_counter, health, frame_index, ação, flags
+PLAYER_RECORD = struct.Struct("<7diiBB")
+COUNT = struct.Struct("<i")
+
+
+class _Writer:
+    def __init__(self):
+        self.parts = [MAGIC]
+
+    def record(self, layout, *values):
+        self.parts.append(layout.pack(*values))
+
+    def array(self, values, dtype):
+        values = np.ascontiguousarray(values, dtype=dtype)
+        self.parts.append(COUNT.pack(values.size))
+        self.parts.append(values.tobytes())
+
+    def fields(self, rows, fields):
+        """Grava {campo: array} da horda, todos com o mesmo comprimento."""
+        for name, dtype in fields.items():
+            self.array(rows[name], dtype)
+
+    def getvalue(self):
+        return b"".join(self.parts)
+
+
+class _Reader:
+    def __init__(self, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("snapshot inválido")
+        self.data = memoryview(data)
+        self.offset = len(MAGIC)
+
+    def record(self, layout):
+        values = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.size
+        return values
+
+    def array(self, dtype):
+        (size,) = self.record(COUNT)
+        dtype = np.dtype(dtype)
+        values = np.frombuffer(self.data, dtype, size, self.offset).copy()
+        self.offset += size * dtype.itemsize
+        return values
+
+    def fields(self, fields):
+        return {name: self.array(dtype) for name, dtype in fields.items()}
+
+
+def capture(game):
+    """Serializa o estado dinâmico da partida."""
+    out = _Writer()
+    player = game.player
+    out.record(
+        GAME_RECORD, game.tick, game.camera_x, game.prev_camera_x, game.death_timer,
+        game.zombie_deaths, OUTCOMES.index(game.outcome),
+    )
+    flags = sum(1 << bit for bit, name in enumerate(PLAYER_FLAGS) if getattr(player, name))
+    out.record(
+        PLAYER_RECORD, player.x, player.y, player.prev_x, player.prev_y, player.vel_y,
+        player.attack_cooldown, player.frame_counter, player.health, player.frame_index,
+        PLAYER_ACTIONS.index(player.current_action), flags,
+    )
+
+    pool = player.projectiles
+    alive = np.flatnonzero(pool.alive)
+    out.array(alive, np.int32)
+    for name in PROJECTILE_FIELDS:
+        out.array(getattr(pool, name)[alive], np.float64)
+    out.array(pool.free, np.int32)
+
+    enemies = game.enemies
+    fields = enemies.FIELDS
+    out.fields({name: getattr(enemies, name)[:enemies.count] for name in fields}, fields)
+
+    stream = game.stream
+    out.array(sorted(stream.spawned), np.int32)
+    parked = [(index, rows) for index, groups in sorted(stream.parked.items()) for rows in groups]
+    out.array([index for index, _ in parked], np.int32)
+    for _, rows in parked:
+        out.fields(rows, fields)
+    return out.getvalue()
+
+
+def restore(game, data):
+    """Aplica em `game` um estado gerado por capture()."""
+    source = _Reader(data)
+    player = game.player
+    (game.tick, game.camera_x, game.prev_camera_x, game.death_timer,
+     game.zombie_deaths, outcome) = source.record(GAME_RECORD)
+    game.outcome = OUTCOMES[outcome]
+    (player.x, player.y, player.prev_x, player.prev_y, player.vel_y,
+     player.attack_cooldown, player.frame_counter, player.health, player.frame_index,
+     action, flags) = source.record(PLAYER_RECORD)
+    player.current_action = PLAYER_ACTIONS[action]
+    for bit, name in enumerate(PLAYER_FLAGS):
+        setattr(player, name, bool(flags >> bit & 1))
+
+    pool = player.projectiles
+    alive = source.array(np.int32)
+    pool.alive[:] = False
+    pool.alive[alive] = True
+    for name in PROJECTILE_FIELDS:
+        getattr(pool, name)[alive] = source.array(np.float64)
+    pool.free = source.array(np.int32).tolist()
+
+    enemies = game.enemies
+    fields = enemies.FIELDS
+    enemies.load(source.fields(fields))
+
+    stream = game.stream
+    stream.spawned = set(source.array(np.int32).tolist())
+    stream.parked = {}
+    for index in source.array(np.int32).tolist():
+        stream.parked.setdefault(index, []).append(source.fields(fields))
+    game.effects.clear()  # Efeitos só visuais, da linha do tempo abandonada
+    # A horda capturada é a da faixa de chunks da câmera salva: com a mesma faixa carregada,
+    # plataformas e grafo continuam valendo; senão só os chunks que faltam são lidos, sem repetir spawns
+    game.update_stream()
+
+
+def delta(base, state):
+    """Codifica `state` como XOR contra `base` comprimido (quase tudo zero se pouco mudou)."""
+    size = max(len(base), len(state))
+    xor = np.frombuffer(state.ljust(size, b"\0"), np.uint8) ^ np.frombuffer(base.ljust(size, b"\0"), np.uint8)
+    return COUNT.pack(len(state)) + zlib.compress(xor.tobytes(), 1)
+
+
+def apply_delta(base, data):
+    (length,) = COUNT.unpack_from(data)
+    xor = np.frombuffer(zlib.decompress(data[COUNT.size:]), np.uint8)
+    base = np.frombuffer(base.ljust(xor.size, b"\0"), np.uint8)
+    return (base ^ xor).tobytes()[:length]
+
+
+class Checkpoints:
+    """Checkpoints em memória: um snapshot completo e deltas contra ele.
+
+    Um novo snapshot completo é tirado quando o delta passa de `rebase_ratio` do
+    tamanho do completo, então cada checkpoint custa poucas centenas de bytes.
+    """
+
+    def __init__(self, rebase_ratio=0.25, keep=32):
+        self.rebase_ratio = rebase_ratio
+        self.keep = keep
+        self.base = None
+        self.entries = []  # [(tick, delta contra base)]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def save(self, game):
+        """Guarda o estado atual e retorna quantos bytes o checkpoint ocupa."""
+        state = capture(game)
+        if self.base is not None:
+            encoded = delta(self.base, state)
+            if len(encoded) <= len(self.base) * self.rebase_ratio:
+                self.entries.append((game.tick, encoded))
+                del self.entries[:-self.keep]
+                return len(encoded)
+        self.base = state
+        self.entries = [(game.tick, delta(state, state))]
+        return len(state)
+
+    def load(self, game):
+        """Restaura o checkpoint mais recente; retorna False se não houver nenhum."""
+        if not self.entries:
+            return False
+        restore(game, apply_delta(self.base, self.entries[-1][1]))
+        return True
@@ -0,0 +1,158 @@
+import pygame
+import numpy as np
+
+CELL_WIDTH = 256
+BATCH_SHARED = 2  # Até quantas vezes as candidatas de um retângulo o lote todo ainda usa uma linha só
+
+
+def overlaps(left, top, right, bottom, boxes):
+    """Matriz (retângulos x caixas) com o mesmo critério de Rect.colliderect."""
+    return (
+        (left[:, None] < boxes[None, :, 2])
+        & (boxes[None, :, 0] < right[:, None])
+        & (top[:, None] < boxes[None, :, 3])
+        & (boxes[None, :, 1] < bottom[:, None])
+    )
+
+
+class PlatformIndex:
+    """Índice espacial estático (grade de colunas em x) para as plataformas do nível."""
+
+    def __init__(self, platforms, cell_width=CELL_WIDTH):
+        self.platforms = list(platforms)
+        self.rects = [pygame.Rect(*platform) for platform in self.platforms]
+        self.edges = np.array(
+            [(r.left, r.top, r.right, r.bottom) for r in self.rects], dtype=np.float64
+        ).reshape(-1, 4)
+        self.cell_width = cell_width
+        self.cells = {}
+        for i, rect in enumerate(self.rects):
+            for col in range(rect.left // cell_width, (rect.right - 1) // cell_width + 1):
+                self.cells.setdefault(col, []).append(i)
+        # As mesmas colunas numa tabela (coluna x plataformas) para os lotes, completada com -1
+        self.first_column = min(self.cells, default=0)
+        columns = max(self.cells, default=0) - self.first_column + 1
+        depth = max(map(len, self.cells.values()), default=1)
+        self.column_indices = np.full((columns, depth), -1, dtype=np.intp)
+        for col, found in self.cells.items():
+            self.column_indices[col - self.first_column, :len(found)] = found
+        # Plataformas acumuladas coluna a coluna: limite do que um trecho de colunas contém
+        self.column_counts = np.concatenate(([0], np.cumsum((self.column_indices >= 0).sum(axis=1)))).tolist()
+        # Bordas de cada lado com uma caixa que nada toca no fim, onde caem os -1 da tabela
+        self.padded_edges = [
+            np.append(self.edges[:, i], empty) for i, empty in enumerate((np.inf, np.inf, -np.inf, -np.inf))
+        ]
+
+    def __iter__(self):
+        return iter(self.rects)
+
+    def __len__(self):
+        return len(self.rects)
+
+    def _candidates(self, left, right):
+        """Índices (em ordem do nível) das plataformas nas colunas entre left e right."""
+        first = int(left) // self.cell_width
+        last = int(right) // self.cell_width
+        if first == last:
+            return self.cells.get(first, ())
+        found = set()
+        for col in range(first, last + 1):
+            found.update(self.cells.get(col, ()))
+        return sorted(found)
+
+    def indices(self, left, right):
+        """Array com os índices (em ordem do nível) das plataformas entre left e right."""
+        return np.array(self._candidates(left, right), dtype=np.intp)
+
+    def bounds(self, left, right):
+        """Array (n, 4) com left/top/right/bottom das plataformas entre left e right."""
+        return self.edges[list(self._candidates(left, right))]
+
+    def colliding_indices(self, rect):
+        rects = self.rects
+        return [i for i in self._candidates(rect.left, rect.right) if rects[i].colliderect(rect)]
+
+    def colliding(self, rect):
+        """Plataformas que se sobrepõem ao retângulo, na mesma ordem da lista original."""
+        rects = self.rects
+        return [rects[i] for i in self._candidates(rect.left, rect.right) if rects[i].colliderect(rect)]
+
+    def platform_under(self, point):
+        """Índice da última plataforma cujo topo está exatamente sob o ponto, ou None."""
+        x, y = point
+        found = None
+        for i in self._candidates(x, x):
+            rect = self.rects[i]
+            if rect.top == y and rect.collidepoint(point):
+                found = i
+        return found
+
+    def below(self, x, y):
+        """Índice da plataforma mais alta com topo em y ou abaixo na coluna x, ou None."""
+        found = None
+        for i in self._candidates(x, x):
+            rect = self.rects[i]
+            if rect.left <= x < rect.right and rect.top >= y and (
+                    found is None or rect.top < self.rects[found].top):
+                found = i
+        return found
+
+    def support(self, rect):
+        """Índice da plataforma em que o retângulo está encostado ou apoiado, ou None."""
+        colliding = self.colliding_indices(rect)
+        found = colliding[-1] if colliding else None
+        under = self.platform_under(rect.midbottom)
+        if under is not None and (found is None or under > found):
+            found = under
+        return found
+
+    def _batch_hits(self, left, top, right, bottom, support=False):
+        """(candidatas, acertos) de um lote: cada retângulo é testado contra as plataformas das suas colunas.
+
+        Montar uma linha por retângulo tem custo fixo; enquanto as colunas do lote todo têm
+        até BATCH_SHARED vezes as plataformas de uma dessas linhas, uma linha só serve para
+        todos. Com support, o apoio pelo meio da base também conta.
+        """
+        width = self.cell_width
+        counts = self.column_counts
+        low, high = left.min(), right.max()
+        span = int((right - left).max()) // width + 2  # Colunas que um retângulo do lote pode ocupar
+        first_column = min(max(int(low) // width - self.first_column, 0), len(counts) - 1)
+        last_column = min(max(int(high) // width - self.first_column + 1, first_column), len(counts) - 1)
+        if counts[last_column] - counts[first_column] <= BATCH_SHARED * span * self.column_indices.shape[1]:
+            candidates = np.asarray(self._candidates(low, high), dtype=np.intp)[None, :]
+        else:
+            first = (left // width).astype(np.intp) - self.first_column
+            last = (right // width).astype(np.intp) - self.first_column
+            # Colunas repetidas ou trazidas para dentro da tabela só acrescentam candidatas, que o teste descarta
+            columns = first[:, None] + np.arange((last - first).max() + 1)
+            np.minimum(columns, last[:, None], out=columns)
+            np.minimum(columns, len(self.column_indices) - 1, out=columns)
+            np.maximum(columns, 0, out=columns)
+            candidates = self.column_indices[columns].reshape(len(left), -1)
+        box_left, box_top, box_right, box_bottom = (edge[candidates] for edge in self.padded_edges)
+        hits = (
+            (left[:, None] < box_right)
+            & (box_left < right[:, None])
+            & (top[:, None] < box_bottom)
+            & (box_top < bottom[:, None])
+        )
+        if support:
+            mid_x = (left + (right - left) // 2)[:, None]
+            hits |= (bottom[:, None] == box_top) & (box_left <= mid_x) & (mid_x < box_right)
+        return candidates, hits
+
+    def first_colliding_many(self, left, top, right, bottom):
+        """Para cada retângulo (arrays inteiros), índice da primeira plataforma tocada ou -1."""
+        if not len(left):
+            return np.full(0, -1, dtype=np.intp)
+        candidates, hits = self._batch_hits(left, top, right, bottom)
+        first = np.where(hits, candidates, len(self.rects)).min(axis=1, initial=len(self.rects))
+        return np.where(first < len(self.rects), first, -1)
+
+    def support_many(self, left, top, right, bottom):
+        """Versão vetorizada de support() para vários retângulos (arrays inteiros)."""
+        if not len(left):
+            return np.full(0, -1, dtype=np.intp)
+        candidates, hits = self._batch_hits(left, top, right, bottom, support=True)
+        return np.where(hits, candidates, -1).max(axis=1, initial=-1)
@@ -0,0 +1,110 @@
+from time import perf_counter
+
+
+class FrameTimer:
+    """Mede quanto tempo cada fase do frame consome (cronômetro de voltas)."""
+
+    def __init__(self):
+        self.totals = {}
+        self.last = perf_counter()
+
+    def begin(self):
+        """Marca o início de um frame sem atribuir o tempo anterior a nenhuma fase."""
+        self.last = perf_counter()
+
+    def lap(self, phase):
+        """Atribui a `phase` o tempo decorrido desde a última marca."""
+        now = perf_counter()
+        self.totals[phase] = self.totals.get(phase, 0.0) + (now - self.last)
+        self.last = now
+
+    def collect(self):
+        """Retorna {fase: segundos} acumulados e zera os contadores."""
+        totals, self.totals = self.totals, {}
+        return totals
+
+
+class NullTimer:
+    """Timer que não mede nada; usado quando nenhum perfil está ativo."""
+
+    def begin(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def collect(self):
+        return {}
+
+
+NULL_TIMER = NullTimer()
+
+
+class BudgetLadder:
+    """Degrau atual de uma escada de opções, cada uma com seu orçamento de segundos por frame.
+
+    Junta `window` amostras do trabalho por frame (sem contar a espera do clock):
+    se a média passa de `high` do orçamento do degrau atual, desce para o
+    próximo; se cabe com folga (`low`) no orçamento do degrau acima, sobe.
+    Um degrau estável mais baixo é melhor que oscilar.
+    """
+
+    def __init__(self, budgets, window=60, high=0.9, low=0.6):
+        self.budgets = tuple(budgets)
+        self.window = window
+        self.high = high
+        self.low = low
+        self.level = 0
+        self.samples = []
+
+    def update(self, work_seconds):
+        """Registra o trabalho de um frame e retorna o degrau para os próximos."""
+        self.samples.append(work_seconds)
+        if len(self.samples) < self.window:
+            return self.level
+        average = sum(self.samples) / len(self.samples)
+        self.samples.clear()
+        if average > self.high * self.budgets[self.level] and self.level < len(self.budgets) - 1:
+            self.level += 1
+        elif self.level > 0 and average < self.low * self.budgets[self.level - 1]:
+            self.level -= 1
+        return self.level
+
+
+class AdaptiveFrameRate:
+    """Escolhe a taxa de desenho entre `rates` conforme o custo real dos frames.
+
+    O orçamento de cada taxa é a duração do seu frame: sobra CPU (e bateria)
+    quando o jogo está leve, e uma taxa menor mas estável quando pesa.
+    """
+
+    def __init__(self, rates=(60, 45, 30), window=60, high=0.9, low=0.6):
+        self.rates = tuple(sorted(rates, reverse=True))
+        self.ladder = BudgetLadder([1.0 / rate for rate in self.rates], window, high, low)
+
+    @property
+    def fps(self):
+        return self.rates[self.ladder.level]
+
+    def update(self, work_seconds):
+        """Registra o trabalho de um frame e retorna a taxa alvo para o próximo."""
+        return self.rates[self.ladder.update(work_seconds)]
+
+
+class DynamicResolution:
+    """Escolhe a escala da apresentação (LogicalCanvas.scale) entre `scales` para manter os frames em `budget` segundos.
+
+    Só reduz o custo da escala suave para a janela, não o do desenho do mundo.
+    """
+
+    def __init__(self, scales=(1.0, 0.5, 0.25), budget=1 / 60, window=60, high=0.9, low=0.6):
+        self.scales = tuple(sorted(scales, reverse=True))
+        self.ladder = BudgetLadder([budget] * len(self.scales), window, high, low)
+
+    @property
+    def scale(self):
+        return self.scales[self.ladder.level]
+
+    def update(self, work_seconds):
+        """Registra o trabalho de um frame e retorna a escala para os próximos."""
+        return self.scales[self.ladder.update(work_seconds)]
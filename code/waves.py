@@ -0,0 +1,81 @@
+"""Modo sobrevivência: ondas de zumbis cada vez maiores e mais rápidas.
+
+O diretor não guarda estado: a onda, o momento de cada leva e as posições
+sorteadas saem só do tick da partida. Assim snapshots, checkpoints e replays
+continuam valendo sem nenhum campo novo.
+"""
+import numpy as np
+from enemy import ZOMBIE_HITBOX_WIDTH, ZOMBIE_HITBOX_HEIGHT, ZOMBIE_HITBOX_OFFSET_X
+
+WAVE_DURATION = 30.0  # Segundos de spawns em cada onda; o total da onda se espalha por eles
+WAVE_BREAK = 8.0  # Pausa antes da próxima onda
+MIN_INTERVAL = 0.15  # Segundos mínimos entre levas
+FIRST_QUOTA = 10  # Zumbis da primeira onda
+QUOTA_GROWTH = 8  # Zumbis a mais por onda
+# Teto da horda: o que passar dele numa leva é descartado, não adiado (o diretor não guarda estado)
+MAX_ALIVE = 400
+SPAWN_DISTANCE = 300  # Os zumbis surgem até esta distância além da borda da tela
+RESERVE = 512  # Zumbis preparados no início: spawns de ondas tardias não constroem nada
+SEED = 7
+
+
+class WaveDirector:
+    """Decide, a cada tick, se uma leva de zumbis entra e onde."""
+
+    def __init__(self, tick_rate, first_wave=1, seed=SEED):
+        self.tick_rate = tick_rate
+        self.first_wave = first_wave
+        self.seed = seed
+        self.wave_ticks = round((WAVE_DURATION + WAVE_BREAK) * tick_rate)
+        self.active_ticks = round(WAVE_DURATION * tick_rate)
+
+    def wave(self, tick):
+        """Número da onda em andamento no tick."""
+        return self.first_wave + tick // self.wave_ticks
+
+    def plan(self, wave):
+        """(ticks entre levas, zumbis por leva, total da onda): o ritmo cresce com o total."""
+        group = 1 + (wave - 1) // 2
+        quota = FIRST_QUOTA + QUOTA_GROWTH * (wave - 1)
+        batches = -(-quota // group)
+        interval = max(round(MIN_INTERVAL * self.tick_rate), self.active_ticks // batches, 1)
+        return interval, group, quota
+
+    def spawns(self, tick):
+        """Quantos zumbis entram neste tick (0 fora dos ticks de leva ou com a onda completa)."""
+        offset = tick % self.wave_ticks
+        if offset >= self.active_ticks:
+            return 0
+        interval, group, quota = self.plan(self.wave(tick))
+        if offset % interval:
+            return 0
+        return max(0, min(group, quota - offset // interval * group))
+
+    def update(self, game):
+        """Faz entrar a leva deste tick (se houver) em plataformas logo fora da tela."""
+        count = self.spawns(game.tick)
+        enemies = game.enemies
+        count = min(count, MAX_ALIVE - len(enemies))  # O excedente da leva se perde
+        if count <= 0:
+            return
+        rng = np.random.default_rng((self.seed, game.tick))
+        view_left, view_right = game.view_span()
+        platforms = game.platforms
+        sides = [(view_left - SPAWN_DISTANCE, view_left), (view_right, view_right + SPAWN_DISTANCE)]
+        if rng.random() < 0.5:
+            sides.reverse()
+        for left, right in sides:
+            bounds = platforms.bounds(left, right)
+            # Trecho de cada plataforma dentro da faixa que cabe a hitbox inteira
+            low = np.maximum(bounds[:, 0], left) - ZOMBIE_HITBOX_OFFSET_X
+            high = np.minimum(bounds[:, 2], right) - ZOMBIE_HITBOX_OFFSET_X - ZOMBIE_HITBOX_WIDTH
+            usable = np.flatnonzero(high > low)
+            if usable.size:
+                break
+        else:
+            return
+        chosen = usable[rng.integers(0, usable.size, count)]
+        xs = rng.uniform(low[chosen], high[chosen])
+        ys = bounds[chosen, 1] - ZOMBIE_HITBOX_HEIGHT - enemies.hitbox_offset_y
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            enemies.spawn(x, y)
@@ -5,7 +5,13 @@ a = Analysis(
     ['code/main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    # assets/sprites.pak é gerado por "python code/build_assets.py" (rode antes do PyInstaller);
+    # as sheets do personagem e dos zumbis vêm dele, então os PNGs delas não são incluídos
+    datas=[
+        ('assets/sprites.pak', 'assets'),
+        ('assets/background', 'assets/background'),
+        ('levels', 'levels'),
+    ],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},